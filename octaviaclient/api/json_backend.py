@@ -0,0 +1,86 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""Optional faster JSON backends
+
+orjson is used when installed, the standard library otherwise. ujson can be
+selected, but decodes Octavia listings no faster than the standard library
+(see tools/benchmarks/json_backends.py). The backends decode to the same
+types as the standard library, except for integers larger than 64 bits,
+which orjson decodes as floats. The counters and sizes of the Octavia API
+are 64 bit integers at most.
+
+The backends are only imported on the first decode, the clients are built
+by CLI commands which may not send any request.
+"""
+import importlib
+from importlib import util as importlib_util
+import json
+
+import requests
+
+# Backends by order of preference
+BACKENDS = ('orjson', 'json', 'ujson')
+
+# Decoding functions of the backends imported so far
+_LOADS = {'json': json.loads}
+
+
+def available():
+    """Returns the names of the installed backends, preferred first"""
+    return [name for name in BACKENDS
+            if name in _LOADS or importlib_util.find_spec(name) is not None]
+
+
+def _import_loads(name):
+    if name not in _LOADS:
+        _LOADS[name] = importlib.import_module(name).loads
+    return _LOADS[name]
+
+
+def get_loads(name=None):
+    """Returns the decoding function of a backend
+
+    :param string name:
+        The name of the backend, the preferred one installed if not set
+    :return:
+        A function decoding a JSON document from ``bytes`` or ``str``
+    """
+    installed = available()
+    name = name or installed[0]
+    if name not in installed:
+        msg = 'JSON backend {} is not available, installed: {}'.format(
+            name, ', '.join(installed))
+        raise ValueError(msg)
+    if name in _LOADS:
+        return _LOADS[name]
+
+    def loads(doc):
+        return _import_loads(name)(doc)
+    return loads
+
+
+def response_decoder(response, loads):
+    """Returns a replacement for the ``json`` method of a response
+
+    The body is decoded with ``loads``. Bodies the backend rejects, like
+    empty or non UTF-8 ones, are handed to requests, which raises its usual
+    errors.
+    """
+    def decode(**kwargs):
+        if not kwargs:
+            try:
+                return loads(response.content)
+            except ValueError:
+                pass
+        return requests.Response.json(response, **kwargs)
+    return decode
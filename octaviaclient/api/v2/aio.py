@@ -0,0 +1,960 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""Asyncio Octavia API Library
+
+Requires the ``aiohttp`` library, installed with the ``async`` extra of
+python-octaviaclient.
+"""
+import asyncio
+import collections
+
+import aiohttp
+from keystoneauth1 import exceptions as ksa_exceptions
+from osc_lib import exceptions as osc_exc
+import requests
+from requests import adapters
+from requests import structures
+
+from octaviaclient.api import constants as const
+from octaviaclient.api import exceptions
+from octaviaclient.api import json_backend as jsonb
+from octaviaclient.api.v2 import octavia
+
+correct_return_codes = octavia.correct_return_codes
+
+
+def _encode_params(params):
+    """Returns query parameters as a list of pairs, lists being repeated"""
+    if not params:
+        return None
+    pairs = []
+    for key, value in params.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        pairs.extend((key, str(v)) for v in values)
+    return pairs
+
+
+def _decode(response):
+    """Returns the decoded JSON body, or the response if there is none"""
+    try:
+        return response.json()
+    except requests.JSONDecodeError:
+        return response
+
+
+class AsyncOctaviaAPI(object):
+    """Asyncio Octavia API
+
+    The methods are coroutines taking the same arguments and returning the
+    same values as the ones of :class:`octaviaclient.api.v2.octavia.
+    OctaviaAPI`, and the ``iter_*`` methods are asynchronous generators.
+    Errors are mapped to the same exceptions. ``map`` runs its calls on the
+    event loop rather than on a thread pool.
+
+    Requests are sent with aiohttp, authenticated with the token of a
+    keystoneauth session. The token and the endpoint are fetched once, and
+    again when the API rejects the token.
+
+    :param session:
+        The keystoneauth1 session holding the authentication
+    :param string endpoint:
+        The load-balancer service endpoint, looked up in the service catalog
+        of the session if not set
+    :param string service_type:
+        The service type used to look up the endpoint
+    :param string interface:
+        The endpoint interface used to look up the endpoint
+    :param string region_name:
+        The region used to look up the endpoint
+    :param http_session:
+        The aiohttp.ClientSession to send the requests with, a session
+        owned by the client is created if not set
+    :param string json_backend:
+        The library decoding the responses, ``orjson``, ``ujson`` or
+        ``json``. orjson is used by default when installed.
+    """
+
+    _endpoint_suffix = '/v2.0'
+
+    JSON_HEADER = octavia.OctaviaAPI.JSON_HEADER
+
+    def __init__(self, session, endpoint=None, *,
+                 service_type='load-balancer', interface=None,
+                 region_name=None, http_session=None, json_backend=None):
+        self.session = session
+        self.service_type = service_type
+        self.interface = interface
+        self.region_name = region_name
+        self._endpoint = endpoint
+        self._auth = None
+        self._auth_lock = None
+        self._http_session = http_session
+        self._owns_http_session = http_session is None
+        self._json_loads = jsonb.get_loads(json_backend)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """Closes the HTTP session if it is owned by the client"""
+        if self._owns_http_session and self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
+    def _load_auth(self):
+        # Runs on a worker thread, keystoneauth may block on the network
+        headers = dict(self.session.get_auth_headers() or {})
+        headers.update(self.JSON_HEADER)
+        endpoint = self._endpoint or self.session.get_endpoint(
+            service_type=self.service_type, interface=self.interface,
+            region_name=self.region_name)
+        endpoint = endpoint.rstrip('/')
+        if not endpoint.endswith(self._endpoint_suffix):
+            endpoint += self._endpoint_suffix
+        return headers, endpoint
+
+    async def _get_auth(self, refresh=False):
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            if refresh:
+                await asyncio.to_thread(self.session.invalidate)
+                self._auth = None
+            if self._auth is None:
+                self._auth = await asyncio.to_thread(self._load_auth)
+            return self._auth
+
+    async def _request(self, method, url, params=None, json=None,
+                       retry_auth=True):
+        headers, endpoint = await self._get_auth()
+        full_url = '/'.join([endpoint, url.lstrip('/')])
+        if self._http_session is None:
+            self._http_session = aiohttp.ClientSession()
+
+        async with self._http_session.request(
+                method, full_url, params=_encode_params(params), json=json,
+                headers=headers) as resp:
+            response = requests.Response()
+            response.status_code = resp.status
+            response.reason = resp.reason
+            response.headers = structures.CaseInsensitiveDict(resp.headers)
+            response.encoding = resp.charset
+            response.url = str(resp.url)
+            response._content = await resp.read()
+        response.json = jsonb.response_decoder(response, self._json_loads)
+
+        if response.status_code == 401 and retry_auth:
+            await self._get_auth(refresh=True)
+            return await self._request(method, url, params=params, json=json,
+                                       retry_auth=False)
+        if response.status_code >= 400:
+            raise ksa_exceptions.from_response(response, method, full_url)
+        return response
+
+    async def _list(self, path, **params):
+        if params.pop('get_all', False):
+            resource_key = params.pop('resources')
+            return {resource_key: [
+                item async for item in self._iter(path, resource_key,
+                                                  **params)]}
+        return _decode(await self._request('GET', path, params=params))
+
+    async def _pages(self, path, resource_key, params):
+        while True:
+            response = (await self._request('GET', path,
+                                            params=params)).json()
+            yield response[resource_key]
+
+            params = octavia.OctaviaAPI._next_page_params(
+                response, resource_key, params)
+            if params is None:
+                return
+
+    async def _iter(self, path, resource_key, limit=None, **params):
+        if limit is not None:
+            params['limit'] = limit
+        remaining = limit
+        pages = self._pages(path, resource_key, params)
+        try:
+            async for page in pages:
+                if remaining is not None:
+                    page = page[:remaining]
+                    remaining -= len(page)
+                for item in page:
+                    yield item
+                if remaining == 0:
+                    # No more pages are requested once the limit is met
+                    return
+        finally:
+            await pages.aclose()
+
+    async def _count(self, path, resource_key, key='id', group_by=None,
+                     **params):
+        """Count the items of a collection, see OctaviaAPI._count"""
+        params.pop('limit', None)
+        params.pop('sort', None)
+        params['fields'] = [group_by or key]
+        params['limit'] = octavia.COUNT_PAGE_SIZE
+        total = 0
+        counts = collections.Counter()
+        async for page in self._pages(path, resource_key, params):
+            total += len(page)
+            if group_by is not None:
+                counts.update(item.get(group_by) for item in page)
+        return total if group_by is None else dict(counts)
+
+    async def map(self, method, iterable, max_workers=None,
+                  fail_fast=False):
+        """Call an API method once per item, concurrently
+
+        The calls run as coroutines on the event loop, see
+        :meth:`octaviaclient.api.v2.octavia.OctaviaAPI.map` for the
+        arguments and the results. ``max_workers`` is the size of the
+        connection pool of the synchronous client by default.
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+        if max_workers is None:
+            max_workers = adapters.DEFAULT_POOLSIZE
+        if max_workers < 1:
+            msg = 'max_workers must be a positive integer'
+            raise ValueError(msg)
+
+        # Authenticate once instead of letting every call race for it
+        await self._get_auth()
+        semaphore = asyncio.Semaphore(max_workers)
+        failures = []
+
+        async def call(item):
+            args = item if isinstance(item, tuple) else (item,)
+            async with semaphore:
+                if failures:
+                    # Start no other call once one failed with fail_fast
+                    return None
+                try:
+                    return await method(*args)
+                except (exceptions.OctaviaClientException,
+                        osc_exc.ClientException) as e:
+                    if fail_fast:
+                        failures.append(e)
+                    return e
+
+        results = await asyncio.gather(*[call(item) for item in iterable])
+        if failures:
+            raise failures[0]
+        return results
+
+    async def _find(self, path, value, fields=None):
+        params = {'fields': fields} if fields else None
+        try:
+            response = await self._request(
+                'GET', '{}/{}'.format(path, value), params=params)
+        except (ksa_exceptions.NotFound, ksa_exceptions.BadRequest) as e:
+            raise osc_exc.NotFound(404, "{} not found".format(value)) from e
+        ret = response.json()
+        if isinstance(ret, dict) and len(ret) == 1:
+            # strip off the enclosing dict
+            ret = next(iter(ret.values()))
+        return ret
+
+    async def _create(self, url, method='POST', params=None, json=None):
+        return _decode(await self._request(method, url, params=params,
+                                           json=json))
+
+    async def _delete(self, url, params=None):
+        return await self._request('DELETE', url, params=params)
+
+    async def _collect(self, resource_key, items):
+        return {resource_key: [item async for item in items]}
+
+    # Load balancers
+
+    @correct_return_codes
+    async def iter_load_balancers(self, **params):
+        """Iterate over all load balancers page by page"""
+        async for item in self._iter(const.BASE_LOADBALANCER_URL,
+                                     const.LOADBALANCER_RESOURCES, **params):
+            yield item
+
+    @correct_return_codes
+    async def count_load_balancers(self, group_by=None, **params):
+        """Count the load balancers, without listing them"""
+        url = const.BASE_LOADBALANCER_URL
+        return await self._count(
+            url, const.LOADBALANCER_RESOURCES, group_by=group_by, **params)
+
+    @correct_return_codes
+    async def load_balancer_list(self, **params):
+        """List all load balancers"""
+        return await self._collect(const.LOADBALANCER_RESOURCES,
+                                   self.iter_load_balancers(**params))
+
+    @correct_return_codes
+    async def load_balancer_show(self, lb_id, fields=None):
+        """Show a load balancer"""
+        return await self._find(const.BASE_LOADBALANCER_URL, lb_id,
+                                fields=fields)
+
+    @correct_return_codes
+    async def load_balancer_create(self, **params):
+        """Create a load balancer"""
+        return await self._create(const.BASE_LOADBALANCER_URL, **params)
+
+    @correct_return_codes
+    async def load_balancer_delete(self, lb_id, **params):
+        """Delete a load balancer"""
+        url = const.BASE_SINGLE_LB_URL.format(uuid=lb_id)
+        return await self._delete(url, params=params)
+
+    @correct_return_codes
+    async def load_balancer_set(self, lb_id, **params):
+        """Update a load balancer's settings"""
+        url = const.BASE_SINGLE_LB_URL.format(uuid=lb_id)
+        return await self._create(url, method='PUT', **params)
+
+    @correct_return_codes
+    async def load_balancer_stats_show(self, lb_id, **kwargs):
+        """Shows the current statistics for a load balancer"""
+        url = const.BASE_LB_STATS_URL.format(uuid=lb_id)
+        return await self._list(url, **kwargs)
+
+    @correct_return_codes
+    async def load_balancer_status_show(self, lb_id, **kwargs):
+        """Display load balancer status tree"""
+        url = const.BASE_LOADBALANCER_STATUS_URL.format(uuid=lb_id)
+        return await self._list(url, **kwargs)
+
+    @correct_return_codes
+    async def load_balancer_failover(self, lb_id):
+        """Trigger load balancer failover"""
+        url = const.BASE_LOADBALANCER_FAILOVER_URL.format(uuid=lb_id)
+        return await self._create(url, method='PUT')
+
+    # Listeners
+
+    @correct_return_codes
+    async def iter_listeners(self, **kwargs):
+        """Iterate over all listeners page by page"""
+        async for item in self._iter(const.BASE_LISTENER_URL,
+                                     const.LISTENER_RESOURCES, **kwargs):
+            yield item
+
+    @correct_return_codes
+    async def count_listeners(self, group_by=None, **params):
+        """Count the listeners, without listing them"""
+        url = const.BASE_LISTENER_URL
+        return await self._count(
+            url, const.LISTENER_RESOURCES, group_by=group_by, **params)
+
+    @correct_return_codes
+    async def listener_list(self, **kwargs):
+        """List all listeners"""
+        return await self._collect(const.LISTENER_RESOURCES,
+                                   self.iter_listeners(**kwargs))
+
+    @correct_return_codes
+    async def listener_show(self, listener_id, fields=None):
+        """Show a listener"""
+        return await self._find(const.BASE_LISTENER_URL, listener_id,
+                                fields=fields)
+
+    @correct_return_codes
+    async def listener_create(self, **kwargs):
+        """Create a listener"""
+        return await self._create(const.BASE_LISTENER_URL, **kwargs)
+
+    @correct_return_codes
+    async def listener_delete(self, listener_id):
+        """Delete a listener"""
+        url = const.BASE_SINGLE_LISTENER_URL.format(uuid=listener_id)
+        return await self._delete(url)
+
+    @correct_return_codes
+    async def listener_set(self, listener_id, **kwargs):
+        """Update a listener's settings"""
+        url = const.BASE_SINGLE_LISTENER_URL.format(uuid=listener_id)
+        return await self._create(url, method='PUT', **kwargs)
+
+    @correct_return_codes
+    async def listener_stats_show(self, listener_id, **kwargs):
+        """Shows the current statistics for a listener"""
+        url = const.BASE_LISTENER_STATS_URL.format(uuid=listener_id)
+        return await self._list(url, **kwargs)
+
+    # Pools
+
+    @correct_return_codes
+    async def iter_pools(self, **kwargs):
+        """Iterate over all pools page by page"""
+        async for item in self._iter(const.BASE_POOL_URL,
+                                     const.POOL_RESOURCES, **kwargs):
+            yield item
+
+    @correct_return_codes
+    async def count_pools(self, group_by=None, **params):
+        """Count the pools, without listing them"""
+        url = const.BASE_POOL_URL
+        return await self._count(
+            url, const.POOL_RESOURCES, group_by=group_by, **params)
+
+    @correct_return_codes
+    async def pool_list(self, **kwargs):
+        """List all pools"""
+        return await self._collect(const.POOL_RESOURCES,
+                                   self.iter_pools(**kwargs))
+
+    @correct_return_codes
+    async def pool_create(self, **kwargs):
+        """Create a pool"""
+        return await self._create(const.BASE_POOL_URL, **kwargs)
+
+    @correct_return_codes
+    async def pool_delete(self, pool_id):
+        """Delete a pool"""
+        url = const.BASE_SINGLE_POOL_URL.format(pool_id=pool_id)
+        return await self._delete(url)
+
+    @correct_return_codes
+    async def pool_show(self, pool_id, fields=None):
+        """Show a pool's settings"""
+        return await self._find(const.BASE_POOL_URL, pool_id, fields=fields)
+
+    @correct_return_codes
+    async def pool_set(self, pool_id, **kwargs):
+        """Update a pool's settings"""
+        url = const.BASE_SINGLE_POOL_URL.format(pool_id=pool_id)
+        return await self._create(url, method='PUT', **kwargs)
+
+    # Members
+
+    @correct_return_codes
+    async def iter_members(self, pool_id, **kwargs):
+        """Iterate over all members of a pool page by page"""
+        url = const.BASE_MEMBER_URL.format(pool_id=pool_id)
+        async for item in self._iter(url, const.MEMBER_RESOURCES, **kwargs):
+            yield item
+
+    @correct_return_codes
+    async def count_members(self, pool_id, group_by=None, **params):
+        """Count the members of a pool, without listing them"""
+        url = const.BASE_MEMBER_URL.format(pool_id=pool_id)
+        return await self._count(
+            url, const.MEMBER_RESOURCES, group_by=group_by, **params)
+
+    @correct_return_codes
+    async def member_list(self, pool_id, **kwargs):
+        """Lists the member from a given pool id"""
+        return await self._collect(const.MEMBER_RESOURCES,
+                                   self.iter_members(pool_id, **kwargs))
+
+    @correct_return_codes
+    async def member_show(self, pool_id, member_id, fields=None):
+        """Showing a member details of a pool"""
+        url = const.BASE_MEMBER_URL.format(pool_id=pool_id)
+        return await self._find(url, member_id, fields=fields)
+
+    @correct_return_codes
+    async def member_create(self, pool_id, **kwargs):
+        """Creating a member for the given pool id"""
+        url = const.BASE_MEMBER_URL.format(pool_id=pool_id)
+        return await self._create(url, **kwargs)
+
+    @correct_return_codes
+    async def member_delete(self, pool_id, member_id):
+        """Removing a member from a pool and mark that member as deleted"""
+        url = const.BASE_SINGLE_MEMBER_URL.format(pool_id=pool_id,
+                                                  member_id=member_id)
+        return await self._delete(url)
+
+    @correct_return_codes
+    async def member_set(self, pool_id, member_id, **kwargs):
+        """Updating a member's settings"""
+        url = const.BASE_SINGLE_MEMBER_URL.format(pool_id=pool_id,
+                                                  member_id=member_id)
+        return await self._create(url, method='PUT', **kwargs)
+
+    @correct_return_codes
+    async def member_batch_update(self, pool_id, members,
+                                  additive_only=False):
+        """Replace the members of a pool in a single request"""
+        url = const.BASE_MEMBER_URL.format(pool_id=pool_id)
+        params = {'additive_only': True} if additive_only else None
+        return await self._create(url, method='PUT', params=params,
+                                  json={'members': members})
+
+    # L7 policies
+
+    @correct_return_codes
+    async def iter_l7policies(self, **kwargs):
+        """Iterate over all L7 policies page by page"""
+        async for item in self._iter(const.BASE_L7POLICY_URL,
+                                     const.L7POLICY_RESOURCES, **kwargs):
+            yield item
+
+    @correct_return_codes
+    async def count_l7policies(self, group_by=None, **params):
+        """Count the l7policies, without listing them"""
+        url = const.BASE_L7POLICY_URL
+        return await self._count(
+            url, const.L7POLICY_RESOURCES, group_by=group_by, **params)
+
+    @correct_return_codes
+    async def l7policy_list(self, **kwargs):
+        """List all l7policies"""
+        return await self._collect(const.L7POLICY_RESOURCES,
+                                   self.iter_l7policies(**kwargs))
+
+    @correct_return_codes
+    async def l7policy_create(self, **kwargs):
+        """Create a l7policy"""
+        return await self._create(const.BASE_L7POLICY_URL, **kwargs)
+
+    @correct_return_codes
+    async def l7policy_delete(self, l7policy_id):
+        """Delete a l7policy"""
+        url = const.BASE_SINGLE_L7POLICY_URL.format(policy_uuid=l7policy_id)
+        return await self._delete(url)
+
+    @correct_return_codes
+    async def l7policy_show(self, l7policy_id, fields=None):
+        """Show a l7policy's settings"""
+        return await self._find(const.BASE_L7POLICY_URL, l7policy_id,
+                                fields=fields)
+
+    @correct_return_codes
+    async def l7policy_set(self, l7policy_id, **kwargs):
+        """Update a l7policy's settings"""
+        url = const.BASE_SINGLE_L7POLICY_URL.format(policy_uuid=l7policy_id)
+        return await self._create(url, method='PUT', **kwargs)
+
+    # L7 rules
+
+    @correct_return_codes
+    async def iter_l7rules(self, l7policy_id, **kwargs):
+        """Iterate over all rules of a L7 policy page by page"""
+        url = const.BASE_L7RULE_URL.format(policy_uuid=l7policy_id)
+        async for item in self._iter(url, const.L7RULE_RESOURCES, **kwargs):
+            yield item
+
+    @correct_return_codes
+    async def count_l7rules(self, l7policy_id, group_by=None, **params):
+        """Count the rules of a l7policy, without listing them"""
+        url = const.BASE_L7RULE_URL.format(policy_uuid=l7policy_id)
+        return await self._count(
+            url, const.L7RULE_RESOURCES, group_by=group_by, **params)
+
+    @correct_return_codes
+    async def l7rule_list(self, l7policy_id, **kwargs):
+        """List all l7rules for a l7policy"""
+        return await self._collect(const.L7RULE_RESOURCES,
+                                   self.iter_l7rules(l7policy_id, **kwargs))
+
+    @correct_return_codes
+    async def l7rule_create(self, l7policy_id, **kwargs):
+        """Create a l7rule"""
+        url = const.BASE_L7RULE_URL.format(policy_uuid=l7policy_id)
+        return await self._create(url, **kwargs)
+
+    @correct_return_codes
+    async def l7rule_delete(self, l7rule_id, l7policy_id):
+        """Delete a l7rule"""
+        url = const.BASE_SINGLE_L7RULE_URL.format(rule_uuid=l7rule_id,
+                                                  policy_uuid=l7policy_id)
+        return await self._delete(url)
+
+    @correct_return_codes
+    async def l7rule_show(self, l7rule_id, l7policy_id, fields=None):
+        """Show a l7rule's settings"""
+        url = const.BASE_L7RULE_URL.format(policy_uuid=l7policy_id)
+        return await self._find(url, l7rule_id, fields=fields)
+
+    @correct_return_codes
+    async def l7rule_set(self, l7rule_id, l7policy_id, **kwargs):
+        """Update a l7rule's settings"""
+        url = const.BASE_SINGLE_L7RULE_URL.format(rule_uuid=l7rule_id,
+                                                  policy_uuid=l7policy_id)
+        return await self._create(url, method='PUT', **kwargs)
+
+    # Health monitors
+
+    @correct_return_codes
+    async def iter_health_monitors(self, **kwargs):
+        """Iterate over all health monitors page by page"""
+        async for item in self._iter(const.BASE_HEALTH_MONITOR_URL,
+                                     const.HEALTH_MONITOR_RESOURCES,
+                                     **kwargs):
+            yield item
+
+    @correct_return_codes
+    async def count_health_monitors(self, group_by=None, **params):
+        """Count the health monitors, without listing them"""
+        url = const.BASE_HEALTH_MONITOR_URL
+        return await self._count(
+            url, const.HEALTH_MONITOR_RESOURCES, group_by=group_by, **params)
+
+    @correct_return_codes
+    async def health_monitor_list(self, **kwargs):
+        """List all health monitors"""
+        return await self._collect(const.HEALTH_MONITOR_RESOURCES,
+                                   self.iter_health_monitors(**kwargs))
+
+    @correct_return_codes
+    async def health_monitor_create(self, **kwargs):
+        """Create a health monitor"""
+        return await self._create(const.BASE_HEALTH_MONITOR_URL, **kwargs)
+
+    @correct_return_codes
+    async def health_monitor_delete(self, health_monitor_id):
+        """Delete a health_monitor"""
+        url = const.BASE_SINGLE_HEALTH_MONITOR_URL.format(
+            uuid=health_monitor_id)
+        return await self._delete(url)
+
+    @correct_return_codes
+    async def health_monitor_show(self, health_monitor_id, fields=None):
+        """Show a health monitor's settings"""
+        return await self._find(const.BASE_HEALTH_MONITOR_URL,
+                                health_monitor_id, fields=fields)
+
+    @correct_return_codes
+    async def health_monitor_set(self, health_monitor_id, **kwargs):
+        """Update a health monitor's settings"""
+        url = const.BASE_SINGLE_HEALTH_MONITOR_URL.format(
+            uuid=health_monitor_id)
+        return await self._create(url, method='PUT', **kwargs)
+
+    # Quotas
+
+    @correct_return_codes
+    async def iter_quotas(self, **params):
+        """Iterate over all quotas page by page"""
+        async for item in self._iter(const.BASE_QUOTA_URL,
+                                     const.QUOTA_RESOURCES, **params):
+            yield item
+
+    @correct_return_codes
+    async def count_quotas(self, group_by=None, **params):
+        """Count the quotas, without listing them"""
+        url = const.BASE_QUOTA_URL
+        return await self._count(
+            url, const.QUOTA_RESOURCES, key='project_id', group_by=group_by,
+            **params)
+
+    @correct_return_codes
+    async def quota_list(self, **params):
+        """List all quotas"""
+        return await self._collect(const.QUOTA_RESOURCES,
+                                   self.iter_quotas(**params))
+
+    @correct_return_codes
+    async def quota_show(self, project_id):
+        """Show a quota"""
+        return await self._find(const.BASE_QUOTA_URL, project_id)
+
+    @correct_return_codes
+    async def quota_reset(self, project_id):
+        """Reset a quota"""
+        url = const.BASE_SINGLE_QUOTA_URL.format(uuid=project_id)
+        return await self._delete(url)
+
+    @correct_return_codes
+    async def quota_set(self, project_id, **params):
+        """Update a quota's settings"""
+        url = const.BASE_SINGLE_QUOTA_URL.format(uuid=project_id)
+        return await self._create(url, method='PUT', **params)
+
+    @correct_return_codes
+    async def quota_defaults_show(self):
+        """Show quota defaults"""
+        return await self._list(const.BASE_QUOTA_DEFAULT_URL)
+
+    # Amphorae
+
+    @correct_return_codes
+    async def amphora_show(self, amphora_id, fields=None):
+        """Show an amphora"""
+        return await self._find(const.BASE_AMPHORA_URL, amphora_id,
+                                fields=fields)
+
+    @correct_return_codes
+    async def iter_amphorae(self, **kwargs):
+        """Iterate over all amphorae page by page"""
+        async for item in self._iter(const.BASE_AMPHORA_URL,
+                                     const.AMPHORA_RESOURCES, **kwargs):
+            yield item
+
+    @correct_return_codes
+    async def count_amphorae(self, group_by=None, **params):
+        """Count the amphorae, without listing them"""
+        url = const.BASE_AMPHORA_URL
+        return await self._count(
+            url, const.AMPHORA_RESOURCES, group_by=group_by, **params)
+
+    @correct_return_codes
+    async def amphora_list(self, **kwargs):
+        """List all amphorae"""
+        return await self._collect(const.AMPHORA_RESOURCES,
+                                   self.iter_amphorae(**kwargs))
+
+    @correct_return_codes
+    async def amphora_configure(self, amphora_id):
+        """Update the amphora agent configuration"""
+        url = const.BASE_AMPHORA_CONFIGURE_URL.format(uuid=amphora_id)
+        return await self._create(url, method='PUT')
+
+    @correct_return_codes
+    async def amphora_delete(self, amphora_id):
+        """Delete an amphora"""
+        url = const.BASE_SINGLE_AMPHORA_URL.format(uuid=amphora_id)
+        return await self._delete(url)
+
+    @correct_return_codes
+    async def amphora_failover(self, amphora_id):
+        """Force failover an amphorae"""
+        url = const.BASE_AMPHORA_FAILOVER_URL.format(uuid=amphora_id)
+        return await self._create(url, method='PUT')
+
+    @correct_return_codes
+    async def amphora_stats_show(self, amphora_id, **kwargs):
+        """Show the current statistics for an amphora"""
+        url = const.BASE_AMPHORA_STATS_URL.format(uuid=amphora_id)
+        return await self._list(url, **kwargs)
+
+    # Providers
+
+    @correct_return_codes
+    async def iter_providers(self, **kwargs):
+        """Iterate over all providers page by page"""
+        async for item in self._iter(const.BASE_PROVIDER_URL,
+                                     const.PROVIDER_RESOURCES, **kwargs):
+            yield item
+
+    @correct_return_codes
+    async def provider_list(self, **kwargs):
+        """List all providers"""
+        return await self._collect(const.PROVIDER_RESOURCES,
+                                   self.iter_providers(**kwargs))
+
+    @correct_return_codes
+    async def provider_flavor_capability_list(self, provider):
+        """Show the flavor capabilities of the specified provider"""
+        url = const.BASE_PROVIDER_FLAVOR_CAPABILITY_URL.format(
+            provider=provider)
+        return await self._list(
+            url, get_all=True,
+            resources=const.PROVIDER_FLAVOR_CAPABILITY_RESOURCES)
+
+    @correct_return_codes
+    async def provider_availability_zone_capability_list(self, provider):
+        """Show the availability zone capabilities of the provider"""
+        url = const.BASE_PROVIDER_AVAILABILITY_ZONE_CAPABILITY_URL.format(
+            provider=provider)
+        return await self._list(
+            url, get_all=True,
+            resources=const.PROVIDER_AVAILABILITY_ZONE_CAPABILITY_RESOURCES)
+
+    # Flavors
+
+    @correct_return_codes
+    async def iter_flavors(self, **kwargs):
+        """Iterate over all flavors page by page"""
+        async for item in self._iter(const.BASE_FLAVOR_URL,
+                                     const.FLAVOR_RESOURCES, **kwargs):
+            yield item
+
+    @correct_return_codes
+    async def count_flavors(self, group_by=None, **params):
+        """Count the flavors, without listing them"""
+        url = const.BASE_FLAVOR_URL
+        return await self._count(
+            url, const.FLAVOR_RESOURCES, group_by=group_by, **params)
+
+    @correct_return_codes
+    async def flavor_list(self, **kwargs):
+        """List all flavors"""
+        return await self._collect(const.FLAVOR_RESOURCES,
+                                   self.iter_flavors(**kwargs))
+
+    @correct_return_codes
+    async def flavor_delete(self, flavor_id):
+        """Delete a flavor"""
+        url = const.BASE_SINGLE_FLAVOR_URL.format(uuid=flavor_id)
+        return await self._delete(url)
+
+    @correct_return_codes
+    async def flavor_create(self, **kwargs):
+        """Create a flavor"""
+        return await self._create(const.BASE_FLAVOR_URL, **kwargs)
+
+    @correct_return_codes
+    async def flavor_set(self, flavor_id, **kwargs):
+        """Update a flavor's settings"""
+        url = const.BASE_SINGLE_FLAVOR_URL.format(uuid=flavor_id)
+        return await self._create(url, method='PUT', **kwargs)
+
+    @correct_return_codes
+    async def flavor_show(self, flavor_id, fields=None):
+        """Show a flavor"""
+        return await self._find(const.BASE_FLAVOR_URL, flavor_id,
+                                fields=fields)
+
+    # Flavor profiles
+
+    @correct_return_codes
+    async def flavorprofile_create(self, **kwargs):
+        """Create a flavor profile"""
+        return await self._create(const.BASE_FLAVORPROFILE_URL, **kwargs)
+
+    @correct_return_codes
+    async def iter_flavorprofiles(self, **kwargs):
+        """Iterate over all flavor profiles page by page"""
+        async for item in self._iter(const.BASE_FLAVORPROFILE_URL,
+                                     const.FLAVORPROFILE_RESOURCES, **kwargs):
+            yield item
+
+    @correct_return_codes
+    async def count_flavorprofiles(self, group_by=None, **params):
+        """Count the flavor profiles, without listing them"""
+        url = const.BASE_FLAVORPROFILE_URL
+        return await self._count(
+            url, const.FLAVORPROFILE_RESOURCES, group_by=group_by, **params)
+
+    @correct_return_codes
+    async def flavorprofile_list(self, **kwargs):
+        """List all flavor profiles"""
+        return await self._collect(const.FLAVORPROFILE_RESOURCES,
+                                   self.iter_flavorprofiles(**kwargs))
+
+    @correct_return_codes
+    async def flavorprofile_show(self, flavorprofile_id, fields=None):
+        """Show a flavor profile"""
+        return await self._find(const.BASE_FLAVORPROFILE_URL,
+                                flavorprofile_id, fields=fields)
+
+    @correct_return_codes
+    async def flavorprofile_set(self, flavorprofile_id, **kwargs):
+        """Update a flavor profile's settings"""
+        url = const.BASE_SINGLE_FLAVORPROFILE_URL.format(uuid=flavorprofile_id)
+        return await self._create(url, method='PUT', **kwargs)
+
+    @correct_return_codes
+    async def flavorprofile_delete(self, flavorprofile_id):
+        """Delete a flavor profile"""
+        url = const.BASE_SINGLE_FLAVORPROFILE_URL.format(uuid=flavorprofile_id)
+        return await self._delete(url)
+
+    # Availability zones
+
+    @correct_return_codes
+    async def iter_availabilityzones(self, **kwargs):
+        """Iterate over all availability zones page by page"""
+        async for item in self._iter(const.BASE_AVAILABILITYZONE_URL,
+                                     const.AVAILABILITYZONE_RESOURCES,
+                                     **kwargs):
+            yield item
+
+    @correct_return_codes
+    async def count_availabilityzones(self, group_by=None, **params):
+        """Count the availability zones, without listing them"""
+        url = const.BASE_AVAILABILITYZONE_URL
+        return await self._count(
+            url, const.AVAILABILITYZONE_RESOURCES, key='name',
+            group_by=group_by, **params)
+
+    @correct_return_codes
+    async def availabilityzone_list(self, **kwargs):
+        """List all availability zones"""
+        return await self._collect(const.AVAILABILITYZONE_RESOURCES,
+                                   self.iter_availabilityzones(**kwargs))
+
+    @correct_return_codes
+    async def availabilityzone_delete(self, availabilityzone_name):
+        """Delete an availability zone"""
+        url = const.BASE_SINGLE_AVAILABILITYZONE_URL.format(
+            name=availabilityzone_name)
+        return await self._delete(url)
+
+    @correct_return_codes
+    async def availabilityzone_create(self, **kwargs):
+        """Create an availability zone"""
+        return await self._create(const.BASE_AVAILABILITYZONE_URL, **kwargs)
+
+    @correct_return_codes
+    async def availabilityzone_set(self, availabilityzone_name, **kwargs):
+        """Update an availability zone's settings"""
+        url = const.BASE_SINGLE_AVAILABILITYZONE_URL.format(
+            name=availabilityzone_name)
+        return await self._create(url, method='PUT', **kwargs)
+
+    @correct_return_codes
+    async def availabilityzone_show(self, availabilityzone_name, fields=None):
+        """Show an availability zone"""
+        return await self._find(const.BASE_AVAILABILITYZONE_URL,
+                                availabilityzone_name, fields=fields)
+
+    # Availability zone profiles
+
+    @correct_return_codes
+    async def availabilityzoneprofile_create(self, **kwargs):
+        """Create an availability zone profile"""
+        return await self._create(const.BASE_AVAILABILITYZONEPROFILE_URL,
+                                  **kwargs)
+
+    @correct_return_codes
+    async def iter_availabilityzoneprofiles(self, **kwargs):
+        """Iterate over all availability zone profiles page by page"""
+        async for item in self._iter(
+                const.BASE_AVAILABILITYZONEPROFILE_URL,
+                const.AVAILABILITYZONEPROFILE_RESOURCES, **kwargs):
+            yield item
+
+    @correct_return_codes
+    async def count_availabilityzoneprofiles(self, group_by=None, **params):
+        """Count the availability zone profiles, without listing them"""
+        url = const.BASE_AVAILABILITYZONEPROFILE_URL
+        return await self._count(
+            url, const.AVAILABILITYZONEPROFILE_RESOURCES, group_by=group_by,
+            **params)
+
+    @correct_return_codes
+    async def availabilityzoneprofile_list(self, **kwargs):
+        """List all availability zone profiles"""
+        return await self._collect(
+            const.AVAILABILITYZONEPROFILE_RESOURCES,
+            self.iter_availabilityzoneprofiles(**kwargs))
+
+    @correct_return_codes
+    async def availabilityzoneprofile_show(self, availabilityzoneprofile_id,
+                                           fields=None):
+        """Show an availability zone profile"""
+        return await self._find(const.BASE_AVAILABILITYZONEPROFILE_URL,
+                                availabilityzoneprofile_id, fields=fields)
+
+    @correct_return_codes
+    async def availabilityzoneprofile_set(self, availabilityzoneprofile_id,
+                                          **kwargs):
+        """Update an availability zone profile's settings"""
+        url = const.BASE_SINGLE_AVAILABILITYZONEPROFILE_URL.format(
+            uuid=availabilityzoneprofile_id)
+        return await self._create(url, method='PUT', **kwargs)
+
+    @correct_return_codes
+    async def availabilityzoneprofile_delete(self,
+                                             availabilityzoneprofile_id):
+        """Delete an availability zone profile"""
+        url = const.BASE_SINGLE_AVAILABILITYZONEPROFILE_URL.format(
+            uuid=availabilityzoneprofile_id)
+        return await self._delete(url)
@@ -0,0 +1,163 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""On-disk cache of resource name to ID resolutions"""
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+CACHE_FILE = 'name-cache.json'
+
+
+def default_path():
+    """Returns the default location of the cache file
+
+    The file is stored in ``$XDG_CACHE_HOME/octaviaclient``, or in
+    ``~/.cache/octaviaclient`` when ``XDG_CACHE_HOME`` is not set.
+    """
+    cache_home = (os.environ.get('XDG_CACHE_HOME') or
+                  os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(cache_home, 'octaviaclient', CACHE_FILE)
+
+
+class NameCache(object):
+    """Caches the IDs resources were resolved to, with a TTL
+
+    Entries are keyed by the scope of the API (endpoint and project), the
+    resource type, the name or ID looked up and its parent, if any. The file
+    is read once, on the first lookup, and written after each change, or
+    once at the end of a :meth:`batch`. Changes made meanwhile by other
+    processes may be overwritten, which only costs them a lookup.
+
+    :param int ttl:
+        Seconds an entry stays valid
+    :param scope:
+        Callable returning the list identifying the cloud and project the
+        entries belong to
+    :param path:
+        The cache file, :func:`default_path` by default
+    """
+
+    def __init__(self, ttl, scope, path=None):
+        self.ttl = ttl
+        self.scope = scope
+        self.path = path or default_path()
+        self._lock = threading.Lock()
+        self._entries = None
+        self._batches = 0
+        self._dirty = False
+
+    def _key(self, resource_name, name):
+        return json.dumps([self.scope(), resource_name, name],
+                          sort_keys=True)
+
+    def _load(self):
+        if self._entries is not None:
+            return self._entries
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+        if not isinstance(entries, dict):
+            entries = {}
+        now = time.time()
+        self._entries = {k: v for k, v in entries.items() if v[1] > now}
+        return self._entries
+
+    def _changed(self):
+        self._dirty = True
+        if not self._batches:
+            self._save()
+
+    def _save(self):
+        self._dirty = False
+        now = time.time()
+        entries = {k: v for k, v in self._load().items() if v[1] > now}
+        directory = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # The cache is an optimization, failing to write it is not
+            # an error.
+            pass
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Writes the changes made in the block to the file once, at its end
+
+        Batches can be nested and used from several threads, the file is
+        written when the last one ends.
+        """
+        with self._lock:
+            self._batches += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batches -= 1
+                if not self._batches and self._dirty:
+                    self._save()
+
+    def get(self, resource_name, name):
+        """Returns the cached ID of a resource
+
+        :param resource_name:
+            The resource type, e.g. ``pools``
+        :param name:
+            The name or ID looked up, a dict for resources with a parent
+        :return:
+            The cached ID, or ``None``
+        """
+        with self._lock:
+            entry = self._load().get(self._key(resource_name, name))
+        if entry and entry[1] > time.time():
+            return entry[0]
+        return None
+
+    def set(self, resource_name, name, res_id):
+        """Caches the ID a resource was resolved to
+
+        :param resource_name:
+            The resource type, e.g. ``pools``
+        :param name:
+            The name or ID looked up, a dict for resources with a parent
+        :param res_id:
+            The ID of the resource
+        """
+        with self._lock:
+            self._load()[self._key(resource_name, name)] = [
+                res_id, time.time() + self.ttl]
+            self._changed()
+
+    def invalidate(self, res_ids):
+        """Drops the entries resolved to any of the given IDs
+
+        :param res_ids:
+            IDs that do not exist anymore
+        """
+        res_ids = set(res_ids)
+        with self._lock:
+            entries = self._load()
+            dropped = [k for k, v in entries.items() if v[0] in res_ids]
+            for key in dropped:
+                del entries[key]
+            if dropped:
+                self._changed()
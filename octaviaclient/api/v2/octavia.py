@@ -11,53 +11,147 @@
 #   under the License.
 #
 """Octavia API Library"""
+import collections
+from concurrent import futures
 import functools
+import inspect
+import json
+import logging
+import queue
+import threading
+import time
 import urllib.parse as urlparse
 
+from keystoneauth1 import exceptions as ksa_exceptions
+from keystoneauth1 import session as ksa_session
 from osc_lib.api import api
 from osc_lib import exceptions as osc_exc
+from requests import adapters
 
 from octaviaclient.api import constants as const
 from octaviaclient.api import exceptions
+from octaviaclient.api import json_backend as jsonb
+from octaviaclient.api.v2 import name_cache
+from octaviaclient.api.v2 import resource_cache
+from octaviaclient.api.v2 import single_flight
+
+LOG = logging.getLogger(__name__)
 
 OctaviaClientException = exceptions.OctaviaClientException
 
+# Marks the end of the pages produced by a prefetch worker
+_END_OF_PAGES = object()
+
+# Query parameters set by the next links of paginated listings
+_PAGINATION_PARAMS = frozenset(('limit', 'marker', 'sort', 'sort_key',
+                                'sort_dir', 'page_reverse'))
+
+# Page size requested when counting, the API caps it to its
+# pagination_max_limit setting
+COUNT_PAGE_SIZE = 10000
+
+
+_status_dict = {400: 'Bad Request', 401: 'Unauthorized',
+                403: 'Forbidden', 404: 'Not found',
+                409: 'Conflict', 413: 'Over Limit',
+                501: 'Not Implemented', 503: 'Service Unavailable'}
+
+
+def _translate_exception(e):
+    """Map a session or osc-lib exception to an OctaviaClientException
+
+    :param e: The exception raised while performing the API call
+    :return: An OctaviaClientException, or ``None`` if ``e`` is not an
+        API error and must be re-raised unchanged
+    """
+    code = None
+    message = 'Unknown Error'
+    request_id = "n/a"
+    if hasattr(e, 'request_id'):
+        request_id = e.request_id
+    if hasattr(e, 'response'):
+        code = e.response.status_code
+        try:
+            message = e.response.json().get(
+                'faultstring',
+                _status_dict.get(code, message))
+        except Exception:
+            message = _status_dict.get(code, message)
+    elif (isinstance(e, osc_exc.ClientException) and
+            e.code != e.http_status):
+        # cover https://review.opendev.org/675328 case
+        code = e.http_status
+        message = e.code
+    else:
+        return None
+
+    return OctaviaClientException(
+        code=code,
+        message=message,
+        request_id=request_id)
+
+
+def _received_bytes(response):
+    """Returns the size of a response body on the wire"""
+    try:
+        received = response.raw.tell()
+    except Exception:
+        received = None
+    if not received:
+        received = int(response.headers.get('Content-Length',
+                                            len(response.content)))
+    return received
 
-def correct_return_codes(func):
-    _status_dict = {400: 'Bad Request', 401: 'Unauthorized',
-                    403: 'Forbidden', 404: 'Not found',
-                    409: 'Conflict', 413: 'Over Limit',
-                    501: 'Not Implemented', 503: 'Service Unavailable'}
 
+def correct_return_codes(func):
+    if inspect.isgeneratorfunction(func):
+        # Generators only hit the API once they are iterated, so the
+        # translation has to happen around the iteration itself.
+        @functools.wraps(func)
+        def gen_wrapper(*args, **kwargs):
+            try:
+                yield from func(*args, **kwargs)
+            except Exception as e:
+                exc = _translate_exception(e)
+                if exc is None:
+                    raise
+                raise exc from e
+        return gen_wrapper
+
+    if inspect.isasyncgenfunction(func):
+        @functools.wraps(func)
+        async def async_gen_wrapper(*args, **kwargs):
+            try:
+                async for item in func(*args, **kwargs):
+                    yield item
+            except Exception as e:
+                exc = _translate_exception(e)
+                if exc is None:
+                    raise
+                raise exc from e
+        return async_gen_wrapper
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                exc = _translate_exception(e)
+                if exc is None:
+                    raise
+                raise exc from e
+        return async_wrapper
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             response = func(*args, **kwargs)
         except Exception as e:
-            code = None
-            message = 'Unknown Error'
-            request_id = "n/a"
-            if hasattr(e, 'request_id'):
-                request_id = e.request_id
-            if hasattr(e, 'response'):
-                code = e.response.status_code
-                try:
-                    message = e.response.json().get(
-                        'faultstring',
-                        _status_dict.get(code, message))
-                except Exception:
-                    message = _status_dict.get(code, message)
-            elif (isinstance(e, osc_exc.ClientException) and
-                    e.code != e.http_status):
-                # cover https://review.opendev.org/675328 case
-                code = e.http_status
-                message = e.code
-            else:
+            exc = _translate_exception(e)
+            if exc is None:
                 raise
-
-            raise OctaviaClientException(
-                code=code,
-                message=message,
-                request_id=request_id) from e
+            raise exc from e
         return response
     return wrapper
 
@@ -70,14 +164,272 @@ class OctaviaAPI(api.BaseAPI):
     # Make sure we are always requesting JSON responses
     JSON_HEADER = {'Accept': 'application/json'}
 
-    def __init__(self, endpoint=None, **kwargs):
+    def __init__(self, endpoint=None, *, prefetch_depth=0, name_cache_ttl=0,
+                 name_cache_path=None, pool_maxsize=0, json_backend=None,
+                 resource_cache_ttl=0,
+                 resource_cache_size=resource_cache.DEFAULT_MAXSIZE,
+                 coalesce_requests=True, profiler=None, **kwargs):
+        """Create an Octavia API client
+
+        :param string endpoint:
+            The load-balancer service endpoint
+        :param int prefetch_depth:
+            Number of pages to request ahead on a worker thread while the
+            current page of a paginated listing is being consumed. ``0``
+            (the default) disables read-ahead.
+        :param int name_cache_ttl:
+            Seconds the IDs of resources resolved by name are cached on
+            disk. ``0`` (the default) disables the cache.
+        :param string name_cache_path:
+            The name cache file, ``$XDG_CACHE_HOME/octaviaclient`` by default
+        :param int pool_maxsize:
+            Number of connections to the endpoint kept open for reuse. A
+            dedicated HTTP adapter is mounted on the session for the URLs
+            of the endpoint when set, ``0`` (the default) keeps the adapter
+            of the session (10 connections per host).
+        :param string json_backend:
+            The library decoding the responses, ``orjson``, ``ujson`` or
+            ``json``. orjson is used by default when installed.
+        :param int resource_cache_ttl:
+            Seconds the resources shown are cached in memory, for the
+            ``*_show`` calls to reuse. Creating, updating or deleting a
+            resource through this client drops the affected entries. ``0``
+            (the default) disables the cache.
+        :param int resource_cache_size:
+            Number of resources cached, the least recently used ones are
+            evicted first
+        :param bool coalesce_requests:
+            Share the response of a GET request among the threads sending
+            the same request while it is in flight. GET requests sent after
+            a change made through this client never get a response read
+            before the change.
+        :param profiler:
+            A :class:`octaviaclient.api.v2.profile.Profiler` recording the
+            HTTP requests sent
+        :param kwargs:
+            Keyword arguments passed to osc_lib's BaseAPI
+        """
         super().__init__(endpoint=endpoint, **kwargs)
+        self.prefetch_depth = prefetch_depth
         self.endpoint = self.endpoint.rstrip('/')
         self._build_url()
 
-        self._create = functools.partial(self.create, headers=self.JSON_HEADER)
-        self._delete = functools.partial(self.delete, headers=self.JSON_HEADER)
-        self._find = functools.partial(self.find, headers=self.JSON_HEADER)
+        self.name_cache = None
+        if name_cache_ttl:
+            self.name_cache = name_cache.NameCache(
+                name_cache_ttl, self._name_cache_scope, path=name_cache_path)
+
+        self.resource_cache = None
+        if resource_cache_ttl:
+            self.resource_cache = resource_cache.ResourceCache(
+                resource_cache_ttl, maxsize=resource_cache_size)
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+        self.pool_maxsize = pool_maxsize
+        if pool_maxsize:
+            self._mount_adapter(pool_maxsize)
+
+        self.json_backend = json_backend or jsonb.available()[0]
+        self._json_loads = jsonb.get_loads(self.json_backend)
+
+        self.profiler = profiler
+
+        self._single_flight = None
+        if coalesce_requests:
+            self._single_flight = single_flight.SingleFlight()
+
+    def _name_cache_scope(self):
+        try:
+            project_id = self.session.get_project_id()
+        except Exception:
+            project_id = None
+        return [self.endpoint, project_id]
+
+    def _mount_adapter(self, pool_maxsize):
+        """Mount an HTTP adapter with a larger pool for the endpoint only
+
+        The session is shared with the other OpenStack clients, which keep
+        their adapter, even for the services hosted on the same host. The
+        new adapter keeps the TCP keep-alive, TLS and retry settings of the
+        one it replaces.
+        """
+        http = self.session.session
+        current = http.get_adapter(self.endpoint + '/')
+        tls_options = {name: getattr(current, name)
+                       for name in ('tls_ciphers', 'tls_min_version')
+                       if getattr(current, name, None) is not None}
+        adapter = ksa_session.TCPKeepAliveAdapter(
+            pool_maxsize=pool_maxsize, max_retries=current.max_retries,
+            **tls_options)
+        http.mount(self.endpoint + '/', adapter)
+
+    def connection_pool_stats(self):
+        """Returns usage counters of the connections to the endpoint
+
+        :return:
+            A dict with the size of the pool (``maxsize``), the number of
+            ``connections`` opened, of ``requests`` sent and of requests
+            sent on a ``reused`` connection
+        """
+        adapter = self.session.session.get_adapter(self.endpoint + '/')
+        url = urlparse.urlparse(self.endpoint)
+        port = url.port or {'http': 80, 'https': 443}.get(url.scheme)
+        stats = {'maxsize': self._connection_pool_size(),
+                 'connections': 0, 'requests': 0}
+        pools = getattr(getattr(adapter, 'poolmanager', None), 'pools', None)
+        for key in list(pools.keys()) if pools else []:
+            pool = pools.get(key)
+            if pool is None or (pool.host, pool.port) != (url.hostname, port):
+                continue
+            stats['connections'] += pool.num_connections
+            stats['requests'] += pool.num_requests
+        stats['reused'] = max(stats['requests'] - stats['connections'], 0)
+        return stats
+
+    def _connection_pool_size(self):
+        """Returns the number of connections kept open to the endpoint"""
+        return self.pool_maxsize or adapters.DEFAULT_POOLSIZE
+
+    def _get_executor(self):
+        # One pool per client, sized so that every worker can hold a
+        # connection of the session without waiting for another one.
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = futures.ThreadPoolExecutor(
+                    max_workers=self._connection_pool_size(),
+                    thread_name_prefix='octavia-map')
+            return self._executor
+
+    def map(self, method, iterable, max_workers=None, fail_fast=False):
+        """Call an API method once per item, concurrently
+
+        The calls run on a thread pool shared by all the ``map`` calls of
+        this client and sized to the connection pool of its session. The
+        session is safe to share between the workers: the token is fetched
+        once before the calls start (keystoneauth serializes any later
+        refresh under a lock) and requests' connection pool is thread-safe.
+
+        :param method:
+            A method of this client, or its name, e.g.
+            ``'load_balancer_stats_show'``
+        :param iterable:
+            The arguments of the calls. Tuples are passed as positional
+            arguments, e.g. ``(pool_id, member_id)`` for ``member_show``,
+            any other item as the only argument.
+        :param int max_workers:
+            Maximum number of calls in flight, the size of the thread pool
+            by default
+        :param bool fail_fast:
+            Raise the first error instead of collecting it. Calls not
+            started yet are skipped.
+        :return:
+            The results, in the order of ``iterable``. The result of a
+            failed call is the ``OctaviaClientException`` (or osc-lib
+            ``NotFound``) it raised.
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+        executor = self._get_executor()
+        max_workers = min(max_workers or executor._max_workers,
+                          executor._max_workers)
+        if max_workers < 1:
+            msg = 'max_workers must be a positive integer'
+            raise ValueError(msg)
+
+        # Authenticate once instead of letting every worker race for it
+        if getattr(self.session, 'auth', None):
+            self.session.get_auth_headers()
+
+        def call(item):
+            args = item if isinstance(item, tuple) else (item,)
+            return method(*args)
+
+        items = enumerate(iterable)
+        results = []
+        running = {}
+        while True:
+            for index, item in items:
+                running[executor.submit(call, item)] = index
+                results.append(None)
+                if len(running) >= max_workers:
+                    break
+            if not running:
+                return results
+            done, _ = futures.wait(running,
+                                   return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                try:
+                    results[index] = future.result()
+                except (OctaviaClientException, osc_exc.ClientException) as e:
+                    if fail_fast:
+                        # Let the calls in flight finish, start no others
+                        futures.wait(running)
+                        raise
+                    results[index] = e
+
+    def coalescing_stats(self):
+        """Returns the number of GET requests and of coalesced ones
+
+        :return:
+            A dict with the number of GET ``calls`` made and of the calls
+            ``coalesced`` with an identical one in flight
+        """
+        if self._single_flight is None:
+            return {'calls': 0, 'coalesced': 0}
+        return self._single_flight.stats()
+
+    def _request(self, method, url, session=None, **kwargs):
+        if self._single_flight is None or session is not None:
+            return self._send(method, url, session=session, **kwargs)
+        if method != 'GET':
+            try:
+                return self._send(method, url, **kwargs)
+            finally:
+                self._single_flight.forget()
+        key = (url, json.dumps(kwargs, sort_keys=True, default=str))
+        return self._single_flight.do(key, self._send, method, url,
+                                      **kwargs)
+
+    def _send(self, method, url, session=None, **kwargs):
+        start = time.monotonic()
+        response = None
+        try:
+            response = super()._request(method, url, session=session,
+                                        **kwargs)
+        except ksa_exceptions.HttpError as e:
+            response = e.response
+            if isinstance(e, ksa_exceptions.NotFound):
+                # A cached name or resource may point to a resource that is
+                # gone
+                path = urlparse.urlparse(url).path
+                if self.name_cache:
+                    self.name_cache.invalidate(path.strip('/').split('/'))
+                if self.resource_cache is not None:
+                    self.resource_cache.invalidate(path)
+            raise
+        finally:
+            if self.profiler is not None:
+                self.profiler.record(
+                    method, url,
+                    response.status_code if response is not None else None,
+                    time.monotonic() - start,
+                    _received_bytes(response) if response is not None
+                    else None)
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug('%(method)s %(url)s: %(received)d bytes received, '
+                      '%(decoded)d bytes decoded (Content-Encoding: '
+                      '%(encoding)s)',
+                      {'method': method, 'url': response.url or url,
+                       'received': _received_bytes(response),
+                       'decoded': len(response.content),
+                       'encoding': response.headers.get('Content-Encoding',
+                                                        'identity')})
+        if self.json_backend != 'json':
+            response.json = jsonb.response_decoder(response, self._json_loads)
+        return response
 
     def _list(self, path, **params):
         get_all = params.pop('get_all', False)
@@ -86,51 +438,273 @@ class OctaviaAPI(api.BaseAPI):
 
         # Enable pagination for 'resources'
         resource_key = params.pop('resources')
-        res = []
+        return {resource_key: list(self._iter(path, resource_key, **params))}
+
+    def _create(self, url, **params):
+        ret = None
+        try:
+            ret = self.create(url, headers=self.JSON_HEADER, **params)
+            return ret
+        finally:
+            if self.resource_cache is not None:
+                self.resource_cache.invalidate(
+                    url, params.get('json'),
+                    ret if isinstance(ret, dict) else None)
+
+    def _delete(self, url, **params):
+        try:
+            return self.delete(url, headers=self.JSON_HEADER, **params)
+        finally:
+            if self.resource_cache is not None:
+                self.resource_cache.invalidate(url)
+
+    def _find(self, path, value, fields=None):
+        """Find a single resource by ID, or by name where supported
+
+        The resource is read from the resource cache, if enabled.
+
+        :param string path:
+            The API-specific portion of the URL path
+        :param string value:
+            ID (or name) of the resource to show
+        :param list fields:
+            Only return these fields of the resource
+        :return:
+            A dict of the resource's settings
+        """
+        url = '{}/{}'.format(path, value)
+        if self.resource_cache is not None:
+            ret = self.resource_cache.get(url, fields)
+            if ret is not None:
+                return ret
+
+        if not fields:
+            ret = self.find(path=path, value=value, headers=self.JSON_HEADER)
+        else:
+            try:
+                ret = self._request(
+                    'GET', '/' + url, params={'fields': fields},
+                    headers=self.JSON_HEADER).json()
+            except (ksa_exceptions.NotFound, ksa_exceptions.BadRequest) as e:
+                raise osc_exc.NotFound(
+                    404, "{} not found".format(value)) from e
+            if isinstance(ret, dict) and len(ret) == 1:
+                # strip off the enclosing dict
+                ret = next(iter(ret.values()))
+
+        if self.resource_cache is not None:
+            self.resource_cache.set(url, ret, fields)
+        return ret
+
+    def _iter(self, path, resource_key, limit=None, **params):
+        """Iterate over a paginated collection, one page at a time
+
+        Follows the ``<resource_key>_links`` rel=next link of each page and
+        yields the items as soon as their page has been received, so only
+        the current page (plus up to ``prefetch_depth`` pages read ahead) is
+        held in memory at any time.
+
+        :param string path:
+            The API-specific portion of the URL path
+        :param string resource_key:
+            The root tag of the collection in the response body
+        :param int limit:
+            Maximum number of items to yield, no more pages are requested
+            once it is reached
+        :param params:
+            Parameters to filter on, ``marker`` and ``sort`` included
+        :return:
+            A generator of resource dicts
+        """
+        if limit is not None:
+            params['limit'] = limit
+        pages = self._pages(path, resource_key, params)
+        remaining = limit
+        for page in pages:
+            if remaining is None:
+                yield from page
+                continue
+            yield from page[:remaining]
+            remaining -= min(len(page), remaining)
+            if not remaining:
+                # Leaving the loop closes the pages generator, which stops
+                # the pagination and the prefetch thread
+                return
+
+    def _count(self, path, resource_key, key='id', group_by=None,
+               **params):
+        """Count the items of a paginated collection
+
+        The pages are requested with the largest size the API allows and
+        with only the field counted on, and the items are not kept.
+
+        :param string path:
+            The API-specific portion of the URL path
+        :param string resource_key:
+            The root tag of the collection in the response body
+        :param string key:
+            The field identifying the items, requested when they are not
+            grouped
+        :param string group_by:
+            A field to count the items for each value of
+        :param params:
+            Parameters to filter on
+        :return:
+            The number of items, or a dict of the number of items for each
+            value of the ``group_by`` field
+        """
+        params.pop('limit', None)
+        params.pop('sort', None)
+        params['fields'] = [group_by or key]
+        params['limit'] = COUNT_PAGE_SIZE
+        pages = self._pages(path, resource_key, params)
+        if group_by is None:
+            return sum(len(page) for page in pages)
+        counts = collections.Counter()
+        for page in pages:
+            counts.update(item.get(group_by) for item in page)
+        return dict(counts)
+
+    def _pages(self, path, resource_key, params):
+        if self.prefetch_depth > 0:
+            return self._prefetch_pages(path, resource_key, params)
+        return self._iter_pages(path, resource_key, params)
+
+    def _iter_pages(self, path, resource_key, params):
         while True:
             response = self.list(path, **params, headers=self.JSON_HEADER)
-            res.extend(response[resource_key])
+            yield response[resource_key]
 
-            links = response.get("{}_links".format(resource_key), [])
-            for link in links:
-                if link.get('rel') == 'next':
-                    query_str = urlparse.urlparse(link['href']).query
-                    params = urlparse.parse_qs(query_str)
-                    break
-            else:
-                break
-        return {resource_key: res}
+            params = self._next_page_params(response, resource_key, params)
+            if params is None:
+                return
+
+    def _prefetch_pages(self, path, resource_key, params):
+        """Fetch pages on a worker thread, up to prefetch_depth ahead
+
+        The next page is requested as soon as the previous one has been
+        decoded, while the caller is still consuming it. Errors raised by
+        the worker are re-raised in the caller's thread.
+        """
+        pages = queue.Queue(maxsize=self.prefetch_depth)
+        stopped = threading.Event()
+
+        def put(item):
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def worker():
+            try:
+                for page in self._iter_pages(path, resource_key, params):
+                    if not put((page, None)):
+                        return
+            except Exception as e:
+                put((None, e))
+                return
+            put((_END_OF_PAGES, None))
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        try:
+            while True:
+                page, error = pages.get()
+                if error is not None:
+                    raise error
+                if page is _END_OF_PAGES:
+                    return
+                yield page
+        finally:
+            # Release the worker if the caller stopped iterating early, and
+            # let a request it has in flight complete before returning so
+            # that none is left behind the caller's back
+            stopped.set()
+            thread.join()
+
+    @staticmethod
+    def _next_page_params(response, resource_key, params):
+        """Returns the parameters of the next page, None on the last page
+
+        Octavia's next links only carry the pagination parameters, the
+        filters and the field projection of the listing are carried over
+        from the parameters of the current page.
+        """
+        links = response.get("{}_links".format(resource_key), [])
+        for link in links:
+            if link.get('rel') == 'next':
+                query_str = urlparse.urlparse(link['href']).query
+                next_params = urlparse.parse_qs(query_str)
+                for name, value in params.items():
+                    if name not in _PAGINATION_PARAMS:
+                        next_params.setdefault(name, value)
+                return next_params
+        return None
 
     def _build_url(self):
         if not self.endpoint.endswith(self._endpoint_suffix):
             self.endpoint += self._endpoint_suffix
 
+    @correct_return_codes
+    def iter_load_balancers(self, **params):
+        """Iterate over all load balancers page by page
+
+        :param params:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            A generator of load balancers
+        """
+        url = const.BASE_LOADBALANCER_URL
+        yield from self._iter(url, const.LOADBALANCER_RESOURCES, **params)
+
+    @correct_return_codes
+    def count_load_balancers(self, group_by=None, **params):
+        """Count the load balancers, without listing them
+
+        :param string group_by:
+            A field to count the load balancers for each value of
+        :param params:
+            Parameters to filter on
+        :return:
+            The number of load balancers, or a dict of their number for each
+            value of the ``group_by`` field
+        """
+        url = const.BASE_LOADBALANCER_URL
+        return self._count(url, const.LOADBALANCER_RESOURCES,
+                           group_by=group_by, **params)
+
     @correct_return_codes
     def load_balancer_list(self, **params):
         """List all load balancers
 
         :param params:
-            Parameters to filter on
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
         :return:
             List of load balancers
         """
-        url = const.BASE_LOADBALANCER_URL
-        response = self._list(url, get_all=True,
-                              resources=const.LOADBALANCER_RESOURCES,
-                              **params)
+        items = self.iter_load_balancers(**params)
+        response = {const.LOADBALANCER_RESOURCES: list(items)}
 
         return response
 
     @correct_return_codes
-    def load_balancer_show(self, lb_id):
+    def load_balancer_show(self, lb_id, fields=None):
         """Show a load balancer
 
         :param string lb_id:
             ID of the load balancer to show
+        :param list fields:
+            Only return these fields of the resource
         :return:
             A dict of the specified load balancer's settings
         """
-        response = self._find(path=const.BASE_LOADBALANCER_URL, value=lb_id)
+        response = self._find(path=const.BASE_LOADBALANCER_URL,
+                              value=lb_id, fields=fields)
 
         return response
 
@@ -222,32 +796,63 @@ class OctaviaAPI(api.BaseAPI):
 
         return response
 
+    @correct_return_codes
+    def iter_listeners(self, **kwargs):
+        """Iterate over all listeners page by page
+
+        :param kwargs:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            A generator of listeners
+        """
+        url = const.BASE_LISTENER_URL
+        yield from self._iter(url, const.LISTENER_RESOURCES, **kwargs)
+
+    @correct_return_codes
+    def count_listeners(self, group_by=None, **kwargs):
+        """Count the listeners, without listing them
+
+        :param string group_by:
+            A field to count the listeners for each value of
+        :param kwargs:
+            Parameters to filter on
+        :return:
+            The number of listeners, or a dict of their number for each
+            value of the ``group_by`` field
+        """
+        url = const.BASE_LISTENER_URL
+        return self._count(url, const.LISTENER_RESOURCES, group_by=group_by,
+                           **kwargs)
+
     @correct_return_codes
     def listener_list(self, **kwargs):
         """List all listeners
 
         :param kwargs:
-            Parameters to filter on
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
         :return:
             List of listeners
         """
-        url = const.BASE_LISTENER_URL
-        response = self._list(url, get_all=True,
-                              resources=const.LISTENER_RESOURCES,
-                              **kwargs)
+        items = self.iter_listeners(**kwargs)
+        response = {const.LISTENER_RESOURCES: list(items)}
 
         return response
 
     @correct_return_codes
-    def listener_show(self, listener_id):
+    def listener_show(self, listener_id, fields=None):
         """Show a listener
 
         :param string listener_id:
             ID of the listener to show
+        :param list fields:
+            Only return these fields of the resource
         :return:
             A dict of the specified listener's settings
         """
-        response = self._find(path=const.BASE_LISTENER_URL, value=listener_id)
+        response = self._find(path=const.BASE_LISTENER_URL,
+                              value=listener_id, fields=fields)
 
         return response
 
@@ -309,19 +914,47 @@ class OctaviaAPI(api.BaseAPI):
 
         return response
 
+    @correct_return_codes
+    def iter_pools(self, **kwargs):
+        """Iterate over all pools page by page
+
+        :param kwargs:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            A generator of pools
+        """
+        url = const.BASE_POOL_URL
+        yield from self._iter(url, const.POOL_RESOURCES, **kwargs)
+
+    @correct_return_codes
+    def count_pools(self, group_by=None, **kwargs):
+        """Count the pools, without listing them
+
+        :param string group_by:
+            A field to count the pools for each value of
+        :param kwargs:
+            Parameters to filter on
+        :return:
+            The number of pools, or a dict of their number for each
+            value of the ``group_by`` field
+        """
+        url = const.BASE_POOL_URL
+        return self._count(url, const.POOL_RESOURCES, group_by=group_by,
+                           **kwargs)
+
     @correct_return_codes
     def pool_list(self, **kwargs):
         """List all pools
 
         :param kwargs:
-            Parameters to filter on
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
         :return:
             List of pools
         """
-        url = const.BASE_POOL_URL
-        response = self._list(url, get_all=True,
-                              resources=const.POOL_RESOURCES,
-                              **kwargs)
+        items = self.iter_pools(**kwargs)
+        response = {const.POOL_RESOURCES: list(items)}
 
         return response
 
@@ -354,15 +987,18 @@ class OctaviaAPI(api.BaseAPI):
         return response
 
     @correct_return_codes
-    def pool_show(self, pool_id):
+    def pool_show(self, pool_id, fields=None):
         """Show a pool's settings
 
         :param string pool_id:
             ID of the pool to show
+        :param list fields:
+            Only return these fields of the resource
         :return:
             Dict of the specified pool's settings
         """
-        response = self._find(path=const.BASE_POOL_URL, value=pool_id)
+        response = self._find(path=const.BASE_POOL_URL,
+                              value=pool_id, fields=fields)
 
         return response
 
@@ -382,6 +1018,39 @@ class OctaviaAPI(api.BaseAPI):
 
         return response
 
+    @correct_return_codes
+    def iter_members(self, pool_id, **kwargs):
+        """Iterate over all members page by page
+
+        :param string pool_id:
+            ID of the pool
+        :param kwargs:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            A generator of members
+        """
+        url = const.BASE_MEMBER_URL.format(pool_id=pool_id)
+        yield from self._iter(url, const.MEMBER_RESOURCES, **kwargs)
+
+    @correct_return_codes
+    def count_members(self, pool_id, group_by=None, **kwargs):
+        """Count the members of a pool, without listing them
+
+        :param string pool_id:
+            ID of the pool
+        :param string group_by:
+            A field to count the members for each value of
+        :param kwargs:
+            Parameters to filter on
+        :return:
+            The number of members, or a dict of their number for each
+            value of the ``group_by`` field
+        """
+        url = const.BASE_MEMBER_URL.format(pool_id=pool_id)
+        return self._count(url, const.MEMBER_RESOURCES, group_by=group_by,
+                           **kwargs)
+
     @correct_return_codes
     def member_list(self, pool_id, **kwargs):
         """Lists the member from a given pool id
@@ -393,15 +1062,13 @@ class OctaviaAPI(api.BaseAPI):
         :return:
             Response list members
         """
-        url = const.BASE_MEMBER_URL.format(pool_id=pool_id)
-        response = self._list(url, get_all=True,
-                              resources=const.MEMBER_RESOURCES,
-                              **kwargs)
+        items = self.iter_members(pool_id, **kwargs)
+        response = {const.MEMBER_RESOURCES: list(items)}
 
         return response
 
     @correct_return_codes
-    def member_show(self, pool_id, member_id):
+    def member_show(self, pool_id, member_id, fields=None):
         """Showing a member details of a pool
 
         :param pool_id:
@@ -410,11 +1077,13 @@ class OctaviaAPI(api.BaseAPI):
             ID of the member
         :param kwargs:
             A dict of arguments
+        :param list fields:
+            Only return these fields of the resource
         :return:
             Response of member
         """
         url = const.BASE_MEMBER_URL.format(pool_id=pool_id)
-        response = self._find(path=url, value=member_id)
+        response = self._find(path=url, value=member_id, fields=fields)
 
         return response
 
@@ -470,19 +1139,71 @@ class OctaviaAPI(api.BaseAPI):
 
         return response
 
+    @correct_return_codes
+    def member_batch_update(self, pool_id, members, additive_only=False):
+        """Replace the members of a pool in a single request
+
+        :param pool_id:
+            ID of the pool
+        :param members:
+            A list of member dicts. Members with an address and protocol port
+            matching an existing member are updated, the others are created
+        :param bool additive_only:
+            Keep the existing members missing from ``members`` instead of
+            deleting them
+        :return:
+            Response code from the API
+        """
+        url = const.BASE_MEMBER_URL.format(pool_id=pool_id)
+        params = {}
+        if additive_only:
+            params['additive_only'] = True
+        response = self._create(url, method='PUT', params=params,
+                                json={'members': members})
+
+        return response
+
+    @correct_return_codes
+    def iter_l7policies(self, **kwargs):
+        """Iterate over all l7policies page by page
+
+        :param kwargs:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            A generator of l7policies
+        """
+        url = const.BASE_L7POLICY_URL
+        yield from self._iter(url, const.L7POLICY_RESOURCES, **kwargs)
+
+    @correct_return_codes
+    def count_l7policies(self, group_by=None, **kwargs):
+        """Count the l7policies, without listing them
+
+        :param string group_by:
+            A field to count the l7policies for each value of
+        :param kwargs:
+            Parameters to filter on
+        :return:
+            The number of l7policies, or a dict of their number for each
+            value of the ``group_by`` field
+        """
+        url = const.BASE_L7POLICY_URL
+        return self._count(url, const.L7POLICY_RESOURCES, group_by=group_by,
+                           **kwargs)
+
     @correct_return_codes
     def l7policy_list(self, **kwargs):
         """List all l7policies
 
         :param kwargs:
-            Parameters to filter on
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
         :return:
             List of l7policies
         """
-        url = const.BASE_L7POLICY_URL
-        response = self._list(url, get_all=True,
-                              resources=const.L7POLICY_RESOURCES,
-                              **kwargs)
+        items = self.iter_l7policies(**kwargs)
+        response = {const.L7POLICY_RESOURCES: list(items)}
 
         return response
 
@@ -515,15 +1236,18 @@ class OctaviaAPI(api.BaseAPI):
         return response
 
     @correct_return_codes
-    def l7policy_show(self, l7policy_id):
+    def l7policy_show(self, l7policy_id, fields=None):
         """Show a l7policy's settings
 
         :param string l7policy_id:
             ID of the l7policy to show
+        :param list fields:
+            Only return these fields of the resource
         :return:
             Dict of the specified l7policy's settings
         """
-        response = self._find(path=const.BASE_L7POLICY_URL, value=l7policy_id)
+        response = self._find(path=const.BASE_L7POLICY_URL,
+                              value=l7policy_id, fields=fields)
 
         return response
 
@@ -543,19 +1267,51 @@ class OctaviaAPI(api.BaseAPI):
 
         return response
 
+    @correct_return_codes
+    def iter_l7rules(self, l7policy_id, **kwargs):
+        """Iterate over all l7rules page by page
+
+        :param string l7policy_id:
+            ID of the l7policy
+        :param kwargs:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            A generator of l7rules
+        """
+        url = const.BASE_L7RULE_URL.format(policy_uuid=l7policy_id)
+        yield from self._iter(url, const.L7RULE_RESOURCES, **kwargs)
+
+    @correct_return_codes
+    def count_l7rules(self, l7policy_id, group_by=None, **kwargs):
+        """Count the l7rules of an l7policy, without listing them
+
+        :param string l7policy_id:
+            ID of the l7policy
+        :param string group_by:
+            A field to count the l7rules for each value of
+        :param kwargs:
+            Parameters to filter on
+        :return:
+            The number of l7rules, or a dict of their number for each
+            value of the ``group_by`` field
+        """
+        url = const.BASE_L7RULE_URL.format(policy_uuid=l7policy_id)
+        return self._count(url, const.L7RULE_RESOURCES, group_by=group_by,
+                           **kwargs)
+
     @correct_return_codes
     def l7rule_list(self, l7policy_id, **kwargs):
         """List all l7rules for a l7policy
 
         :param kwargs:
-            Parameters to filter on
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
         :return:
             List of l7rules
         """
-        url = const.BASE_L7RULE_URL.format(policy_uuid=l7policy_id)
-        response = self._list(url, get_all=True,
-                              resources=const.L7RULE_RESOURCES,
-                              **kwargs)
+        items = self.iter_l7rules(l7policy_id, **kwargs)
+        response = {const.L7RULE_RESOURCES: list(items)}
 
         return response
 
@@ -593,18 +1349,20 @@ class OctaviaAPI(api.BaseAPI):
         return response
 
     @correct_return_codes
-    def l7rule_show(self, l7rule_id, l7policy_id):
+    def l7rule_show(self, l7rule_id, l7policy_id, fields=None):
         """Show a l7rule's settings
 
         :param string l7rule_id:
             ID of the l7rule to show
         :param string l7policy_id:
             ID of the l7policy for this l7rule
+        :param list fields:
+            Only return these fields of the resource
         :return:
             Dict of the specified l7rule's settings
         """
         url = const.BASE_L7RULE_URL.format(policy_uuid=l7policy_id)
-        response = self._find(path=url, value=l7rule_id)
+        response = self._find(path=url, value=l7rule_id, fields=fields)
 
         return response
 
@@ -627,19 +1385,47 @@ class OctaviaAPI(api.BaseAPI):
 
         return response
 
+    @correct_return_codes
+    def iter_health_monitors(self, **kwargs):
+        """Iterate over all health monitors page by page
+
+        :param kwargs:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            A generator of health monitors
+        """
+        url = const.BASE_HEALTH_MONITOR_URL
+        yield from self._iter(url, const.HEALTH_MONITOR_RESOURCES, **kwargs)
+
+    @correct_return_codes
+    def count_health_monitors(self, group_by=None, **kwargs):
+        """Count the health monitors, without listing them
+
+        :param string group_by:
+            A field to count the health monitors for each value of
+        :param kwargs:
+            Parameters to filter on
+        :return:
+            The number of health monitors, or a dict of their number for each
+            value of the ``group_by`` field
+        """
+        url = const.BASE_HEALTH_MONITOR_URL
+        return self._count(url, const.HEALTH_MONITOR_RESOURCES,
+                           group_by=group_by, **kwargs)
+
     @correct_return_codes
     def health_monitor_list(self, **kwargs):
         """List all health monitors
 
         :param kwargs:
-            Parameters to filter on
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
         :return:
             A dict containing a list of health monitors
         """
-        url = const.BASE_HEALTH_MONITOR_URL
-        response = self._list(url, get_all=True,
-                              resources=const.HEALTH_MONITOR_RESOURCES,
-                              **kwargs)
+        items = self.iter_health_monitors(**kwargs)
+        response = {const.HEALTH_MONITOR_RESOURCES: list(items)}
 
         return response
 
@@ -673,16 +1459,18 @@ class OctaviaAPI(api.BaseAPI):
         return response
 
     @correct_return_codes
-    def health_monitor_show(self, health_monitor_id):
+    def health_monitor_show(self, health_monitor_id, fields=None):
         """Show a health monitor's settings
 
         :param string health_monitor_id:
             ID of the health monitor to show
+        :param list fields:
+            Only return these fields of the resource
         :return:
             Dict of the specified health monitor's settings
         """
         url = const.BASE_HEALTH_MONITOR_URL
-        response = self._find(path=url, value=health_monitor_id)
+        response = self._find(path=url, value=health_monitor_id, fields=fields)
 
         return response
 
@@ -703,6 +1491,35 @@ class OctaviaAPI(api.BaseAPI):
 
         return response
 
+    @correct_return_codes
+    def iter_quotas(self, **params):
+        """Iterate over all quotas page by page
+
+        :param params:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            A generator of quotas
+        """
+        url = const.BASE_QUOTA_URL
+        yield from self._iter(url, const.QUOTA_RESOURCES, **params)
+
+    @correct_return_codes
+    def count_quotas(self, group_by=None, **params):
+        """Count the quotas, without listing them
+
+        :param string group_by:
+            A field to count the quotas for each value of
+        :param params:
+            Parameters to filter on
+        :return:
+            The number of quotas, or a dict of their number for each
+            value of the ``group_by`` field
+        """
+        url = const.BASE_QUOTA_URL
+        return self._count(url, const.QUOTA_RESOURCES,
+                           key='project_id', group_by=group_by, **params)
+
     @correct_return_codes
     def quota_list(self, **params):
         """List all quotas
@@ -712,10 +1529,8 @@ class OctaviaAPI(api.BaseAPI):
         :return:
             A ``dict`` representing a list of quotas for the project
         """
-        url = const.BASE_QUOTA_URL
-        response = self._list(url, get_all=True,
-                              resources=const.QUOTA_RESOURCES,
-                              **params)
+        items = self.iter_quotas(**params)
+        response = {const.QUOTA_RESOURCES: list(items)}
 
         return response
 
@@ -775,32 +1590,62 @@ class OctaviaAPI(api.BaseAPI):
         return response
 
     @correct_return_codes
-    def amphora_show(self, amphora_id):
+    def amphora_show(self, amphora_id, fields=None):
         """Show an amphora
 
         :param string amphora_id:
             ID of the amphora to show
+        :param list fields:
+            Only return these fields of the resource
         :return:
             A ``dict`` of the specified amphora's attributes
         """
         url = const.BASE_AMPHORA_URL
-        response = self._find(path=url, value=amphora_id)
+        response = self._find(path=url, value=amphora_id, fields=fields)
 
         return response
 
+    @correct_return_codes
+    def iter_amphorae(self, **kwargs):
+        """Iterate over all amphorae page by page
+
+        :param kwargs:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            A generator of amphorae
+        """
+        url = const.BASE_AMPHORA_URL
+        yield from self._iter(url, const.AMPHORA_RESOURCES, **kwargs)
+
+    @correct_return_codes
+    def count_amphorae(self, group_by=None, **kwargs):
+        """Count the amphorae, without listing them
+
+        :param string group_by:
+            A field to count the amphorae for each value of
+        :param kwargs:
+            Parameters to filter on
+        :return:
+            The number of amphorae, or a dict of their number for each
+            value of the ``group_by`` field
+        """
+        url = const.BASE_AMPHORA_URL
+        return self._count(url, const.AMPHORA_RESOURCES, group_by=group_by,
+                           **kwargs)
+
     @correct_return_codes
     def amphora_list(self, **kwargs):
         """List all amphorae
 
         :param kwargs:
-            Parameters to filter on
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
         :return:
             A ``dict`` containing a list of amphorae
         """
-        url = const.BASE_AMPHORA_URL
-        response = self._list(path=url, get_all=True,
-                              resources=const.AMPHORA_RESOURCES,
-                              **kwargs)
+        items = self.iter_amphorae(**kwargs)
+        response = {const.AMPHORA_RESOURCES: list(items)}
 
         return response
 
@@ -861,15 +1706,28 @@ class OctaviaAPI(api.BaseAPI):
         return response
 
     @correct_return_codes
-    def provider_list(self):
+    def iter_providers(self, **kwargs):
+        """Iterate over all providers page by page
+
+        :param kwargs:
+            Parameters to filter on
+        :return:
+            A generator of providers
+        """
+        url = const.BASE_PROVIDER_URL
+        yield from self._iter(url, const.PROVIDER_RESOURCES, **kwargs)
+
+    @correct_return_codes
+    def provider_list(self, **kwargs):
         """List all providers
 
+        :param kwargs:
+            Parameters to filter on
         :return:
             A ``dict`` containing a list of provider
         """
-        url = const.BASE_PROVIDER_URL
-        response = self._list(path=url, get_all=True,
-                              resources=const.PROVIDER_RESOURCES)
+        items = self.iter_providers(**kwargs)
+        response = {const.PROVIDER_RESOURCES: list(items)}
 
         return response
 
@@ -907,18 +1765,47 @@ class OctaviaAPI(api.BaseAPI):
 
         return response
 
+    @correct_return_codes
+    def iter_flavors(self, **kwargs):
+        """Iterate over all flavors page by page
+
+        :param kwargs:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            A generator of flavors
+        """
+        url = const.BASE_FLAVOR_URL
+        yield from self._iter(url, const.FLAVOR_RESOURCES, **kwargs)
+
+    @correct_return_codes
+    def count_flavors(self, group_by=None, **kwargs):
+        """Count the flavors, without listing them
+
+        :param string group_by:
+            A field to count the flavors for each value of
+        :param kwargs:
+            Parameters to filter on
+        :return:
+            The number of flavors, or a dict of their number for each
+            value of the ``group_by`` field
+        """
+        url = const.BASE_FLAVOR_URL
+        return self._count(url, const.FLAVOR_RESOURCES, group_by=group_by,
+                           **kwargs)
+
     @correct_return_codes
     def flavor_list(self, **kwargs):
         """List all flavors
 
         :param kwargs:
-            Parameters to filter on
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
         :return:
             A ``dict`` containing a list of flavor
         """
-        url = const.BASE_FLAVOR_URL
-        response = self._list(path=url, get_all=True,
-                              resources=const.FLAVOR_RESOURCES, **kwargs)
+        items = self.iter_flavors(**kwargs)
+        response = {const.FLAVOR_RESOURCES: list(items)}
 
         return response
 
@@ -967,15 +1854,18 @@ class OctaviaAPI(api.BaseAPI):
         return response
 
     @correct_return_codes
-    def flavor_show(self, flavor_id):
+    def flavor_show(self, flavor_id, fields=None):
         """Show a flavor
 
         :param string flavor_id:
             ID of the flavor to show
+        :param list fields:
+            Only return these fields of the resource
         :return:
             A dict of the specified flavor's settings
         """
-        response = self._find(path=const.BASE_FLAVOR_URL, value=flavor_id)
+        response = self._find(path=const.BASE_FLAVOR_URL,
+                              value=flavor_id, fields=fields)
 
         return response
 
@@ -993,33 +1883,63 @@ class OctaviaAPI(api.BaseAPI):
 
         return response
 
+    @correct_return_codes
+    def iter_flavorprofiles(self, **kwargs):
+        """Iterate over all flavor profiles page by page
+
+        :param kwargs:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            A generator of flavor profiles
+        """
+        url = const.BASE_FLAVORPROFILE_URL
+        yield from self._iter(url, const.FLAVORPROFILE_RESOURCES, **kwargs)
+
+    @correct_return_codes
+    def count_flavorprofiles(self, group_by=None, **kwargs):
+        """Count the flavor profiles, without listing them
+
+        :param string group_by:
+            A field to count the flavor profiles for each value of
+        :param kwargs:
+            Parameters to filter on
+        :return:
+            The number of flavor profiles, or a dict of their number for each
+            value of the ``group_by`` field
+        """
+        url = const.BASE_FLAVORPROFILE_URL
+        return self._count(url, const.FLAVORPROFILE_RESOURCES,
+                           group_by=group_by, **kwargs)
+
     @correct_return_codes
     def flavorprofile_list(self, **kwargs):
         """List all flavor profiles
 
         :param kwargs:
-            Parameters to filter on
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
         :return:
             List of flavor profile
         """
-        url = const.BASE_FLAVORPROFILE_URL
-        response = self._list(url, get_all=True,
-                              resources=const.FLAVORPROFILE_RESOURCES,
-                              **kwargs)
+        items = self.iter_flavorprofiles(**kwargs)
+        response = {const.FLAVORPROFILE_RESOURCES: list(items)}
 
         return response
 
     @correct_return_codes
-    def flavorprofile_show(self, flavorprofile_id):
+    def flavorprofile_show(self, flavorprofile_id, fields=None):
         """Show a flavor profile
 
         :param string flavorprofile_id:
             ID of the flavor profile to show
+        :param list fields:
+            Only return these fields of the resource
         :return:
             A dict of the specified flavor profile's settings
         """
         response = self._find(path=const.BASE_FLAVORPROFILE_URL,
-                              value=flavorprofile_id)
+                              value=flavorprofile_id, fields=fields)
 
         return response
 
@@ -1053,19 +1973,47 @@ class OctaviaAPI(api.BaseAPI):
 
         return response
 
+    @correct_return_codes
+    def iter_availabilityzones(self, **kwargs):
+        """Iterate over all availabilityzones page by page
+
+        :param kwargs:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            A generator of availabilityzones
+        """
+        url = const.BASE_AVAILABILITYZONE_URL
+        yield from self._iter(url, const.AVAILABILITYZONE_RESOURCES, **kwargs)
+
+    @correct_return_codes
+    def count_availabilityzones(self, group_by=None, **kwargs):
+        """Count the availabilityzones, without listing them
+
+        :param string group_by:
+            A field to count the availabilityzones for each value of
+        :param kwargs:
+            Parameters to filter on
+        :return:
+            The number of availabilityzones, or a dict of their number for each
+            value of the ``group_by`` field
+        """
+        url = const.BASE_AVAILABILITYZONE_URL
+        return self._count(url, const.AVAILABILITYZONE_RESOURCES,
+                           key='name', group_by=group_by, **kwargs)
+
     @correct_return_codes
     def availabilityzone_list(self, **kwargs):
         """List all availabilityzones
 
         :param kwargs:
-            Parameters to filter on
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
         :return:
             A ``dict`` containing a list of availabilityzone
         """
-        url = const.BASE_AVAILABILITYZONE_URL
-        response = self._list(path=url, get_all=True,
-                              resources=const.AVAILABILITYZONE_RESOURCES,
-                              **kwargs)
+        items = self.iter_availabilityzones(**kwargs)
+        response = {const.AVAILABILITYZONE_RESOURCES: list(items)}
 
         return response
 
@@ -1116,16 +2064,18 @@ class OctaviaAPI(api.BaseAPI):
         return response
 
     @correct_return_codes
-    def availabilityzone_show(self, availabilityzone_name):
+    def availabilityzone_show(self, availabilityzone_name, fields=None):
         """Show a availabilityzone
 
         :param string availabilityzone_name:
             Name of the availabilityzone to show
+        :param list fields:
+            Only return these fields of the resource
         :return:
             A dict of the specified availabilityzone's settings
         """
         response = self._find(path=const.BASE_AVAILABILITYZONE_URL,
-                              value=availabilityzone_name)
+                              value=availabilityzone_name, fields=fields)
 
         return response
 
@@ -1145,33 +2095,65 @@ class OctaviaAPI(api.BaseAPI):
         return response
 
     @correct_return_codes
-    def availabilityzoneprofile_list(self, **kwargs):
-        """List all availabilityzone profiles
+    def iter_availabilityzoneprofiles(self, **kwargs):
+        """Iterate over all availabilityzone profiles page by page
 
+        :param kwargs:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            A generator of availabilityzone profiles
+        """
+        url = const.BASE_AVAILABILITYZONEPROFILE_URL
+        resources = const.AVAILABILITYZONEPROFILE_RESOURCES
+        yield from self._iter(url, resources, **kwargs)
+
+    @correct_return_codes
+    def count_availabilityzoneprofiles(self, group_by=None, **kwargs):
+        """Count the availabilityzone profiles, without listing them
+
+        :param string group_by:
+            A field to count the profiles for each value of
         :param kwargs:
             Parameters to filter on
         :return:
-            List of availabilityzone profile
+            The number of availabilityzone profiles, or a dict of their
+            number for each value of the ``group_by`` field
         """
         url = const.BASE_AVAILABILITYZONEPROFILE_URL
         resources = const.AVAILABILITYZONEPROFILE_RESOURCES
-        response = self._list(url, get_all=True,
-                              resources=resources,
-                              **kwargs)
+        return self._count(url, resources, group_by=group_by, **kwargs)
+
+    @correct_return_codes
+    def availabilityzoneprofile_list(self, **kwargs):
+        """List all availabilityzone profiles
+
+        :param kwargs:
+            Parameters to filter on, ``limit``, ``marker`` and ``sort``
+            included
+        :return:
+            List of availabilityzone profile
+        """
+        items = self.iter_availabilityzoneprofiles(**kwargs)
+        response = {const.AVAILABILITYZONEPROFILE_RESOURCES: list(items)}
 
         return response
 
     @correct_return_codes
-    def availabilityzoneprofile_show(self, availabilityzoneprofile_id):
+    def availabilityzoneprofile_show(self, availabilityzoneprofile_id,
+                                     fields=None):
         """Show a availabilityzone profile
 
         :param string availabilityzoneprofile_id:
             ID of the availabilityzone profile to show
+        :param list fields:
+            Only return these fields of the resource
         :return:
             A dict of the specified availabilityzone profile's settings
         """
         response = self._find(path=const.BASE_AVAILABILITYZONEPROFILE_URL,
-                              value=availabilityzoneprofile_id)
+                              value=availabilityzoneprofile_id,
+                              fields=fields)
 
         return response
 
@@ -0,0 +1,135 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""Poll strategies used while waiting for a resource status"""
+
+import abc
+import random
+import time
+
+from octaviaclient.api import exceptions
+
+DEFAULT_INITIAL_INTERVAL = 0.5
+DEFAULT_MAX_INTERVAL = 3
+DEFAULT_FACTOR = 2
+DEFAULT_JITTER = 0.1
+
+
+class PollStrategy(abc.ABC):
+    """Base class of the poll strategies
+
+    A strategy produces the delays, in seconds, to sleep between two status
+    polls. The first poll always happens right away.
+    """
+
+    @abc.abstractmethod
+    def delays(self):
+        """Returns an iterator of the delays between two polls"""
+
+
+class FixedPoll(PollStrategy):
+    """Polls at a fixed interval
+
+    :param interval:
+        Seconds between two polls
+    """
+
+    def __init__(self, interval=DEFAULT_MAX_INTERVAL):
+        self.interval = interval
+
+    def delays(self):
+        while True:
+            yield self.interval
+
+
+class BackoffPoll(PollStrategy):
+    """Polls with an exponential backoff, capped and with jitter
+
+    :param initial:
+        Seconds between the first and the second poll
+    :param max_interval:
+        Maximum number of seconds between two polls
+    :param factor:
+        Multiplier applied to the delay after each poll
+    :param jitter:
+        Fraction of the delay randomly added or removed, so that clients
+        started together do not poll in lockstep
+    """
+
+    def __init__(self, initial=DEFAULT_INITIAL_INTERVAL,
+                 max_interval=DEFAULT_MAX_INTERVAL, factor=DEFAULT_FACTOR,
+                 jitter=DEFAULT_JITTER):
+        self.initial = initial
+        self.max_interval = max_interval
+        self.factor = factor
+        self.jitter = jitter
+
+    def delays(self):
+        delay = self.initial
+        while True:
+            jittered = delay * random.uniform(1 - self.jitter,
+                                              1 + self.jitter)
+            yield min(jittered, self.max_interval)
+            delay = min(delay * self.factor, self.max_interval)
+
+
+def get_strategy(poll_interval=None):
+    """Returns the poll strategy for a maximum poll interval
+
+    :param poll_interval:
+        Maximum number of seconds between two polls, ``None`` for the
+        default
+    :return:
+        A :class:`BackoffPoll` capped at ``poll_interval``
+    """
+    if poll_interval is None:
+        return BackoffPoll()
+    return BackoffPoll(initial=min(DEFAULT_INITIAL_INTERVAL, poll_interval),
+                       max_interval=poll_interval)
+
+
+class Poller(object):
+    """Sleeps between the polls of a single wait
+
+    :param strategy:
+        The :class:`PollStrategy` to follow, a :class:`BackoffPoll` by
+        default
+    :param timeout:
+        Maximum number of seconds to wait overall, ``None`` waits forever
+    """
+
+    def __init__(self, strategy=None, timeout=None):
+        self._delays = (strategy or BackoffPoll()).delays()
+        self.timeout = timeout
+        self.deadline = None
+        if timeout is not None:
+            self.deadline = time.monotonic() + timeout
+
+    def sleep(self, *args):
+        """Sleeps until the next poll
+
+        Extra arguments are ignored so the method can be used as the
+        progress callback of the osc-lib wait helpers.
+
+        :raises OctaviaClientException:
+            When the timeout is reached
+        """
+        delay = next(self._delays)
+        if self.deadline is not None:
+            remaining = self.deadline - time.monotonic()
+            if remaining <= 0:
+                raise exceptions.OctaviaClientException(
+                    code="n/a",
+                    message="Timed out after {} seconds waiting for the "
+                            "resource.".format(self.timeout))
+            delay = min(delay, remaining)
+        time.sleep(delay)
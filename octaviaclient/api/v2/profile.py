@@ -0,0 +1,161 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""Recording of the HTTP requests sent by an OctaviaAPI"""
+
+import collections
+import functools
+import json
+import re
+import threading
+
+from octaviaclient.api import constants as const
+
+FORMATS = ('table', 'json')
+
+
+# Compiled on first use, the plugin imports this module at every startup
+@functools.lru_cache(maxsize=None)
+def _templates():
+    templates = []
+    for name in dir(const):
+        if not (name.startswith('BASE_') and name.endswith('_URL')):
+            continue
+        template = getattr(const, name)
+        pattern = re.sub(r'\\{\w+\\}', '[^/]+', re.escape(template))
+        templates.append((template.count('{'), template,
+                          re.compile(pattern + '$')))
+    # The most literal template wins, e.g. quotas/defaults over quotas/{uuid}
+    return sorted(templates)
+
+
+def path_template(url):
+    """Returns the constant URL template a request path matches
+
+    :param string url:
+        The path of the request, relative to the endpoint
+    :return:
+        The template, e.g. ``/lbaas/loadbalancers/{uuid}``, or the path if
+        no template matches
+    """
+    path = '/' + url.split('?', 1)[0].strip('/')
+    for _, template, pattern in _templates():
+        if pattern.match(path):
+            return template
+    return path
+
+
+# The paginated collections, each GET on them is a page of a listing
+COLLECTIONS = frozenset((
+    const.BASE_LOADBALANCER_URL, const.BASE_LISTENER_URL, const.BASE_POOL_URL,
+    const.BASE_MEMBER_URL, const.BASE_HEALTH_MONITOR_URL,
+    const.BASE_L7POLICY_URL, const.BASE_L7RULE_URL, const.BASE_QUOTA_URL,
+    const.BASE_AMPHORA_URL, const.BASE_PROVIDER_URL,
+    const.BASE_PROVIDER_FLAVOR_CAPABILITY_URL,
+    const.BASE_PROVIDER_AVAILABILITY_ZONE_CAPABILITY_URL,
+    const.BASE_FLAVOR_URL, const.BASE_FLAVORPROFILE_URL,
+    const.BASE_AVAILABILITYZONE_URL, const.BASE_AVAILABILITYZONEPROFILE_URL,
+))
+
+
+class Profiler(object):
+    """Records the HTTP requests sent by an OctaviaAPI
+
+    Each request is recorded with its method, path template, status code,
+    latency and size of the response body on the wire.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def record(self, method, url, status, latency, size):
+        """Records a request
+
+        :param string method:
+            The HTTP method
+        :param string url:
+            The path of the request, relative to the endpoint
+        :param int status:
+            The HTTP status code, ``None`` if no response was received
+        :param float latency:
+            Seconds until the response was received
+        :param int size:
+            Bytes of response body received
+        """
+        template = path_template(url)
+        with self._lock:
+            self.requests.append({
+                'method': method, 'path': template, 'status': status,
+                'latency': latency, 'bytes': size,
+                'page': method == 'GET' and template in COLLECTIONS})
+
+    def summary(self):
+        """Returns the requests aggregated by method and path template
+
+        :return:
+            A list of dicts with the ``method``, ``path``, number of
+            ``calls``, of listing ``pages`` and of ``errors``, total
+            ``latency`` and ``bytes`` of each group, and a final ``TOTAL``
+            group
+        """
+        groups = collections.OrderedDict()
+        with self._lock:
+            requests = list(self.requests)
+        for request in requests + [dict(r, method='TOTAL', path='')
+                                   for r in requests]:
+            group = groups.setdefault(
+                (request['method'], request['path']),
+                {'method': request['method'], 'path': request['path'],
+                 'calls': 0, 'pages': 0, 'errors': 0, 'latency': 0.0,
+                 'bytes': 0})
+            group['calls'] += 1
+            group['pages'] += int(request['page'])
+            group['errors'] += int(not request['status'] or
+                                   request['status'] >= 400)
+            group['latency'] += request['latency']
+            group['bytes'] += request['bytes'] or 0
+        return list(groups.values())
+
+    def report(self, stream, fmt='table'):
+        """Writes the summary of the requests
+
+        :param stream:
+            The file to write to
+        :param string fmt:
+            ``table`` or ``json``
+        """
+        summary = self.summary()
+        if fmt == 'json':
+            json.dump({'summary': summary, 'requests': self.requests},
+                      stream, indent=2)
+            stream.write('\n')
+            return
+
+        if not summary:
+            stream.write('Load balancer API requests: none\n')
+            return
+
+        columns = ('method', 'path', 'calls', 'pages', 'errors', 'latency',
+                   'bytes')
+        rows = [[str(group[c]) if c != 'latency'
+                 else '{:.1f}'.format(group[c] * 1000) for c in columns]
+                for group in summary]
+        header = [c.upper() if c != 'latency' else 'MS' for c in columns]
+        widths = [max(len(v) for v in column)
+                  for column in zip(header, *rows)]
+        stream.write('Load balancer API requests:\n')
+        for row in [header] + rows:
+            cells = [value.ljust(width) if index < 2 else value.rjust(width)
+                     for index, (value, width) in enumerate(zip(row,
+                                                                widths))]
+            stream.write('  '.join(cells).rstrip() + '\n')
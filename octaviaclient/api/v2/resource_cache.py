@@ -0,0 +1,143 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""In-process cache of the resources shown through an OctaviaAPI"""
+
+import collections
+import copy
+import threading
+import time
+
+from oslo_utils import uuidutils
+
+DEFAULT_MAXSIZE = 1000
+
+# IDs shared by unrelated resources, which do not tie them together
+_IGNORED_REFERENCES = ('project_id', 'tenant_id')
+
+
+def _references(value, refs=None):
+    """Returns the IDs found anywhere in a resource or request body"""
+    if refs is None:
+        refs = set()
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key not in _IGNORED_REFERENCES:
+                _references(item, refs)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _references(item, refs)
+    elif isinstance(value, str) and uuidutils.is_uuid_like(value):
+        refs.add(value)
+    return refs
+
+
+def _path(url):
+    return url.split('?', 1)[0].strip('/')
+
+
+class ResourceCache(object):
+    """A TTL and LRU bounded cache of resources, keyed by URL
+
+    Resources in a transitional (``PENDING_*``) provisioning status are not
+    cached, so polling a resource until it is ``ACTIVE`` always hits the
+    API. Entries are copied in and out of the cache, callers can modify
+    what they get.
+
+    :param int ttl:
+        Seconds an entry stays valid
+    :param int maxsize:
+        Number of entries kept, the least recently used ones are evicted
+        first
+    """
+
+    def __init__(self, ttl, maxsize=DEFAULT_MAXSIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url, fields=None):
+        """Returns a cached resource
+
+        :param string url:
+            The URL of the resource
+        :param list fields:
+            The fields the resource was requested with
+        :return:
+            A copy of the resource, or ``None``
+        """
+        key = (_path(url), tuple(fields or ()))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(entry[1])
+
+    def set(self, url, value, fields=None):
+        """Caches a resource
+
+        :param string url:
+            The URL of the resource
+        :param value:
+            The resource
+        :param list fields:
+            The fields the resource was requested with
+        """
+        status = value.get('provisioning_status') if isinstance(
+            value, dict) else None
+        if status and status.startswith('PENDING'):
+            return
+        key = (_path(url), tuple(fields or ()))
+        entry = (time.monotonic() + self.ttl, copy.deepcopy(value),
+                 _references(value))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url, *bodies):
+        """Drops the entries a change to a resource may have made stale
+
+        These are the resource itself, its parents and children in the URL
+        (e.g. the pool of a member, the members of a pool), and any resource
+        referring to the ID of one of them or to an ID found in ``bodies``
+        (e.g. the load balancer of a new listener).
+
+        :param string url:
+            The URL of the resource created, updated or deleted
+        :param bodies:
+            The request and response bodies of the change
+        """
+        target = _path(url)
+        segments = target.split('/')
+        ancestors = {'/'.join(segments[:i])
+                     for i in range(1, len(segments) + 1)}
+        refs = _references(segments)
+        for body in bodies:
+            _references(body, refs)
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                path = key[0]
+                if (path in ancestors or path.startswith(target + '/') or
+                        refs & entry[2]):
+                    del self._entries[key]
+
+    def clear(self):
+        """Drops all the entries"""
+        with self._lock:
+            self._entries.clear()
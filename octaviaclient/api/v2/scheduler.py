@@ -0,0 +1,282 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""Load balancer aware scheduler for Octavia API mutations
+
+Any create, update or delete of an object puts the load balancer that owns
+it into a PENDING_* provisioning status, and the API rejects other mutations
+on that load balancer with a 409 until it is ACTIVE again. The scheduler
+groups the submitted operations by owning load balancer, runs the operations
+of each load balancer in submission order, waiting for it to be ACTIVE
+between them, and processes different load balancers in parallel.
+"""
+from concurrent import futures
+
+from osc_lib import exceptions as osc_exc
+
+from octaviaclient.api import exceptions
+from octaviaclient.api.v2 import poll
+
+DEFAULT_MAX_WORKERS = 8
+
+ACTIVE = 'ACTIVE'
+ERROR = 'ERROR'
+
+
+class Operation(object):
+    """A mutation submitted to the scheduler
+
+    ``parent`` is the ``(type, ID)`` of the object the load balancer is
+    looked up from, ``None`` for a load balancer creation. Once the
+    scheduler has run, ``result`` holds the value returned by the API method
+    and ``error`` the exception it raised, if any.
+    """
+
+    def __init__(self, method, *args, **kwargs):
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self.parent = None
+        self.loadbalancer_id = None
+        self.result = None
+        self.error = None
+
+    def __repr__(self):
+        return '<Operation {}{}>'.format(self.method, self.args)
+
+
+class MutationScheduler(object):
+    """Runs API mutations serialized per load balancer
+
+    :param api:
+        The OctaviaAPI instance to run the operations with
+    :param int max_workers:
+        Maximum number of load balancers processed in parallel
+    :param strategy:
+        The :class:`~octaviaclient.api.v2.poll.PollStrategy` used while
+        waiting for a load balancer, exponential backoff by default
+    :param timeout:
+        Maximum number of seconds to wait for a load balancer to become
+        ACTIVE after each operation, ``None`` waits forever
+    :param bool wait:
+        Wait for the load balancer after its last operation too. When
+        ``False``, only the operations followed by another one on the same
+        load balancer are waited on.
+    """
+
+    def __init__(self, api, max_workers=DEFAULT_MAX_WORKERS,
+                 strategy=None, timeout=None, *, wait=True):
+        self.api = api
+        self.max_workers = max_workers
+        self.strategy = strategy
+        self.timeout = timeout
+        self.wait = wait
+        self._operations = []
+        self._parents = {}
+
+    def submit(self, method, *args, **kwargs):
+        """Queue an operation
+
+        :param string method:
+            Name of the OctaviaAPI method to call, e.g. ``member_create``
+        :param args:
+            Positional arguments of the method
+        :param kwargs:
+            Keyword arguments of the method
+        :return:
+            The queued :class:`Operation`
+        :raises ValueError:
+            When the method is not the mutation of a load balancer or of one
+            of its objects, or its arguments lack the parent object
+        """
+        if (not method.endswith(('_create', '_set', '_delete',
+                                 '_failover', '_batch_update')) or
+                not callable(getattr(self.api, method, None))):
+            msg = '{} is not a mutation'.format(method)
+            raise ValueError(msg)
+        operation = Operation(method, *args, **kwargs)
+        operation.parent = self._get_parent(operation)
+        self._operations.append(operation)
+        return operation
+
+    def run(self):
+        """Run all queued operations
+
+        Operations failing to look up their load balancer, or queued after a
+        failed operation on the same load balancer, are not run and have
+        their ``error`` set.
+
+        :return:
+            The list of operations, in submission order
+        """
+        operations, self._operations = self._operations, []
+
+        queues = {}
+        for operation in operations:
+            try:
+                key = self._get_loadbalancer_id(operation.parent)
+            except Exception as e:
+                operation.error = e
+                continue
+            operation.loadbalancer_id = key
+            # Load balancer creations get a queue of their own
+            queues.setdefault(key or operation, []).append(operation)
+
+        with futures.ThreadPoolExecutor(self.max_workers) as executor:
+            for f in [executor.submit(self._run_queue, q)
+                      for q in queues.values()]:
+                f.result()
+
+        return operations
+
+    def _run_queue(self, operations):
+        for i, operation in enumerate(operations):
+            try:
+                operation.result = getattr(self.api, operation.method)(
+                    *operation.args, **operation.kwargs)
+                if self.wait or i + 1 < len(operations):
+                    self._wait(operation)
+            except Exception as e:
+                operation.error = e
+                for skipped in operations[i + 1:]:
+                    skipped.error = exceptions.OctaviaClientException(
+                        code='n/a',
+                        message='Not run, a previous operation on load '
+                                'balancer {} failed: {}'.format(
+                                    operation.loadbalancer_id, e))
+                return
+
+    def _wait(self, operation):
+        lb_id = operation.loadbalancer_id
+        if operation.method == 'load_balancer_create':
+            lb_id = operation.result['loadbalancer']['id']
+            operation.loadbalancer_id = lb_id
+        deleted = operation.method == 'load_balancer_delete'
+
+        poller = poll.Poller(strategy=self.strategy, timeout=self.timeout)
+        while True:
+            try:
+                status = self.api.load_balancer_show(lb_id)[
+                    'provisioning_status']
+            except (exceptions.OctaviaClientException,
+                    osc_exc.NotFound) as e:
+                if deleted and e.code == 404:
+                    return
+                raise
+            if status == ACTIVE and not deleted:
+                return
+            if status == ERROR:
+                raise exceptions.OctaviaClientException(
+                    code='n/a',
+                    message='Load balancer {} went into ERROR status.'.format(
+                        lb_id))
+            poller.sleep()
+
+    def _get_parent(self, operation):
+        """Find the parent object of an operation in its arguments
+
+        :return:
+            The ``(type, ID)`` of the object, ``None`` for a load balancer
+            creation
+        :raises ValueError:
+            When the method has no known parent or it is missing from the
+            arguments
+        """
+        method = operation.method
+        args = operation.args
+        kwargs = operation.kwargs
+        body = kwargs.get('json') or {}
+
+        def arg(index, name):
+            if name in kwargs:
+                return kwargs[name]
+            return args[index]
+
+        try:
+            if method == 'load_balancer_create':
+                return None
+            if method.startswith('load_balancer_'):
+                return 'loadbalancer', arg(0, 'lb_id')
+            if method == 'listener_create':
+                return 'loadbalancer', body['listener']['loadbalancer_id']
+            if method.startswith('listener_'):
+                return 'listener', arg(0, 'listener_id')
+            if method == 'pool_create':
+                pool = body['pool']
+                if pool.get('loadbalancer_id'):
+                    return 'loadbalancer', pool['loadbalancer_id']
+                return 'listener', pool['listener_id']
+            if method.startswith(('pool_', 'member_')):
+                return 'pool', arg(0, 'pool_id')
+            if method == 'health_monitor_create':
+                return 'pool', body['healthmonitor']['pool_id']
+            if method.startswith('health_monitor_'):
+                return 'healthmonitor', arg(0, 'health_monitor_id')
+            if method == 'l7policy_create':
+                return 'listener', body['l7policy']['listener_id']
+            if method.startswith('l7policy_'):
+                return 'l7policy', arg(0, 'l7policy_id')
+            if method == 'l7rule_create':
+                return 'l7policy', arg(0, 'l7policy_id')
+            if method.startswith('l7rule_'):
+                return 'l7policy', arg(1, 'l7policy_id')
+        except (KeyError, IndexError, TypeError) as e:
+            msg = 'Unable to find the parent object of {}{}'.format(
+                method, args)
+            raise ValueError(msg) from e
+        msg = '{} is not the mutation of a load balancer object'.format(
+            method)
+        raise ValueError(msg)
+
+    def _get_loadbalancer_id(self, parent):
+        """Find the load balancer owning the parent object of an operation
+
+        :return:
+            The load balancer ID, or ``None`` for a load balancer creation
+        """
+        if parent is None:
+            return None
+        resource, res_id = parent
+        if resource == 'loadbalancer':
+            return res_id
+        return {'listener': self._listener_lb,
+                'pool': self._pool_lb,
+                'healthmonitor': self._health_monitor_lb,
+                'l7policy': self._l7policy_lb}[resource](res_id)
+
+    def _cached(self, key, fetch):
+        if key not in self._parents:
+            self._parents[key] = fetch()
+        return self._parents[key]
+
+    def _listener_lb(self, listener_id):
+        return self._cached(
+            ('listener', listener_id),
+            lambda: self.api.listener_show(
+                listener_id)['loadbalancers'][0]['id'])
+
+    def _pool_lb(self, pool_id):
+        return self._cached(
+            ('pool', pool_id),
+            lambda: self.api.pool_show(pool_id)['loadbalancers'][0]['id'])
+
+    def _health_monitor_lb(self, health_monitor_id):
+        return self._cached(
+            ('healthmonitor', health_monitor_id),
+            lambda: self._pool_lb(self.api.health_monitor_show(
+                health_monitor_id)['pools'][0]['id']))
+
+    def _l7policy_lb(self, l7policy_id):
+        return self._cached(
+            ('l7policy', l7policy_id),
+            lambda: self._listener_lb(self.api.l7policy_show(
+                l7policy_id)['listener_id']))
@@ -0,0 +1,89 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""Coalescing of identical concurrent calls"""
+
+import threading
+
+
+class _Flight(object):
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Shares the result of a call among the threads making it concurrently
+
+    The first thread calling :meth:`do` with a key runs the call, the
+    threads calling it with the same key before the call returns wait for
+    it and get its result, or its exception, instead of running their own.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key, func, *args, **kwargs):
+        """Runs ``func(*args, **kwargs)`` unless a call with key is running
+
+        :param key:
+            A hashable identifying the call
+        :param func:
+            The function to call
+        :return:
+            The result of the running call or of ``func``
+        """
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func(*args, **kwargs)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.done.set()
+
+    def forget(self):
+        """Lets the calls made from now on run even if one is in progress
+
+        To be called after a change, so that the calls made after it do not
+        get a result read before it.
+        """
+        with self._lock:
+            self._flights.clear()
+
+    def stats(self):
+        """Returns the number of calls made and of calls coalesced"""
+        with self._lock:
+            return {'calls': self.calls, 'coalesced': self.coalesced}
@@ -10,15 +10,21 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 """OpenStackClient plugin for Load Balancer service."""
+import atexit
 import logging
+import sys
 
 from osc_lib import utils
 
-from octaviaclient.api.v2 import octavia
+from octaviaclient.api.v2 import profile
 
 LOG = logging.getLogger(__name__)
 
 DEFAULT_LOADBALANCER_API_VERSION = '2.0'
+DEFAULT_LOADBALANCER_PREFETCH_DEPTH = 0
+DEFAULT_LOADBALANCER_NAME_CACHE_TTL = 0
+DEFAULT_LOADBALANCER_POOL_MAXSIZE = 0
+DEFAULT_LOADBALANCER_RESOURCE_CACHE_TTL = 0
 API_VERSION_OPTION = 'os_loadbalancer_api_version'
 API_NAME = 'load_balancer'
 LOAD_BALANCER_API_TYPE = 'loadbalancer'
@@ -29,19 +35,49 @@ LOAD_BALANCER_API_VERSIONS = {
 
 def make_client(instance):
     """Returns a load balancer service client"""
+    # Deferred, the plugin is loaded by every openstack command while the
+    # client is only built for the load balancer ones
+    # pylint: disable-next=import-outside-toplevel
+    from octaviaclient.api.v2 import octavia
+
     endpoint = instance.get_endpoint_for_service_type(
         'load-balancer',
         region_name=instance.region_name,
         interface=instance.interface,
     )
+    # A deep copy of the options, read once for all of them
+    config = instance.get_configuration()
+    profiler = None
+    profile_format = _get_option(config, 'profile', None)
+    if profile_format:
+        profiler = profile.Profiler()
+        atexit.register(profiler.report, sys.stderr, profile_format)
     client = octavia.OctaviaAPI(
         session=instance.session,
         service_type='load-balancer',
         endpoint=endpoint,
+        prefetch_depth=_get_option(config, 'prefetch_depth',
+                                   DEFAULT_LOADBALANCER_PREFETCH_DEPTH),
+        name_cache_ttl=_get_option(config, 'name_cache_ttl',
+                                   DEFAULT_LOADBALANCER_NAME_CACHE_TTL),
+        pool_maxsize=_get_option(config, 'pool_maxsize',
+                                 DEFAULT_LOADBALANCER_POOL_MAXSIZE),
+        resource_cache_ttl=_get_option(
+            config, 'resource_cache_ttl',
+            DEFAULT_LOADBALANCER_RESOURCE_CACHE_TTL),
+        profiler=profiler,
     )
     return client
 
 
+def _get_option(config, name, default):
+    """Returns the value of a global --os-loadbalancer-<name> option"""
+    value = config.get('loadbalancer_' + name)
+    if value is None:
+        return default
+    return value
+
+
 def build_option_parser(parser):
     """Hook to add global options
 
@@ -61,4 +97,57 @@ def build_option_parser(parser):
         help='OSC Plugin API version, default=' +
              DEFAULT_LOADBALANCER_API_VERSION +
              ' (Env: OS_LOADBALANCER_API_VERSION)')
+    parser.add_argument(
+        '--os-loadbalancer-prefetch-depth',
+        metavar='<loadbalancer-prefetch-depth>',
+        type=int,
+        default=utils.env(
+            'OS_LOADBALANCER_PREFETCH_DEPTH',
+            default=DEFAULT_LOADBALANCER_PREFETCH_DEPTH),
+        help='Number of pages to request ahead in the background when '
+             'listing load balancer resources, 0 disables read-ahead, '
+             'default=' + str(DEFAULT_LOADBALANCER_PREFETCH_DEPTH) +
+             ' (Env: OS_LOADBALANCER_PREFETCH_DEPTH)')
+    parser.add_argument(
+        '--os-loadbalancer-name-cache-ttl',
+        metavar='<loadbalancer-name-cache-ttl>',
+        type=int,
+        default=utils.env(
+            'OS_LOADBALANCER_NAME_CACHE_TTL',
+            default=DEFAULT_LOADBALANCER_NAME_CACHE_TTL),
+        help='Seconds to cache on disk the IDs of load balancer resources '
+             'looked up by name, 0 disables the cache, '
+             'default=' + str(DEFAULT_LOADBALANCER_NAME_CACHE_TTL) +
+             ' (Env: OS_LOADBALANCER_NAME_CACHE_TTL)')
+    parser.add_argument(
+        '--os-loadbalancer-pool-maxsize',
+        metavar='<loadbalancer-pool-maxsize>',
+        type=int,
+        default=utils.env(
+            'OS_LOADBALANCER_POOL_MAXSIZE',
+            default=DEFAULT_LOADBALANCER_POOL_MAXSIZE),
+        help='Number of HTTP connections to the load balancer endpoint '
+             'kept open for reuse, 0 keeps the default of the session (10), '
+             'default=' + str(DEFAULT_LOADBALANCER_POOL_MAXSIZE) +
+             ' (Env: OS_LOADBALANCER_POOL_MAXSIZE)')
+    parser.add_argument(
+        '--os-loadbalancer-resource-cache-ttl',
+        metavar='<loadbalancer-resource-cache-ttl>',
+        type=int,
+        default=utils.env(
+            'OS_LOADBALANCER_RESOURCE_CACHE_TTL',
+            default=DEFAULT_LOADBALANCER_RESOURCE_CACHE_TTL),
+        help='Seconds to cache in memory the load balancer resources shown '
+             'within a command, 0 disables the cache, '
+             'default=' + str(DEFAULT_LOADBALANCER_RESOURCE_CACHE_TTL) +
+             ' (Env: OS_LOADBALANCER_RESOURCE_CACHE_TTL)')
+    parser.add_argument(
+        '--os-loadbalancer-profile',
+        metavar='<format>',
+        choices=profile.FORMATS,
+        default=utils.env('OS_LOADBALANCER_PROFILE'),
+        help='Print a summary of the HTTP requests sent to the load '
+             'balancer API (calls, pages, errors, time and bytes per '
+             'method and path) to stderr at exit, as a table or json '
+             '(Env: OS_LOADBALANCER_PROFILE)')
     return parser
@@ -73,6 +73,9 @@ class ListAmphora(lister.Lister):
             action='store_true',
             help='Show additional fields.',
         )
+        v2_utils.add_stream_argument(parser)
+        v2_utils.add_pagination_arguments(parser)
+        v2_utils.add_count_arguments(parser, const.AMPHORA_COLUMNS_LONG)
 
         return parser
 
@@ -84,7 +87,17 @@ class ListAmphora(lister.Lister):
         attrs = v2_utils.get_amphora_attrs(self.app.client_manager,
                                            parsed_args)
 
-        data = self.app.client_manager.load_balancer.amphora_list(**attrs)
+        attrs['fields'] = v2_utils.get_list_fields(parsed_args, columns)
+        attrs.update(v2_utils.get_pagination_attrs(parsed_args))
+        if v2_utils.count_only(parsed_args):
+            return v2_utils.get_count_rows(
+                self.app.client_manager.load_balancer.count_amphorae,
+                parsed_args, attrs)
+        lb_client = self.app.client_manager.load_balancer
+        if v2_utils.stream_rows(self, parsed_args):
+            data = lb_client.iter_amphorae(**attrs)
+        else:
+            data = lb_client.amphora_list(**attrs)['amphorae']
 
         formatters = {
             'amphorae': v2_utils.ListColumn,
@@ -95,7 +108,7 @@ class ListAmphora(lister.Lister):
             (utils.get_dict_properties(
                 amp,
                 columns,
-                formatters=formatters) for amp in data['amphorae']),
+                formatters=formatters) for amp in data),
         )
 
 
@@ -140,11 +153,7 @@ class ConfigureAmphora(command.Command):
             metavar='<amphora-id>',
             help='UUID of the amphora to configure.',
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         return parser
 
@@ -164,7 +173,9 @@ class ConfigureAmphora(command.Command):
                 v2_utils.wait_for_active(
                     status_f=(self.app.client_manager.load_balancer.
                               load_balancer_show),
-                    res_id=lb_id
+                    res_id=lb_id,
+                    timeout=parsed_args.wait_timeout,
+                    poll_interval=parsed_args.poll_interval
                 )
 
 
@@ -179,11 +190,7 @@ class FailoverAmphora(command.Command):
             metavar='<amphora-id>',
             help='UUID of the amphora.',
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         return parser
 
@@ -201,13 +208,17 @@ class FailoverAmphora(command.Command):
                 v2_utils.wait_for_active(
                     status_f=(self.app.client_manager.load_balancer.
                               load_balancer_show),
-                    res_id=lb_id
+                    res_id=lb_id,
+                    timeout=parsed_args.wait_timeout,
+                    poll_interval=parsed_args.poll_interval
                 )
             else:
                 v2_utils.wait_for_delete(
                     status_f=(self.app.client_manager.load_balancer.
                               amphora_show),
-                    res_id=amp_id
+                    res_id=amp_id,
+                    timeout=parsed_args.wait_timeout,
+                    poll_interval=parsed_args.poll_interval
                 )
 
 
@@ -270,11 +281,7 @@ class DeleteAmphora(command.Command):
             metavar='<amphora-id>',
             help='UUID of the amphora to delete.',
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         return parser
 
@@ -286,5 +293,7 @@ class DeleteAmphora(command.Command):
         if parsed_args.wait:
             v2_utils.wait_for_delete(
                 status_f=self.app.client_manager.load_balancer.amphora_show,
-                res_id=parsed_args.amphora_id, status_field=const.STATUS
+                res_id=parsed_args.amphora_id, status_field=const.STATUS,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
@@ -131,6 +131,8 @@ class ListAvailabilityzone(lister.Lister):
             default=None,
             help="List disabled availability zones."
         )
+        v2_utils.add_pagination_arguments(parser)
+        v2_utils.add_count_arguments(parser, const.AVAILABILITYZONE_COLUMNS)
 
         return parser
 
@@ -138,6 +140,12 @@ class ListAvailabilityzone(lister.Lister):
         columns = const.AVAILABILITYZONE_COLUMNS
         attrs = v2_utils.get_availabilityzone_attrs(self.app.client_manager,
                                                     parsed_args)
+        attrs['fields'] = v2_utils.get_list_fields(parsed_args, columns)
+        attrs.update(v2_utils.get_pagination_attrs(parsed_args))
+        if v2_utils.count_only(parsed_args):
+            return v2_utils.get_count_rows(
+                self.app.client_manager.load_balancer.count_availabilityzones,
+                parsed_args, attrs)
         data = self.app.client_manager.load_balancer.availabilityzone_list(
             **attrs)
         formatters = {'availabilityzoneprofiles': v2_utils.ListColumn}
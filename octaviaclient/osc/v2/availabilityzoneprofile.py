@@ -106,6 +106,9 @@ class ListAvailabilityzoneProfile(lister.Lister):
             help="List availability zone profiles according to their "
                  "provider.",
         )
+        v2_utils.add_pagination_arguments(parser)
+        v2_utils.add_count_arguments(
+            parser, const.AVAILABILITYZONEPROFILE_COLUMNS)
 
         return parser
 
@@ -114,6 +117,12 @@ class ListAvailabilityzoneProfile(lister.Lister):
         attrs = v2_utils.get_availabilityzoneprofile_attrs(
             self.app.client_manager, parsed_args)
         client_manager = self.app.client_manager
+        attrs['fields'] = v2_utils.get_list_fields(parsed_args, columns)
+        attrs.update(v2_utils.get_pagination_attrs(parsed_args))
+        if v2_utils.count_only(parsed_args):
+            return v2_utils.get_count_rows(
+                client_manager.load_balancer.count_availabilityzoneprofiles,
+                parsed_args, attrs)
         data = client_manager.load_balancer.availabilityzoneprofile_list(
             **attrs)
         return (columns,
@@ -133,6 +133,8 @@ class ListFlavor(lister.Lister):
             default=None,
             help="List disabled flavors."
         )
+        v2_utils.add_pagination_arguments(parser)
+        v2_utils.add_count_arguments(parser, const.FLAVOR_COLUMNS)
 
         return parser
 
@@ -140,6 +142,12 @@ class ListFlavor(lister.Lister):
         columns = const.FLAVOR_COLUMNS
         attrs = v2_utils.get_flavor_attrs(self.app.client_manager,
                                           parsed_args)
+        attrs['fields'] = v2_utils.get_list_fields(parsed_args, columns)
+        attrs.update(v2_utils.get_pagination_attrs(parsed_args))
+        if v2_utils.count_only(parsed_args):
+            return v2_utils.get_count_rows(
+                self.app.client_manager.load_balancer.count_flavors,
+                parsed_args, attrs)
         data = self.app.client_manager.load_balancer.flavor_list(
             **attrs)
         formatters = {'flavorprofiles': v2_utils.ListColumn}
@@ -104,6 +104,8 @@ class ListFlavorProfile(lister.Lister):
             metavar='<provider_name>',
             help="List flavor profiles according to their provider.",
         )
+        v2_utils.add_pagination_arguments(parser)
+        v2_utils.add_count_arguments(parser, const.FLAVORPROFILE_COLUMNS)
 
         return parser
 
@@ -111,6 +113,12 @@ class ListFlavorProfile(lister.Lister):
         columns = const.FLAVORPROFILE_COLUMNS
         attrs = v2_utils.get_flavorprofile_attrs(self.app.client_manager,
                                                  parsed_args)
+        attrs['fields'] = v2_utils.get_list_fields(parsed_args, columns)
+        attrs.update(v2_utils.get_pagination_attrs(parsed_args))
+        if v2_utils.count_only(parsed_args):
+            return v2_utils.get_count_rows(
+                self.app.client_manager.load_balancer.count_flavorprofiles,
+                parsed_args, attrs)
         data = self.app.client_manager.load_balancer.flavorprofile_list(
             **attrs)
         return (columns,
@@ -0,0 +1,40 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""Output formatters for the list commands"""
+
+import json
+
+from cliff import columns
+from cliff.formatters import base
+
+
+class NDJSONFormatter(base.ListFormatter):
+    """Writes one JSON object per row, as soon as the row is produced
+
+    The rows are neither buffered nor sorted, so a listing is written as its
+    pages are received and its size does not matter.
+    """
+
+    def add_argument_group(self, parser):
+        pass
+
+    def emit_list(self, column_names, data, stdout, parsed_args):
+        for row in data:
+            stdout.write(json.dumps({
+                name: (value.machine_readable()
+                       if isinstance(value, columns.FormattableColumn)
+                       else value)
+                for name, value in zip(column_names, row)}))
+            stdout.write('\n')
+            # Let the reader of a pipe process the rows received so far
+            stdout.flush()
@@ -135,11 +135,7 @@ class CreateHealthMonitor(command.ShowOne):
             default=None,
             help="Disable health monitor."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         _tag.add_tag_option_to_parser_for_create(
             parser, 'health monitor')
@@ -160,7 +156,9 @@ class CreateHealthMonitor(command.ShowOne):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           load_balancer_show),
-                res_id=pool['loadbalancers'][0]['id']
+                res_id=pool['loadbalancers'][0]['id'],
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
             data = {
                 'healthmonitor': (
@@ -188,11 +186,7 @@ class DeleteHealthMonitor(command.Command):
             metavar='<health_monitor>',
             help="Health monitor to delete (name or ID)."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         return parser
 
@@ -209,7 +203,9 @@ class DeleteHealthMonitor(command.Command):
             v2_utils.wait_for_delete(
                 status_f=(self.app.client_manager.load_balancer.
                           health_monitor_show),
-                res_id=health_monitor_id
+                res_id=health_monitor_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -220,6 +216,8 @@ class ListHealthMonitor(lister.Lister):
         parser = super().get_parser(prog_name)
 
         _tag.add_tag_filtering_option_to_parser(parser, 'health monitor')
+        v2_utils.add_pagination_arguments(parser)
+        v2_utils.add_count_arguments(parser, const.MONITOR_COLUMNS)
 
         return parser
 
@@ -227,6 +225,12 @@ class ListHealthMonitor(lister.Lister):
         columns = const.MONITOR_COLUMNS
         attrs = v2_utils.get_health_monitor_attrs(self.app.client_manager,
                                                   parsed_args)
+        attrs['fields'] = v2_utils.get_list_fields(parsed_args, columns)
+        attrs.update(v2_utils.get_pagination_attrs(parsed_args))
+        if v2_utils.count_only(parsed_args):
+            return v2_utils.get_count_rows(
+                self.app.client_manager.load_balancer.count_health_monitors,
+                parsed_args, attrs)
         data = self.app.client_manager.load_balancer.health_monitor_list(
             **attrs)
 
@@ -366,11 +370,7 @@ class SetHealthMonitor(command.Command):
             default=None,
             help="Disable health monitor."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         _tag.add_tag_option_to_parser_for_set(parser, 'health monitor')
 
@@ -395,7 +395,9 @@ class SetHealthMonitor(command.Command):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           health_monitor_show),
-                res_id=hm_id
+                res_id=hm_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -446,11 +448,7 @@ class UnsetHealthMonitor(command.Command):
             action='store_true',
             help="Clear the health monitor URL path."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         _tag.add_tag_option_to_parser_for_unset(parser, 'health monitor')
 
@@ -478,5 +476,7 @@ class UnsetHealthMonitor(command.Command):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           health_monitor_show),
-                res_id=hm_id
+                res_id=hm_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
@@ -107,11 +107,7 @@ class CreateL7Policy(command.ShowOne):
             default=None,
             help="Disable l7policy."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         _tag.add_tag_option_to_parser_for_create(
             parser, 'l7policy')
@@ -134,7 +130,9 @@ class CreateL7Policy(command.ShowOne):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           load_balancer_show),
-                res_id=listener['loadbalancers'][0]['id']
+                res_id=listener['loadbalancers'][0]['id'],
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
             data = {
                 'l7policy': (
@@ -160,11 +158,7 @@ class DeleteL7Policy(command.Command):
             metavar="<policy>",
             help="l7policy to delete (name or ID)."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         return parser
 
@@ -181,7 +175,9 @@ class DeleteL7Policy(command.Command):
             v2_utils.wait_for_delete(
                 status_f=(self.app.client_manager.load_balancer.
                           l7policy_show),
-                res_id=l7policy_id
+                res_id=l7policy_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -198,6 +194,8 @@ class ListL7Policy(lister.Lister):
         )
 
         _tag.add_tag_filtering_option_to_parser(parser, 'l7policy')
+        v2_utils.add_pagination_arguments(parser)
+        v2_utils.add_count_arguments(parser, const.L7POLICY_COLUMNS)
 
         return parser
 
@@ -207,6 +205,12 @@ class ListL7Policy(lister.Lister):
         attrs = v2_utils.get_l7policy_attrs(self.app.client_manager,
                                             parsed_args)
 
+        attrs['fields'] = v2_utils.get_list_fields(parsed_args, columns)
+        attrs.update(v2_utils.get_pagination_attrs(parsed_args))
+        if v2_utils.count_only(parsed_args):
+            return v2_utils.get_count_rows(
+                self.app.client_manager.load_balancer.count_l7policies,
+                parsed_args, attrs)
         data = self.app.client_manager.load_balancer.l7policy_list(**attrs)
         formatters = {'rules': v2_utils.ListColumn}
 
@@ -327,11 +331,7 @@ class SetL7Policy(command.Command):
             default=None,
             help="Disable l7policy."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         _tag.add_tag_option_to_parser_for_set(parser, 'l7policy')
 
@@ -357,7 +357,9 @@ class SetL7Policy(command.Command):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           l7policy_show),
-                res_id=l7policy_id
+                res_id=l7policy_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -387,11 +389,7 @@ class UnsetL7Policy(command.Command):
             action='store_true',
             help="Clear the l7policy redirect HTTP code."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         _tag.add_tag_option_to_parser_for_unset(parser, 'l7policy')
 
@@ -419,5 +417,7 @@ class UnsetL7Policy(command.Command):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           l7policy_show),
-                res_id=policy_id
+                res_id=policy_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
@@ -90,11 +90,7 @@ class CreateL7Rule(command.ShowOne):
             default=None,
             help="Disable l7rule."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         _tag.add_tag_option_to_parser_for_create(
             parser, 'l7rule')
@@ -122,7 +118,9 @@ class CreateL7Rule(command.ShowOne):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           load_balancer_show),
-                res_id=listener['loadbalancers'][0]['id']
+                res_id=listener['loadbalancers'][0]['id'],
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
             data = {
                 'rule': (
@@ -152,11 +150,7 @@ class DeleteL7Rule(command.Command):
             metavar="<rule_id>",
             help="l7rule to delete."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         return parser
 
@@ -175,7 +169,9 @@ class DeleteL7Rule(command.Command):
             )
             v2_utils.wait_for_delete(
                 status_f=l7rule_show,
-                res_id=attrs['l7policy_id']
+                res_id=attrs['l7policy_id'],
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -192,6 +188,8 @@ class ListL7Rule(lister.Lister):
         )
 
         _tag.add_tag_filtering_option_to_parser(parser, 'l7rule')
+        v2_utils.add_pagination_arguments(parser)
+        v2_utils.add_count_arguments(parser, const.L7RULE_COLUMNS)
 
         return parser
 
@@ -199,6 +197,12 @@ class ListL7Rule(lister.Lister):
         columns = const.L7RULE_COLUMNS
         attrs = v2_utils.get_l7rule_attrs(self.app.client_manager, parsed_args)
 
+        attrs['fields'] = v2_utils.get_list_fields(parsed_args, columns)
+        attrs.update(v2_utils.get_pagination_attrs(parsed_args))
+        if v2_utils.count_only(parsed_args):
+            return v2_utils.get_count_rows(
+                self.app.client_manager.load_balancer.count_l7rules,
+                parsed_args, attrs)
         data = self.app.client_manager.load_balancer.l7rule_list(
             **attrs
         )
@@ -310,11 +314,7 @@ class SetL7Rule(command.Command):
             default=None,
             help="Disable l7rule."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         _tag.add_tag_option_to_parser_for_set(parser, 'l7rule')
 
@@ -347,7 +347,9 @@ class SetL7Rule(command.Command):
         if parsed_args.wait:
             v2_utils.wait_for_active(
                 status_f=l7rule_show,
-                res_id=l7policy_id
+                res_id=l7policy_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -377,11 +379,7 @@ class UnsetL7Rule(command.Command):
             action='store_true',
             help="Clear the l7rule key."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
         _tag.add_tag_option_to_parser_for_unset(parser, 'l7rule')
 
         return parser
@@ -413,4 +411,6 @@ class UnsetL7Rule(command.Command):
             v2_utils.wait_for_active(
                 status_f=l7rule_show,
                 res_id=policy_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
@@ -172,11 +172,7 @@ class CreateListener(command.ShowOne):
             help="CIDR to allow access to the listener (can be set multiple "
                  "times)."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
         parser.add_argument(
             '--tls-ciphers',
             metavar='<tls_ciphers>',
@@ -250,7 +246,9 @@ class CreateListener(command.ShowOne):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           load_balancer_show),
-                res_id=data['listener']['loadbalancers'][0]['id']
+                res_id=data['listener']['loadbalancers'][0]['id'],
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
             data = {
                 'listener': (
@@ -282,11 +280,7 @@ class DeleteListener(command.Command):
             metavar="<listener>",
             help="Listener to delete (name or ID)."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         return parser
 
@@ -302,7 +296,9 @@ class DeleteListener(command.Command):
         if parsed_args.wait:
             v2_utils.wait_for_delete(
                 status_f=self.app.client_manager.load_balancer.listener_show,
-                res_id=listener_id
+                res_id=listener_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -344,6 +340,8 @@ class ListListener(lister.Lister):
         )
 
         _tag.add_tag_filtering_option_to_parser(parser, 'listener')
+        v2_utils.add_pagination_arguments(parser)
+        v2_utils.add_count_arguments(parser, const.LISTENER_COLUMNS)
 
         return parser
 
@@ -351,6 +349,12 @@ class ListListener(lister.Lister):
         columns = const.LISTENER_COLUMNS
         attrs = v2_utils.get_listener_attrs(self.app.client_manager,
                                             parsed_args)
+        attrs['fields'] = v2_utils.get_list_fields(parsed_args, columns)
+        attrs.update(v2_utils.get_pagination_attrs(parsed_args))
+        if v2_utils.count_only(parsed_args):
+            return v2_utils.get_count_rows(
+                self.app.client_manager.load_balancer.count_listeners,
+                parsed_args, attrs)
         data = self.app.client_manager.load_balancer.listener_list(**attrs)
         formatters = {'loadbalancers': v2_utils.ListColumn}
         return (columns,
@@ -527,11 +531,7 @@ class SetListener(command.Command):
             help="CIDR to allow access to the listener (can be set multiple "
                  "times)."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
         parser.add_argument(
             '--tls-ciphers',
             metavar='<tls_ciphers>',
@@ -608,7 +608,9 @@ class SetListener(command.Command):
         if parsed_args.wait:
             v2_utils.wait_for_active(
                 status_f=self.app.client_manager.load_balancer.listener_show,
-                res_id=listener_id
+                res_id=listener_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -711,11 +713,7 @@ class UnsetListener(command.Command):
             action='store_true',
             help='Clear all TLS ciphers from the listener.',
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
         parser.add_argument(
             '--alpn-protocols',
             action='store_true',
@@ -767,7 +765,9 @@ class UnsetListener(command.Command):
         if parsed_args.wait:
             v2_utils.wait_for_active(
                 status_f=self.app.client_manager.load_balancer.listener_show,
-                res_id=listener_id
+                res_id=listener_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
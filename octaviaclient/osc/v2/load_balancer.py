@@ -13,14 +13,16 @@
 
 """Load Balancer action implementation"""
 
+import json
+
 from cliff import lister
 from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 from osc_lib.utils import tags as _tag
-from oslo_serialization import jsonutils
 from oslo_utils import uuidutils
 
+from octaviaclient.api.v2 import scheduler
 from octaviaclient.osc.v2 import constants as const
 from octaviaclient.osc.v2 import utils as v2_utils
 
@@ -141,10 +143,15 @@ class CreateLoadBalancer(command.ShowOne):
             metavar='<flavor>',
             help="The name or ID of the flavor for the load balancer."
         )
+        v2_utils.add_wait_arguments(parser)
         parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
+            '--from-file',
+            metavar='<spec_file>',
+            help="Create a fully populated load balancer, with its "
+                 "listeners, pools, members, health monitors and L7 "
+                 "policies, from a YAML or JSON file. Options given on the "
+                 "command line are used for the load balancer attributes "
+                 "the file does not set."
         )
 
         _tag.add_tag_option_to_parser_for_create(
@@ -156,6 +163,10 @@ class CreateLoadBalancer(command.ShowOne):
         rows = const.LOAD_BALANCER_ROWS
         attrs = v2_utils.get_loadbalancer_attrs(self.app.client_manager,
                                                 parsed_args)
+        if parsed_args.from_file:
+            spec = v2_utils.load_spec_file(parsed_args.from_file)
+            attrs = v2_utils.get_loadbalancer_tree_attrs(
+                self.app.client_manager, spec, defaults=attrs)
         self._check_attrs(attrs)
         body = {'loadbalancer': attrs}
 
@@ -166,7 +177,9 @@ class CreateLoadBalancer(command.ShowOne):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           load_balancer_show),
-                res_id=data['loadbalancer']['id']
+                res_id=data['loadbalancer']['id'],
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
             data = {
                 'loadbalancer': (
@@ -191,7 +204,7 @@ class CreateLoadBalancer(command.ShowOne):
 
 
 class DeleteLoadBalancer(command.Command):
-    """Delete a load balancer"""
+    """Delete load balancers"""
 
     def get_parser(self, prog_name):
         parser = super().get_parser(prog_name)
@@ -199,6 +212,7 @@ class DeleteLoadBalancer(command.Command):
         parser.add_argument(
             'loadbalancer',
             metavar='<load_balancer>',
+            nargs='+',
             help="Load balancers to delete (name or ID)."
         )
         parser.add_argument(
@@ -208,28 +222,67 @@ class DeleteLoadBalancer(command.Command):
             help="Cascade the delete to all child elements of the load "
                  "balancer."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         return parser
 
     def take_action(self, parsed_args):
-        attrs = v2_utils.get_loadbalancer_attrs(self.app.client_manager,
-                                                parsed_args)
-        lb_id = attrs.pop('loadbalancer_id')
+        lb_client = self.app.client_manager.load_balancer
+        attrs = {}
+        if parsed_args.cascade:
+            attrs['cascade'] = True
+
+        lbs = parsed_args.loadbalancer
+        # The deletes are sent in parallel, the load balancers deleted are
+        # only waited on with --wait
+        mutations = scheduler.MutationScheduler(lb_client, wait=False)
+        operations = {}
+        failed = 0
+        for lb in lbs:
+            try:
+                lb_id = v2_utils.get_resource_id(
+                    lb_client.load_balancer_list, 'loadbalancers', lb)
+            except Exception as e:
+                if len(lbs) == 1:
+                    raise
+                failed += 1
+                self.log.error("Failed to delete load balancer %s: %s",
+                               lb, e)
+                continue
+            if lb_id not in operations:
+                operations[lb_id] = (lb, mutations.submit(
+                    'load_balancer_delete', lb_id=lb_id, **attrs))
+        mutations.run()
+
+        deleted = []
+        for lb_id, (lb, operation) in operations.items():
+            if operation.error is None:
+                deleted.append(lb_id)
+                continue
+            if len(lbs) == 1:
+                raise operation.error
+            failed += 1
+            self.log.error("Failed to delete load balancer %s: %s",
+                           lb, operation.error)
+
+        if parsed_args.wait and deleted:
+            v2_utils.wait_for_many(
+                list_f=lb_client.load_balancer_list,
+                resource_key='loadbalancers',
+                res_ids=deleted,
+                delete=True,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval,
+                callback=self._show_progress
+            )
 
-        self.app.client_manager.load_balancer.load_balancer_delete(
-            lb_id=lb_id, **attrs)
+        if failed:
+            msg = "{} of {} load balancers failed to delete.".format(
+                failed, len(lbs))
+            raise exceptions.CommandError(msg)
 
-        if parsed_args.wait:
-            v2_utils.wait_for_delete(
-                status_f=(self.app.client_manager.load_balancer.
-                          load_balancer_show),
-                res_id=lb_id
-            )
+    def _show_progress(self, done, total):
+        self.log.info("%d of %d load balancers deleted", done, total)
 
 
 class FailoverLoadBalancer(command.Command):
@@ -243,11 +296,7 @@ class FailoverLoadBalancer(command.Command):
             metavar='<load_balancer>',
             help="Name or UUID of the load balancer."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         return parser
 
@@ -262,7 +311,9 @@ class FailoverLoadBalancer(command.Command):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           load_balancer_show),
-                res_id=lb_id
+                res_id=lb_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -350,6 +401,9 @@ class ListLoadBalancer(lister.Lister):
         )
 
         _tag.add_tag_filtering_option_to_parser(parser, 'load balancer')
+        v2_utils.add_stream_argument(parser)
+        v2_utils.add_pagination_arguments(parser)
+        v2_utils.add_count_arguments(parser, const.LOAD_BALANCER_COLUMNS)
 
         return parser
 
@@ -358,14 +412,23 @@ class ListLoadBalancer(lister.Lister):
         attrs = v2_utils.get_loadbalancer_attrs(self.app.client_manager,
                                                 parsed_args)
 
-        data = self.app.client_manager.load_balancer.load_balancer_list(
-            **attrs)
+        attrs['fields'] = v2_utils.get_list_fields(parsed_args, columns)
+        attrs.update(v2_utils.get_pagination_attrs(parsed_args))
+        if v2_utils.count_only(parsed_args):
+            return v2_utils.get_count_rows(
+                self.app.client_manager.load_balancer.count_load_balancers,
+                parsed_args, attrs)
+        lb_client = self.app.client_manager.load_balancer
+        if v2_utils.stream_rows(self, parsed_args):
+            data = lb_client.iter_load_balancers(**attrs)
+        else:
+            data = lb_client.load_balancer_list(**attrs)['loadbalancers']
 
         return (columns,
                 (utils.get_dict_properties(
                     s, columns,
                     formatters={},
-                ) for s in data['loadbalancers']))
+                ) for s in data))
 
 
 class ShowLoadBalancer(command.ShowOne):
@@ -464,11 +527,7 @@ class SetLoadBalancer(command.Command):
             default=None,
             help="Disable load balancer."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         _tag.add_tag_option_to_parser_for_set(parser, 'load balancer')
 
@@ -492,7 +551,9 @@ class SetLoadBalancer(command.Command):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           load_balancer_show),
-                res_id=lb_id
+                res_id=lb_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -528,11 +589,7 @@ class UnsetLoadBalancer(command.Command):
             action='store_true',
             help="Clear the Custom Security Groups.",
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         _tag.add_tag_option_to_parser_for_unset(parser, 'load balancer')
 
@@ -560,7 +617,9 @@ class UnsetLoadBalancer(command.Command):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           load_balancer_show),
-                res_id=lb_id
+                res_id=lb_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -615,4 +674,4 @@ class ShowLoadBalancerStatus(command.Command):
             lb_id=lb_id
         )
         res = data.get('statuses', {})
-        print(jsonutils.dumps(res, indent=4))
+        print(json.dumps(res, indent=4))
@@ -42,6 +42,9 @@ class ListMember(lister.Lister):
         )
 
         _tag.add_tag_filtering_option_to_parser(parser, 'member')
+        v2_utils.add_stream_argument(parser)
+        v2_utils.add_pagination_arguments(parser)
+        v2_utils.add_count_arguments(parser, const.MEMBER_COLUMNS)
 
         return parser
 
@@ -50,14 +53,23 @@ class ListMember(lister.Lister):
 
         attrs = v2_utils.get_member_attrs(self.app.client_manager, parsed_args)
 
-        data = self.app.client_manager.load_balancer.member_list(
-            **attrs)
+        attrs['fields'] = v2_utils.get_list_fields(parsed_args, columns)
+        attrs.update(v2_utils.get_pagination_attrs(parsed_args))
+        if v2_utils.count_only(parsed_args):
+            return v2_utils.get_count_rows(
+                self.app.client_manager.load_balancer.count_members,
+                parsed_args, attrs)
+        lb_client = self.app.client_manager.load_balancer
+        if v2_utils.stream_rows(self, parsed_args):
+            data = lb_client.iter_members(**attrs)
+        else:
+            data = lb_client.member_list(**attrs)['members']
 
         return (columns,
                 (utils.get_dict_properties(
                     s, columns,
                     formatters={},
-                ) for s in data['members']))
+                ) for s in data))
 
 
 class ShowMember(command.ShowOne):
@@ -191,11 +203,7 @@ class CreateMember(command.ShowOne):
             default=None,
             help="Disable member."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
         parser.add_argument(
             '--request-sriov',
             action='store_true',
@@ -227,7 +235,9 @@ class CreateMember(command.ShowOne):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           load_balancer_show),
-                res_id=pool['loadbalancers'][0]['id']
+                res_id=pool['loadbalancers'][0]['id'],
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
             data = {
                 'member': (
@@ -311,11 +321,7 @@ class SetMember(command.Command):
             action='store_true',
             default=None,
             help="Set the admin_state_up to False.")
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         _tag.add_tag_option_to_parser_for_set(parser, 'member')
 
@@ -347,7 +353,9 @@ class SetMember(command.Command):
         if parsed_args.wait:
             v2_utils.wait_for_active(
                 status_f=member_show,
-                res_id=member_id
+                res_id=member_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -368,11 +376,7 @@ class DeleteMember(command.Command):
             metavar='<member>',
             help="Name or ID of the member to be deleted."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         return parser
 
@@ -393,7 +397,9 @@ class DeleteMember(command.Command):
             )
             v2_utils.wait_for_delete(
                 status_f=member_show,
-                res_id=id
+                res_id=id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -438,11 +444,7 @@ class UnsetMember(command.Command):
             action='store_true',
             help="Reset the member weight to the API default."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
         _tag.add_tag_option_to_parser_for_unset(parser, 'member')
 
         return parser
@@ -478,5 +480,57 @@ class UnsetMember(command.Command):
         if parsed_args.wait:
             v2_utils.wait_for_active(
                 status_f=member_show,
-                res_id=member_id
+                res_id=member_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
+            )
+
+
+class BatchUpdateMember(command.Command):
+    """Replace all the members of a pool in a single request"""
+
+    def get_parser(self, prog_name):
+        parser = super().get_parser(prog_name)
+
+        parser.add_argument(
+            'pool',
+            metavar='<pool>',
+            help="Pool to update the members of (name or ID)."
+        )
+        parser.add_argument(
+            'members_file',
+            metavar='<members_file>',
+            help="JSON, YAML or CSV file describing the members. CSV files "
+                 "need a header row with the member attribute names."
+        )
+        parser.add_argument(
+            '--additive-only',
+            action='store_true',
+            default=False,
+            help="Only create and update the given members, keep the "
+                 "existing members that are not listed."
+        )
+        v2_utils.add_wait_arguments(parser)
+
+        return parser
+
+    def take_action(self, parsed_args):
+        pool_id = v2_utils.get_resource_id(
+            self.app.client_manager.load_balancer.pool_list,
+            'pools', parsed_args.pool)
+        members = v2_utils.get_member_batch_attrs(
+            self.app.client_manager,
+            v2_utils.load_members_file(parsed_args.members_file))
+
+        self.app.client_manager.load_balancer.member_batch_update(
+            pool_id, members, additive_only=parsed_args.additive_only)
+
+        if parsed_args.wait:
+            pool = self.app.client_manager.load_balancer.pool_show(pool_id)
+            v2_utils.wait_for_active(
+                status_f=(self.app.client_manager.load_balancer.
+                          load_balancer_show),
+                res_id=pool['loadbalancers'][0]['id'],
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
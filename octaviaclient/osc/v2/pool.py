@@ -126,11 +126,7 @@ class CreatePool(command.ShowOne):
             default=None,
             help="Disable backend member re-encryption."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
         parser.add_argument(
             '--tls-ciphers',
             metavar='<tls_ciphers>',
@@ -173,7 +169,9 @@ class CreatePool(command.ShowOne):
             v2_utils.wait_for_active(
                 status_f=(self.app.client_manager.load_balancer.
                           load_balancer_show),
-                res_id=data['pool']['loadbalancers'][0]['id']
+                res_id=data['pool']['loadbalancers'][0]['id'],
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
             data = {
                 'pool': (
@@ -203,11 +201,7 @@ class DeletePool(command.Command):
             metavar="<pool>",
             help="Pool to delete (name or ID)."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
 
         return parser
 
@@ -220,7 +214,9 @@ class DeletePool(command.Command):
         if parsed_args.wait:
             v2_utils.wait_for_delete(
                 status_f=self.app.client_manager.load_balancer.pool_show,
-                res_id=pool_id
+                res_id=pool_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -237,12 +233,20 @@ class ListPool(lister.Lister):
         )
 
         _tag.add_tag_filtering_option_to_parser(parser, 'pool')
+        v2_utils.add_pagination_arguments(parser)
+        v2_utils.add_count_arguments(parser, const.POOL_COLUMNS)
 
         return parser
 
     def take_action(self, parsed_args):
         columns = const.POOL_COLUMNS
         attrs = v2_utils.get_pool_attrs(self.app.client_manager, parsed_args)
+        attrs['fields'] = v2_utils.get_list_fields(parsed_args, columns)
+        attrs.update(v2_utils.get_pagination_attrs(parsed_args))
+        if v2_utils.count_only(parsed_args):
+            return v2_utils.get_count_rows(
+                self.app.client_manager.load_balancer.count_pools,
+                parsed_args, attrs)
         data = self.app.client_manager.load_balancer.pool_list(**attrs)
         formatters = {'loadbalancers': v2_utils.ListColumn,
                       'members': v2_utils.ListColumn,
@@ -377,11 +381,7 @@ class SetPool(command.Command):
             default=None,
             help="disable backend associated members re-encryption."
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
         parser.add_argument(
             '--tls-ciphers',
             metavar='<tls_ciphers>',
@@ -427,7 +427,9 @@ class SetPool(command.Command):
         if parsed_args.wait:
             v2_utils.wait_for_active(
                 status_f=self.app.client_manager.load_balancer.pool_show,
-                res_id=pool_id
+                res_id=pool_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
 
 
@@ -484,11 +486,7 @@ class UnsetPool(command.Command):
             action='store_true',
             help='Clear all TLS ciphers from the pool.',
         )
-        parser.add_argument(
-            '--wait',
-            action='store_true',
-            help='Wait for action to complete.',
-        )
+        v2_utils.add_wait_arguments(parser)
         parser.add_argument(
             '--alpn-protocols',
             action='store_true',
@@ -520,5 +518,7 @@ class UnsetPool(command.Command):
         if parsed_args.wait:
             v2_utils.wait_for_active(
                 status_f=self.app.client_manager.load_balancer.pool_show,
-                res_id=pool_id
+                res_id=pool_id,
+                timeout=parsed_args.wait_timeout,
+                poll_interval=parsed_args.poll_interval
             )
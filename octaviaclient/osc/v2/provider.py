@@ -32,7 +32,9 @@ class ListProvider(lister.Lister):
 
     def take_action(self, parsed_args):
         columns = const.PROVIDER_COLUMNS
-        data = self.app.client_manager.load_balancer.provider_list()
+        fields = v2_utils.get_list_fields(parsed_args, columns)
+        data = self.app.client_manager.load_balancer.provider_list(
+            fields=fields)
 
         return (columns,
                 (utils.get_dict_properties(
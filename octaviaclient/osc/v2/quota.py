@@ -37,6 +37,8 @@ class ListQuota(lister.Lister):
             metavar='<project-id>',
             help="Name or UUID of the project."
         )
+        v2_utils.add_pagination_arguments(parser)
+        v2_utils.add_count_arguments(parser, const.QUOTA_COLUMNS)
 
         return parser
 
@@ -44,6 +46,11 @@ class ListQuota(lister.Lister):
         columns = const.QUOTA_COLUMNS
         attrs = v2_utils.get_listener_attrs(self.app.client_manager,
                                             parsed_args)
+        attrs.update(v2_utils.get_pagination_attrs(parsed_args))
+        if v2_utils.count_only(parsed_args):
+            return v2_utils.get_count_rows(
+                self.app.client_manager.load_balancer.count_quotas,
+                parsed_args, attrs)
         data = self.app.client_manager.load_balancer.quota_list(**attrs)
         formatters = {'quotas': v2_utils.ListColumn}
         return (columns,
@@ -11,21 +11,32 @@
 #   License for the specific language governing permissions and limitations
 #   under the License.
 
+from concurrent import futures
+import contextlib
+import csv
 import functools
 import ipaddress
 
 from cliff import columns
-from openstackclient.identity import common as identity_common
 from osc_lib import exceptions as osc_exc
 from osc_lib import utils
+from oslo_utils import strutils
 from oslo_utils import uuidutils
+import yaml
 
 from octaviaclient.api import exceptions
+from octaviaclient.api.v2 import poll
 from octaviaclient.osc.v2 import constants
+from octaviaclient.osc.v2 import formatters
+from octaviaclient.osc.v2 import validate
 
 
-def _map_attrs(args, source_attr_map):
+def _map_attrs(args, source_attr_map, refs=None):
+    # References the callables add to refs, see _resolve_ids, are resolved
+    # with the resource attributes
     res = {}
+    refs = [] if refs is None else refs
+    children = []
     for k, v in args.items():
         if (v is None) or (k not in source_attr_map):
             continue
@@ -33,38 +44,138 @@ def _map_attrs(args, source_attr_map):
         # Attributes with 2 values map directly to a callable
         if len(source_val) == 2:
             res[source_val[0]] = source_val[1](v)
-        # Attributes with 3 values map directly to a resource
+        # Attributes with 3 values map directly to a resource, they are
+        # resolved together once all of them are known
         elif len(source_val) == 3:
-            if not isinstance(v, list):
-                res[source_val[0]] = get_resource_id(
-                    source_val[2],
-                    source_val[1],
-                    v,
-                )
-            else:
-                res[source_val[0]] = [get_resource_id(
-                    source_val[2],
-                    source_val[1],
-                    x,
-                ) for x in v]
-
+            res[source_val[0]] = v
+            refs.append((res, source_val[0], source_val[1], source_val[2]))
         # Attributes with 4 values map to a resource with a parent
         elif len(source_val) == 4:
-            parent = source_attr_map[source_val[2]]
+            children.append((k, v, source_val))
+
+    _resolve_ids(refs)
+
+    for k, v, child in children:
+        parent = source_attr_map[child[2]]
+        parent_id = res.get(parent[0])
+        if parent_id is None:
             parent_id = get_resource_id(
                 parent[2],
                 parent[1],
-                args[source_val[2]],
-            )
-            child = source_val
-            res[child[0]] = get_resource_id(
-                child[3],
-                child[1],
-                {child[0]: str(v), parent[0]: str(parent_id)},
+                args[child[2]],
             )
+        res[child[0]] = get_resource_id(
+            child[3],
+            child[1],
+            {child[0]: str(v), parent[0]: str(parent_id)},
+        )
     return res
 
 
+# Resource types whose list API accepts several values for the id and name
+# filters
+_BULK_RESOURCES = ('subnets', 'ports', 'networks', 'security_groups')
+
+# Maximum number of resource types looked up in parallel
+_MAX_RESOLVE_WORKERS = 8
+
+
+def _resolve_ids(refs):
+    """Replaces names by IDs in place, with as few list calls as possible
+
+    The values are grouped by resource type. Each distinct value is
+    resolved once, the types supporting it with a single list call for all
+    their values, and the types are looked up concurrently. The name caches
+    involved are written once all the values are resolved.
+
+    :param refs:
+        A list of (container, key, resource_name, list_funct) tuples, the
+        value of ``container[key]`` being a name or ID, or a list of them
+    """
+    lookups = {}
+    for container, key, resource_name, list_funct in refs:
+        values = container[key]
+        if not isinstance(values, list):
+            values = [values]
+        funct, pending = lookups.setdefault(resource_name, (list_funct, []))
+        pending.extend(v for v in values if v not in pending)
+
+    def lookup(item):
+        resource_name, (list_funct, values) = item
+        return resource_name, get_resource_ids(list_funct, resource_name,
+                                               values)
+
+    caches = {}
+    for list_funct, _ in lookups.values():
+        cache = _get_name_cache(list_funct)
+        if cache:
+            caches[id(cache)] = cache
+
+    with contextlib.ExitStack() as stack:
+        for cache in caches.values():
+            stack.enter_context(cache.batch())
+        if len(lookups) > 1:
+            workers = min(len(lookups), _MAX_RESOLVE_WORKERS)
+            with futures.ThreadPoolExecutor(workers) as executor:
+                resolved = dict(executor.map(lookup, lookups.items()))
+        else:
+            resolved = dict(map(lookup, lookups.items()))
+
+    for container, key, resource_name, list_funct in refs:
+        ids = resolved[resource_name]
+        if isinstance(container[key], list):
+            container[key] = [ids[v] for v in container[key]]
+        else:
+            container[key] = ids[container[key]]
+
+
+def get_resource_ids(list_funct, resource_name, names):
+    """Converts several names or IDs of a resource type into UUIDs
+
+    Types whose API can filter on several values at once are looked up
+    with one list call by ID and one by name, the other ones with
+    :func:`get_resource_id` for each value.
+
+    :param callable list_funct:
+        A client_manager callable
+    :param resource_name:
+        The resource key name for the dictonary returned
+    :param names:
+        The names or IDs to convert
+    :return:
+        A dict mapping each name or ID to the UUID found
+    :raises osc_exc.CommandError: If more than one match or none are found
+        for a name.
+    """
+    if resource_name not in _BULK_RESOURCES or len(names) < 2:
+        return {name: get_resource_id(list_funct, resource_name, name)
+                for name in names}
+
+    ids = {}
+    uuids = [name for name in names if uuidutils.is_uuid_like(name)]
+    if uuids:
+        for resource in list_funct(id=uuids):
+            ids[resource['id']] = resource['id']
+
+    matches = {}
+    remaining = [name for name in names if name not in ids]
+    if remaining:
+        for resource in list_funct(name=remaining):
+            matches.setdefault(resource['name'], []).append(resource['id'])
+
+    for name in remaining:
+        found = matches.get(name, [])
+        if len(found) > 1:
+            msg = (f"{len(found)} {resource_name} found with name or ID "
+                   f"of {name}. Please try again with UUID")
+            raise osc_exc.CommandError(msg)
+        if not found:
+            msg = f"Unable to locate {name} in {resource_name}"
+            raise osc_exc.CommandError(msg)
+        ids[name] = found[0]
+    return ids
+
+
 def _find_resource(list_funct, resource_name, root_tag, name, parent=None):
     """Search for a resource by name and ID.
 
@@ -171,6 +282,10 @@ def get_resource_id(resource, resource_name, name):
         # Projects can be non-uuid so we need to account for this
         if resource_name == 'project':
             if name != 'non-uuid':
+                # Deferred, it loads keystoneclient which most commands
+                # never need
+                # pylint: disable-next=import-outside-toplevel
+                from openstackclient.identity import common as identity_common
                 project_id = identity_common.find_project(
                     resource,
                     name
@@ -178,25 +293,41 @@ def get_resource_id(resource, resource_name, name):
                 return project_id
             return 'non-uuid'
 
+        cache = _get_name_cache(resource)
+        if cache:
+            res_id = cache.get(resource_name, name)
+            if res_id:
+                return res_id
+
         if resource_name == 'members':
             member = _find_resource(resource, resource_name, 'members',
                                     name['member_id'], parent=name['pool_id'])
-            return member.get('id')
-
-        if resource_name == 'l7rules':
+            res_id = member.get('id')
+        elif resource_name == 'l7rules':
             l7rule = _find_resource(resource, resource_name, 'rules',
                                     name['l7rule_id'],
                                     parent=name['l7policy_id'])
-            return l7rule.get('id')
+            res_id = l7rule.get('id')
+        else:
+            resource = _find_resource(resource, resource_name, resource_name,
+                                      name)
+            res_id = resource.get(primary_key)
 
-        resource = _find_resource(resource, resource_name, resource_name, name)
-        return resource.get(primary_key)
+        if cache and res_id:
+            cache.set(resource_name, name, res_id)
+        return res_id
 
     except IndexError as e:
         msg = f"Unable to locate {name} in {resource_name}"
         raise osc_exc.CommandError(msg) from e
 
 
+def _get_name_cache(list_funct):
+    """Returns the name cache of the API a list method belongs to, if any"""
+    api = getattr(list_funct, '__self__', None)
+    return getattr(api, 'name_cache', None)
+
+
 def add_tags_attr_map(attr_map):
     tags_attr_map = {
         'tags': ('tags', list),
@@ -207,17 +338,18 @@ def add_tags_attr_map(attr_map):
     attr_map.update(tags_attr_map)
 
 
-def validate_vip_dict(vip_dict, client_manager):
+def validate_vip_dict(vip_dict, client_manager, resolve=True):
     # We have validation in two places -- _map_attrs checks sub-resources, and
     # later _check_attrs does further api-specific validation. We need both for
     # additional vips, so we may as well just do both here while we're at it.
     if 'subnet_id' not in vip_dict:
         raise osc_exc.CommandError(
             'Additional VIPs must include a subnet-id.')
-    subnet_id = get_resource_id(
-        client_manager.sdk_connection.network.subnets,
-        'subnets', vip_dict['subnet_id'])
-    vip_dict['subnet_id'] = subnet_id
+    if resolve:
+        subnet_id = get_resource_id(
+            client_manager.sdk_connection.network.subnets,
+            'subnets', vip_dict['subnet_id'])
+        vip_dict['subnet_id'] = subnet_id
     if 'ip_address' in vip_dict:
         try:
             ipaddress.ip_address(vip_dict['ip_address'])
@@ -225,31 +357,30 @@ def validate_vip_dict(vip_dict, client_manager):
             raise osc_exc.CommandError(str(e))
 
 
-def handle_additional_vips(vips, client_manager):
+def handle_additional_vips(vips, client_manager, refs=None):
+    # The subnets are added to refs when given, to be resolved by the
+    # caller with its other references
     additional_vips = []
+    resolve = refs is None
+    refs = [] if resolve else refs
     for vip in vips:
         vip_dict = {}
         parts = vip.split(',')
         for part in parts:
             k, v = part.split('=')
             vip_dict[k.replace('-', '_')] = v
-        validate_vip_dict(vip_dict, client_manager)
+        validate_vip_dict(vip_dict, client_manager, resolve=False)
         additional_vips.append(vip_dict)
+        refs.append((vip_dict, 'subnet_id', 'subnets',
+                     client_manager.sdk_connection.network.subnets))
+    if resolve:
+        _resolve_ids(refs)
 
     return additional_vips
 
 
-def handle_vip_sg_ids(vip_sgs, client_manager):
-    vip_sg_ids = []
-    for sg in vip_sgs:
-        sg_id = get_resource_id(
-            client_manager.sdk_connection.network.security_groups,
-            'security_groups', sg)
-        vip_sg_ids.append(sg_id)
-    return vip_sg_ids
-
-
 def get_loadbalancer_attrs(client_manager, parsed_args):
+    refs = []
     attr_map = {
         'name': ('name', str),
         'description': ('description', str),
@@ -303,22 +434,222 @@ def get_loadbalancer_attrs(client_manager, parsed_args):
         'additional_vip': (
             'additional_vips',
             functools.partial(
-                handle_additional_vips, client_manager=client_manager)
+                handle_additional_vips, client_manager=client_manager,
+                refs=refs)
         ),
         'vip_sg_id': (
             'vip_sg_ids',
-            functools.partial(
-                handle_vip_sg_ids, client_manager=client_manager),
+            'security_groups',
+            client_manager.sdk_connection.network.security_groups
         )
     }
     add_tags_attr_map(attr_map)
 
     _attrs = vars(parsed_args)
-    attrs = _map_attrs(_attrs, attr_map)
+    attrs = _map_attrs(_attrs, attr_map, refs=refs)
 
     return attrs
 
 
+def load_spec_file(path):
+    """Loads a YAML or JSON specification file
+
+    :param path:
+        Path of the file to load
+    :return:
+        The decoded content of the file
+    """
+    try:
+        with open(path, encoding='utf-8') as spec_file:
+            return yaml.safe_load(spec_file)
+    except (OSError, yaml.YAMLError) as e:
+        raise osc_exc.CommandError(
+            "Unable to load specification file {}: {}".format(path, e))
+
+
+def _csv_list(value):
+    return [v for v in value.split(';') if v]
+
+
+# Conversions applied to the member attributes read from a CSV file
+_MEMBER_CSV_TYPES = {
+    'protocol_port': int,
+    'weight': int,
+    'monitor_port': int,
+    'backup': functools.partial(strutils.bool_from_string, strict=True),
+    'admin_state_up': functools.partial(strutils.bool_from_string,
+                                        strict=True),
+    'request_sriov': functools.partial(strutils.bool_from_string,
+                                       strict=True),
+    'tags': _csv_list,
+}
+
+
+def load_members_file(path):
+    """Loads a list of members from a JSON, YAML or CSV file
+
+    CSV files need a header row naming the member attributes. Empty cells
+    are ignored and tags are separated by semicolons.
+
+    :param path:
+        Path of the file to load
+    :return:
+        A list of member dicts
+    """
+    if not path.lower().endswith('.csv'):
+        members = load_spec_file(path)
+        if isinstance(members, dict) and 'members' in members:
+            members = members['members']
+        return members
+
+    try:
+        with open(path, encoding='utf-8', newline='') as members_file:
+            members = []
+            for row in csv.DictReader(members_file):
+                member = {}
+                for k, v in row.items():
+                    if k is None or v is None or not v.strip():
+                        continue
+                    k = k.strip()
+                    member[k] = _MEMBER_CSV_TYPES.get(k, str)(v.strip())
+                members.append(member)
+            return members
+    except (OSError, csv.Error, ValueError) as e:
+        raise osc_exc.CommandError(
+            "Unable to load members file {}: {}".format(path, e))
+
+
+def _collect_tree_references(lb):
+    """Finds the attributes of a load balancer tree that need resolving
+
+    :param lb:
+        The fully populated load balancer dict
+    :return:
+        A list of (container, key, resource_name) tuples, one for each
+        attribute holding a name (or a list of names and IDs)
+    """
+    refs = []
+
+    def add(container, key, resource_name):
+        values = container.get(key)
+        if not isinstance(values, list):
+            values = [values]
+        # IDs, like the defaults already resolved from the command line,
+        # are used as they are
+        if not all(v is None or uuidutils.is_uuid_like(v) for v in values):
+            refs.append((container, key, resource_name))
+
+    add(lb, 'vip_subnet_id', 'subnets')
+    add(lb, 'vip_network_id', 'networks')
+    add(lb, 'vip_port_id', 'ports')
+    add(lb, 'vip_qos_policy_id', 'policies')
+    add(lb, 'vip_sg_ids', 'security_groups')
+    add(lb, 'flavor_id', 'flavors')
+    add(lb, 'project_id', 'project')
+    for vip in lb.get('additional_vips') or []:
+        add(vip, 'subnet_id', 'subnets')
+
+    for pool in _iter_tree_pools(lb):
+        for member in pool.get('members') or []:
+            add(member, 'subnet_id', 'subnets')
+    return refs
+
+
+def _iter_tree_pools(lb):
+    """Yields every pool definition of a load balancer tree"""
+    yield from lb.get('pools') or []
+    for listener in lb.get('listeners') or []:
+        if isinstance(listener.get('default_pool'), dict):
+            yield listener['default_pool']
+        for l7policy in listener.get('l7policies') or []:
+            if isinstance(l7policy.get('redirect_pool'), dict):
+                yield l7policy['redirect_pool']
+
+
+def _check_tree_pool_reference(pool, pool_names):
+    # A pool holding only a name refers to one of the load balancer pools
+    if set(pool) == {'name'} and pool['name'] not in pool_names:
+        msg = ("Pool {} is referenced but not defined in the load balancer "
+               "pools.".format(pool['name']))
+        raise osc_exc.CommandError(msg)
+
+
+def _check_tree_attrs(lb):
+    pool_names = {p.get('name') for p in lb.get('pools') or []}
+    for listener in lb.get('listeners') or []:
+        validate.check_listener_attrs(listener)
+        if isinstance(listener.get('default_pool'), dict):
+            _check_tree_pool_reference(listener['default_pool'], pool_names)
+        for l7policy in listener.get('l7policies') or []:
+            policy_attrs = dict(l7policy)
+            if isinstance(l7policy.get('redirect_pool'), dict):
+                _check_tree_pool_reference(l7policy['redirect_pool'],
+                                           pool_names)
+                policy_attrs['redirect_pool_id'] = l7policy['redirect_pool']
+            validate.check_l7policy_attrs(policy_attrs)
+            for l7rule in l7policy.get('rules') or []:
+                validate.check_l7rule_attrs(l7rule)
+    for pool in _iter_tree_pools(lb):
+        for member in pool.get('members') or []:
+            validate.check_member_attrs(member)
+
+
+def _resolve_references(client_manager, refs):
+    """Replaces names by IDs in place, see :func:`_resolve_ids`
+
+    :param client_manager:
+        The client manager of the command
+    :param refs:
+        A list of (container, key, resource_name) tuples, the value of
+        ``container[key]`` being a name or ID, or a list of them
+    """
+    network = client_manager.sdk_connection.network
+    list_functs = {
+        'subnets': network.subnets,
+        'networks': network.networks,
+        'ports': network.ports,
+        'policies': network.qos_policies,
+        'security_groups': network.security_groups,
+        'flavors': client_manager.load_balancer.flavor_list,
+        'project': client_manager.identity,
+    }
+    _resolve_ids([(container, key, resource_name, list_functs[resource_name])
+                  for container, key, resource_name in refs])
+
+
+def get_loadbalancer_tree_attrs(client_manager, spec, defaults=None):
+    """Builds the body of a fully populated load balancer create
+
+    All names found in the tree are resolved up front, each distinct value
+    only once, and every child object is validated before anything is sent
+    to the API. Values already in UUID form are not looked up.
+
+    :param client_manager:
+        The client manager of the command
+    :param spec:
+        The load balancer tree, optionally wrapped in a ``loadbalancer`` key
+    :param defaults:
+        Load balancer attributes used when the tree does not set them
+    :return:
+        The load balancer attributes, with its children
+    """
+    if isinstance(spec, dict) and 'loadbalancer' in spec:
+        spec = spec['loadbalancer']
+    if not isinstance(spec, dict):
+        raise osc_exc.CommandError(
+            "The specification must describe a single load balancer.")
+
+    lb = dict(spec)
+    for k, v in (defaults or {}).items():
+        lb.setdefault(k, v)
+
+    _check_tree_attrs(lb)
+
+    _resolve_references(client_manager, _collect_tree_references(lb))
+
+    return lb
+
+
 def get_listener_attrs(client_manager, parsed_args):
     attr_map = {
         'name': ('name', str),
@@ -470,6 +801,31 @@ def get_member_attrs(client_manager, parsed_args):
     return attrs
 
 
+def get_member_batch_attrs(client_manager, members):
+    """Validates a batch of members and resolves their subnet names
+
+    :param client_manager:
+        The client manager of the command
+    :param members:
+        A list of member dicts, using the API attribute names
+    :return:
+        The list of members to send to the API
+    """
+    if (not isinstance(members, list) or
+            not all(isinstance(m, dict) for m in members)):
+        raise osc_exc.CommandError("Members must be a list of objects.")
+
+    members = [dict(m) for m in members]
+    refs = []
+    for member in members:
+        validate.check_member_attrs(member)
+        if member.get('subnet_id') is not None:
+            refs.append((member, 'subnet_id', 'subnets'))
+    _resolve_references(client_manager, refs)
+
+    return members
+
+
 def get_l7policy_attrs(client_manager, parsed_args):
     attr_map = {
         'name': ('name', str),
@@ -781,16 +1137,237 @@ def get_unsets(parsed_args):
     return unsets
 
 
+def get_list_fields(parsed_args, columns):
+    """Returns the fields a Lister command needs from the API
+
+    :param parsed_args:
+        The parsed arguments of the command
+    :param columns:
+        The columns rendered by the command
+    :return:
+        The columns selected with ``-c``, or all rendered columns when none
+        were selected
+    """
+    selected = getattr(parsed_args, 'columns', None) or []
+    fields = [c for c in columns if c in selected]
+    return fields or list(columns)
+
+
+# Formats writing each row as soon as it is produced
+STREAM_FORMATS = ('ndjson', 'csv', 'value')
+
+
+def add_stream_argument(parser):
+    """Adds the --stream option to the parser of a Lister command"""
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Write the rows as the pages of the listing are received, '
+             'with a memory use independent of their number. The rows are '
+             'written as NDJSON unless the csv or value format is selected.',
+    )
+
+
+def stream_rows(command, parsed_args):
+    """Returns whether a Lister command should stream its rows
+
+    The rows are streamed with ``--stream`` or the ``ndjson`` format. With
+    ``--stream``, formats that need all the rows before writing any are
+    replaced by NDJSON.
+
+    :param command:
+        The Lister command
+    :param parsed_args:
+        The parsed arguments of the command
+    :return:
+        True if the rows should be produced as the pages are received
+    :raises osc_exc.CommandError: If the rows are also to be sorted
+    """
+    if getattr(parsed_args, 'stream', False):
+        if getattr(parsed_args, 'sort_columns', None):
+            msg = '--sort-column cannot be used with --stream'
+            raise osc_exc.CommandError(msg)
+        if parsed_args.formatter not in STREAM_FORMATS:
+            command.formatter = formatters.NDJSONFormatter()
+        return True
+    return getattr(parsed_args, 'formatter', None) == 'ndjson'
+
+
+SORT_DIRECTIONS = ('asc', 'desc')
+
+
+def add_pagination_arguments(parser):
+    """Adds the --limit, --marker and --sort options to a Lister command"""
+    parser.add_argument(
+        '--limit',
+        metavar='<limit>',
+        type=int,
+        help='Maximum number of resources to list, no more pages are '
+             'requested once it is reached.',
+    )
+    parser.add_argument(
+        '--marker',
+        metavar='<id>',
+        help='List the resources after the one with this ID, usually the '
+             'last one of a previous listing with --limit.',
+    )
+    parser.add_argument(
+        '--sort',
+        metavar='<key>[:<direction>][,<key>[:<direction>]...]',
+        help='Sort the resources on the server by these keys, in ascending '
+             '(asc, default) or descending (desc) direction, e.g. '
+             'updated_at:desc.',
+    )
+
+
+def get_pagination_attrs(parsed_args):
+    """Returns the pagination parameters of a Lister command for the API
+
+    :param parsed_args:
+        The parsed arguments of the command
+    :return:
+        A dict of the ``limit``, ``marker`` and ``sort`` parameters set
+        on the command line
+    :raises osc_exc.CommandError: If the limit or the sort keys are invalid
+    """
+    attrs = {}
+    limit = getattr(parsed_args, 'limit', None)
+    if limit is not None:
+        if limit < 1:
+            msg = '--limit must be a positive integer'
+            raise osc_exc.CommandError(msg)
+        attrs['limit'] = limit
+    marker = getattr(parsed_args, 'marker', None)
+    if marker:
+        attrs['marker'] = marker
+    sort = getattr(parsed_args, 'sort', None)
+    if sort:
+        keys = []
+        for key in sort.split(','):
+            name, _, direction = key.strip().partition(':')
+            if not name or (direction and direction not in SORT_DIRECTIONS):
+                msg = ("Invalid sort key '{}', expected <key>[:asc|desc]"
+                       .format(key))
+                raise osc_exc.CommandError(msg)
+            keys.append(':'.join(filter(None, (name, direction))))
+        attrs['sort'] = ','.join(keys)
+    return attrs
+
+
+def add_count_arguments(parser, columns):
+    """Adds the --count and --group-by options to a Lister command
+
+    :param parser:
+        The parser of the command
+    :param columns:
+        The columns the resources can be grouped by
+    """
+    parser.add_argument(
+        '--count',
+        action='store_true',
+        help='Print the number of resources instead of listing them. Only '
+             'their IDs are requested, with the largest page size.',
+    )
+    parser.add_argument(
+        '--group-by',
+        metavar='<column>',
+        choices=columns,
+        help='Print the number of resources for each value of this column, '
+             'e.g. provisioning_status. Implies --count.',
+    )
+
+
+def count_only(parsed_args):
+    """Returns whether a Lister command should only count the resources"""
+    return bool(getattr(parsed_args, 'count', False) or
+                getattr(parsed_args, 'group_by', None))
+
+
+def get_count_rows(count_funct, parsed_args, attrs):
+    """Returns the columns and the rows of a Lister command with --count
+
+    :param count_funct:
+        The OctaviaAPI count_* method of the resources
+    :param parsed_args:
+        The parsed arguments of the command
+    :param attrs:
+        The parameters of the listing
+    :return:
+        The ``count`` column and its row, or the --group-by column and the
+        ``count`` column with a row for each value
+    :raises osc_exc.CommandError: If a limit is also set
+    """
+    if attrs.get('limit') is not None:
+        msg = '--limit cannot be used with --count or --group-by'
+        raise osc_exc.CommandError(msg)
+    attrs = {k: v for k, v in attrs.items() if k not in ('fields', 'sort')}
+    group_by = getattr(parsed_args, 'group_by', None)
+    if group_by is None:
+        return ('count',), [(count_funct(**attrs),)]
+    counts = count_funct(group_by=group_by, **attrs)
+    return ((group_by, 'count'),
+            sorted(counts.items(), key=lambda item: str(item[0])))
+
+
+DEFAULT_DELETE_TIMEOUT = 300
+
+
 class _Munch(dict):
     __getattr__ = dict.get
 
 
-def wait_for_active(status_f, res_id):
+def add_wait_arguments(parser):
+    """Adds the --wait options to the parser of a command"""
+    parser.add_argument(
+        '--wait',
+        action='store_true',
+        help='Wait for action to complete.',
+    )
+    parser.add_argument(
+        '--wait-timeout',
+        metavar='<seconds>',
+        type=int,
+        help='Maximum number of seconds to wait with --wait '
+             '(default: no timeout).',
+    )
+    parser.add_argument(
+        '--poll-interval',
+        metavar='<seconds>',
+        type=float,
+        help='Maximum number of seconds between two status checks with '
+             '--wait (default: {}).'.format(poll.DEFAULT_MAX_INTERVAL),
+    )
+
+
+def _get_poller(timeout, poll_interval, strategy):
+    return poll.Poller(strategy=strategy or poll.get_strategy(poll_interval),
+                       timeout=timeout)
+
+
+def wait_for_active(status_f, res_id, *, timeout=None, poll_interval=None,
+                    strategy=None):
+    """Waits for a resource to reach the ACTIVE provisioning status
+
+    :param status_f:
+        Function returning the resource for its ID
+    :param res_id:
+        ID of the resource
+    :param timeout:
+        Maximum number of seconds to wait, ``None`` waits forever
+    :param poll_interval:
+        Maximum number of seconds between two polls
+    :param strategy:
+        The poll strategy to use, overrides ``poll_interval``
+    """
+    poller = _get_poller(timeout, poll_interval, strategy)
+    # The sleeps are done by the poller so they follow its strategy and
+    # honour the timeout.
     success = utils.wait_for_status(
         status_f=lambda x: _Munch(status_f(x)),
         res_id=res_id,
         status_field=constants.PROVISIONING_STATUS,
-        sleep_time=3
+        sleep_time=0,
+        callback=poller.sleep
     )
     if not success:
         raise exceptions.OctaviaClientException(
@@ -799,18 +1376,39 @@ def wait_for_active(status_f, res_id):
 
 
 def wait_for_delete(status_f, res_id,
-                    status_field=constants.PROVISIONING_STATUS):
+                    status_field=constants.PROVISIONING_STATUS, *,
+                    timeout=None, poll_interval=None, strategy=None):
+    """Waits for a resource to be deleted
+
+    :param status_f:
+        Function returning the resource for its ID
+    :param res_id:
+        ID of the resource
+    :param status_field:
+        Field holding the status of the resource
+    :param timeout:
+        Maximum number of seconds to wait, ``DEFAULT_DELETE_TIMEOUT`` if
+        ``None``
+    :param poll_interval:
+        Maximum number of seconds between two polls
+    :param strategy:
+        The poll strategy to use, overrides ``poll_interval``
+    """
     class Getter(object):
         @staticmethod
         def get(id):
             return _Munch(status_f(id))
 
+    if timeout is None:
+        timeout = DEFAULT_DELETE_TIMEOUT
+    poller = _get_poller(timeout, poll_interval, strategy)
     try:
         success = utils.wait_for_delete(
             manager=Getter,
             res_id=res_id,
             status_field=status_field,
-            sleep_time=3
+            sleep_time=0,
+            callback=poller.sleep
         )
         if not success:
             raise exceptions.OctaviaClientException(
@@ -821,6 +1419,73 @@ def wait_for_delete(status_f, res_id,
             raise
 
 
+def wait_for_many(list_f, resource_key, res_ids, *, delete=False,
+                  timeout=None, poll_interval=None, strategy=None,
+                  callback=None):
+    """Waits for several resources, sharing the sleeps between the polls
+
+    Each poll lists every pending resource by its ID and retires the ones
+    that are done. Octavia compares a repeated filter to the list of its
+    values rather than to each of them, and an unfiltered listing would
+    cost a page per thousand resources of the whole cloud, so each resource
+    is listed on its own, with only the fields needed.
+
+    :param list_f:
+        Function listing the resources, e.g. ``load_balancer_list``
+    :param resource_key:
+        The resource key of the list response, e.g. ``loadbalancers``
+    :param res_ids:
+        IDs of the resources to wait for
+    :param delete:
+        Wait for the resources to be deleted instead of ACTIVE
+    :param timeout:
+        Maximum number of seconds to wait, ``None`` waits forever, or
+        ``DEFAULT_DELETE_TIMEOUT`` seconds when waiting for deletions
+    :param poll_interval:
+        Maximum number of seconds between two polls
+    :param strategy:
+        The poll strategy to use, overrides ``poll_interval``
+    :param callback:
+        Called after each poll with the number of resources done and the
+        total number of resources
+    """
+    if timeout is None and delete:
+        timeout = DEFAULT_DELETE_TIMEOUT
+    poller = _get_poller(timeout, poll_interval, strategy)
+    pending = list(dict.fromkeys(res_ids))
+    total = len(pending)
+    failed = []
+
+    fields = ['id', constants.PROVISIONING_STATUS]
+    while pending:
+        statuses = {}
+        for res_id in pending:
+            for resource in list_f(id=res_id, fields=fields)[resource_key]:
+                statuses[resource['id']] = resource[
+                    constants.PROVISIONING_STATUS]
+        still_pending = []
+        for res_id in pending:
+            status = statuses.get(res_id, 'DELETED')
+            if status == 'ERROR' or (status == 'DELETED' and not delete):
+                failed.append(res_id)
+            elif status != ('DELETED' if delete else 'ACTIVE'):
+                still_pending.append(res_id)
+        pending = still_pending
+
+        if callback:
+            callback(total - len(pending), total)
+        if pending:
+            poller.sleep()
+
+    if failed:
+        if delete:
+            msg = "The resources {} could not be successfully deleted."
+        else:
+            msg = "The resources {} did not successfully reach ACTIVE status."
+        raise exceptions.OctaviaClientException(
+            code="n/a", message=msg.format(', '.join(failed)))
+
+
 def set_tags_for_set(resource_get, resource_id, attrs, clear_tags=False):
     if attrs.get('tags'):
         resource = resource_get(resource_id)
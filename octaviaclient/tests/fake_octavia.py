@@ -0,0 +1,883 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""In-process stand-in for the Octavia v2 API
+
+Serves load balancers, listeners, pools, members, L7 policies and rules,
+health monitors and amphorae over HTTP from memory, so the client can be
+tested and benchmarked offline through its real HTTP stack::
+
+    with fake_octavia.FakeOctavia(latency=0.005) as server:
+        server.populate(load_balancers=100, members=1000)
+        api = octavia.OctaviaAPI(session=session.Session(),
+                                 endpoint=server.endpoint)
+        api.member_list(pool_id)
+
+Listings are paginated with ``limit`` and ``marker`` and honour ``fields``,
+``sort`` and filters on any attribute. Like Octavia, the next links only
+carry the pagination parameters, and a filter given several times is
+compared to the list of its values, which matches nothing. Changes put the
+resource and its load balancer in a PENDING_* status for
+``transition_time`` seconds, during which the load balancer rejects other
+changes with a 409 like Octavia does.
+"""
+
+import argparse
+import copy
+import datetime
+import gzip
+from http import server
+import json
+import random
+import threading
+import time
+from urllib import parse as urlparse
+import uuid
+
+# Collections served
+LOADBALANCERS = 'loadbalancers'
+LISTENERS = 'listeners'
+POOLS = 'pools'
+MEMBERS = 'members'
+L7POLICIES = 'l7policies'
+L7RULES = 'rules'
+HEALTH_MONITORS = 'healthmonitors'
+AMPHORAE = 'amphorae'
+
+_KEYS = {
+    LOADBALANCERS: 'loadbalancer',
+    LISTENERS: 'listener',
+    POOLS: 'pool',
+    MEMBERS: 'member',
+    L7POLICIES: 'l7policy',
+    L7RULES: 'rule',
+    HEALTH_MONITORS: 'healthmonitor',
+    AMPHORAE: 'amphora',
+}
+
+# Collections nested under a resource of another one in the URL
+_NESTED = {MEMBERS: POOLS, L7RULES: L7POLICIES}
+
+_PREFIXES = {'lbaas': (LOADBALANCERS, LISTENERS, POOLS, L7POLICIES,
+                       HEALTH_MONITORS),
+             'octavia': (AMPHORAE,)}
+
+# Query parameters that are not filters
+_TAGS = ('tags', 'tags-any', 'not-tags', 'not-tags-any')
+_PAGINATION = ('limit', 'marker', 'page_reverse', 'sort', 'sort_key',
+               'sort_dir')
+_RESERVED = frozenset(_PAGINATION + ('fields', 'cascade', 'additive_only') +
+                      _TAGS)
+
+DEFAULT_MAX_PAGE_SIZE = 1000
+
+
+class FakeOctaviaError(Exception):
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc).strftime(
+        '%Y-%m-%dT%H:%M:%S')
+
+
+def _defaults(collection, project_id):
+    common = {'project_id': project_id, 'tenant_id': project_id,
+              'provisioning_status': 'ACTIVE', 'created_at': _now(),
+              'updated_at': None, 'tags': []}
+    if collection != AMPHORAE:
+        common.update(name='', description='', admin_state_up=True)
+    if collection in (LOADBALANCERS, LISTENERS, POOLS, MEMBERS, L7POLICIES,
+                      L7RULES, HEALTH_MONITORS):
+        common['operating_status'] = 'ONLINE'
+    extra = {
+        LOADBALANCERS: {
+            'vip_address': '198.51.100.10', 'vip_port_id': None,
+            'vip_subnet_id': None, 'vip_network_id': None,
+            'vip_qos_policy_id': None, 'provider': 'amphora',
+            'flavor_id': None, 'availability_zone': None,
+            'listeners': [], 'pools': [], 'additional_vips': []},
+        LISTENERS: {
+            'protocol': 'HTTP', 'protocol_port': 80, 'connection_limit': -1,
+            'default_pool_id': None, 'loadbalancers': [], 'l7policies': [],
+            'timeout_client_data': 50000, 'timeout_member_connect': 5000,
+            'timeout_member_data': 50000, 'timeout_tcp_inspect': 0,
+            'insert_headers': {}, 'allowed_cidrs': None},
+        POOLS: {
+            'protocol': 'HTTP', 'lb_algorithm': 'ROUND_ROBIN',
+            'session_persistence': None, 'healthmonitor_id': None,
+            'loadbalancers': [], 'listeners': [], 'members': [],
+            'tls_enabled': False},
+        MEMBERS: {
+            'address': '192.0.2.10', 'protocol_port': 80, 'weight': 1,
+            'backup': False, 'subnet_id': None, 'monitor_address': None,
+            'monitor_port': None, 'operating_status': 'NO_MONITOR'},
+        L7POLICIES: {
+            'listener_id': None, 'action': 'REJECT', 'position': 1,
+            'redirect_pool_id': None, 'redirect_url': None,
+            'redirect_prefix': None, 'redirect_http_code': None,
+            'rules': []},
+        L7RULES: {
+            'type': 'PATH', 'compare_type': 'STARTS_WITH',
+            'value': '/', 'key': None, 'invert': False},
+        HEALTH_MONITORS: {
+            'type': 'HTTP', 'delay': 5, 'timeout': 5, 'max_retries': 3,
+            'max_retries_down': 3, 'http_method': 'GET',
+            'url_path': '/', 'expected_codes': '200', 'pools': []},
+        AMPHORAE: {
+            'loadbalancer_id': None, 'compute_id': None, 'status':
+            'ALLOCATED', 'role': 'STANDALONE', 'lb_network_ip': '10.0.0.10',
+            'vrrp_ip': None, 'ha_ip': None, 'vrrp_port_id': None,
+            'ha_port_id': None, 'cert_expiration': None, 'cert_busy': False,
+            'vrrp_interface': None, 'vrrp_id': None, 'vrrp_priority': None,
+            'cached_zone': None, 'image_id': None},
+    }[collection]
+    common.update(extra)
+    if collection == AMPHORAE:
+        del common['provisioning_status']
+    return common
+
+
+class FakeOctavia(object):
+    """In-process Octavia v2 API server
+
+    :param float latency:
+        Seconds added to the handling of every request
+    :param float jitter:
+        Maximum random seconds added on top of ``latency``
+    :param float transition_time:
+        Seconds a changed resource stays in its PENDING_* status
+    :param int max_page_size:
+        Maximum number of resources of a page, Octavia's
+        ``pagination_max_limit``
+    :param bool compress:
+        Gzip the responses of the clients accepting it
+    :param seed:
+        Seed of the jitter and of the generated data
+    :param string token:
+        The only token accepted, any token is accepted if ``None``
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, transition_time=0.0,
+                 max_page_size=DEFAULT_MAX_PAGE_SIZE, compress=False,
+                 seed=None, token=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.transition_time = transition_time
+        self.max_page_size = max_page_size
+        self.compress = compress
+        self.token = token
+        self.project_id = uuid.uuid4().hex
+        # (method, path, query) of the requests received
+        self.requests = []
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        # Collection key, the collection name or (name, parent ID), to the
+        # resources by ID, in creation order
+        self._data = {}
+        self._order = {}
+        # (collection key, ID) to (time, final status) of changes in progress
+        self._pending = {}
+        self._httpd = None
+
+    # Server lifecycle
+
+    @property
+    def endpoint(self):
+        """The load-balancer endpoint to give to the client"""
+        host, port = self._httpd.server_address[:2]
+        return 'http://{}:{}'.format(host, port)
+
+    def start(self, host='127.0.0.1', port=0):
+        """Starts serving in a background thread
+
+        :param string host:
+            The address to listen on
+        :param int port:
+            The port to listen on, a free one if ``0``
+        :return:
+            The endpoint of the server
+        """
+        fake = self
+
+        class Handler(_Handler):
+            octavia = fake
+
+        self._httpd = server.ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        threading.Thread(target=self._httpd.serve_forever,
+                         kwargs={'poll_interval': 0.01}, daemon=True).start()
+        return self.endpoint
+
+    def stop(self):
+        """Stops serving"""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # Data
+
+    def add(self, collection, parent_id=None, **attrs):
+        """Adds an ACTIVE resource without going through the API
+
+        Its references, e.g. the ``listeners`` of its load balancer, are
+        updated.
+
+        :param string collection:
+            The collection of the resource, e.g. ``loadbalancers``
+        :param string parent_id:
+            The pool of a member or the L7 policy of a rule
+        :param attrs:
+            Attributes of the resource, others get a default value
+        :return:
+            The resource
+        """
+        with self._lock:
+            resource = _defaults(collection, self.project_id)
+            resource['id'] = str(uuid.UUID(int=self._random.getrandbits(128),
+                                           version=4))
+            resource.update(attrs)
+            self._link(collection, parent_id, resource)
+            self._collection(collection, parent_id)[
+                resource['id']] = resource
+            self._order.pop(self._key(collection, parent_id), None)
+            return resource
+
+    def populate(self, load_balancers=1, listeners=1, pools=1, members=0,
+                 health_monitors=False, l7policies=0, l7rules=0,
+                 amphorae=0):
+        """Generates a tree of ACTIVE resources
+
+        The counts other than ``load_balancers`` are per parent, e.g.
+        ``members`` is the number of members of each pool.
+
+        :return:
+            The number of resources generated
+        """
+        count = 0
+        for lb_index in range(load_balancers):
+            lb = self.add(LOADBALANCERS, name='lb-{}'.format(lb_index),
+                          vip_address='10.{}.{}.1'.format(
+                              lb_index >> 8 & 255, lb_index & 255))
+            count += 1
+            for index in range(amphorae):
+                self.add(AMPHORAE, loadbalancer_id=lb['id'],
+                         role='MASTER' if index == 0 else 'BACKUP')
+                count += 1
+            lb_listeners = []
+            for index in range(listeners):
+                listener = self.add(
+                    LISTENERS, name='listener-{}-{}'.format(lb_index, index),
+                    protocol_port=80 + index, loadbalancer_id=lb['id'])
+                lb_listeners.append(listener)
+                count += 1
+                for p_index in range(l7policies):
+                    policy = self.add(
+                        L7POLICIES, listener_id=listener['id'],
+                        name='l7policy-{}'.format(p_index),
+                        position=p_index + 1)
+                    count += 1
+                    for r_index in range(l7rules):
+                        self.add(L7RULES, parent_id=policy['id'],
+                                 value='/{}'.format(r_index))
+                        count += 1
+            for index in range(pools):
+                attrs = {'loadbalancer_id': lb['id']}
+                if index < len(lb_listeners):
+                    attrs['listener_id'] = lb_listeners[index]['id']
+                pool = self.add(POOLS, name='pool-{}-{}'.format(lb_index,
+                                                                index),
+                                **attrs)
+                count += 1
+                if health_monitors:
+                    self.add(HEALTH_MONITORS, pool_id=pool['id'],
+                             name='hm-{}-{}'.format(lb_index, index))
+                    count += 1
+                for m_index in range(members):
+                    self.add(MEMBERS, parent_id=pool['id'],
+                             name='member-{}'.format(m_index),
+                             address='10.{}.{}.{}'.format(
+                                 m_index >> 16 & 255, m_index >> 8 & 255,
+                                 m_index & 255))
+                    count += 1
+        return count
+
+    def get(self, collection, res_id, parent_id=None):
+        """Returns a resource as the API would, or ``None``"""
+        with self._lock:
+            self._settle()
+            resource = self._collection(collection, parent_id).get(res_id)
+            return copy.deepcopy(resource)
+
+    def count(self, collection):
+        """Returns the number of resources of a type, nested ones included"""
+        with self._lock:
+            self._settle()
+            return sum(len(resources) for key, resources in self._data.items()
+                       if key == collection or
+                       isinstance(key, tuple) and key[0] == collection)
+
+    @staticmethod
+    def _key(collection, parent_id):
+        return (collection, parent_id) if collection in _NESTED else collection
+
+    def _collection(self, collection, parent_id=None):
+        return self._data.setdefault(self._key(collection, parent_id), {})
+
+    def _find(self, collection, res_id, parent_id=None):
+        if collection in _NESTED:
+            self._find(_NESTED[collection], parent_id)
+        try:
+            return self._collection(collection, parent_id)[res_id]
+        except KeyError:
+            raise FakeOctaviaError(404, '{} {} not found.'.format(
+                _KEYS[collection].capitalize(), res_id))
+
+    def _link(self, collection, parent_id, resource):
+        """Fills the references between a new resource and the others"""
+        ref = {'id': resource['id']}
+        if collection == LISTENERS:
+            lb = self._find(LOADBALANCERS, resource.pop('loadbalancer_id'))
+            resource['loadbalancers'] = [{'id': lb['id']}]
+            lb['listeners'].append(ref)
+        elif collection == POOLS:
+            listener_id = resource.pop('listener_id', None)
+            lb_id = resource.pop('loadbalancer_id', None)
+            if listener_id:
+                listener = self._find(LISTENERS, listener_id)
+                listener['default_pool_id'] = resource['id']
+                resource['listeners'] = [{'id': listener_id}]
+                lb_id = listener['loadbalancers'][0]['id']
+            lb = self._find(LOADBALANCERS, lb_id)
+            resource['loadbalancers'] = [{'id': lb['id']}]
+            lb['pools'].append(ref)
+        elif collection == MEMBERS:
+            self._find(POOLS, parent_id)['members'].append(ref)
+        elif collection == HEALTH_MONITORS:
+            pool = self._find(POOLS, resource.pop('pool_id'))
+            pool['healthmonitor_id'] = resource['id']
+            resource['pools'] = [{'id': pool['id']}]
+        elif collection == L7POLICIES:
+            listener = self._find(LISTENERS, resource['listener_id'])
+            listener['l7policies'].append(ref)
+        elif collection == L7RULES:
+            self._find(L7POLICIES, parent_id)['rules'].append(ref)
+        elif collection == AMPHORAE:
+            self._find(LOADBALANCERS, resource['loadbalancer_id'])
+
+    def _remove(self, collection, parent_id, resource):
+        """Removes a resource, its children and the references to it"""
+        def drop(refs):
+            refs[:] = [ref for ref in refs if ref['id'] != resource['id']]
+
+        def remove_all(child_collection, res_ids):
+            for res_id in res_ids:
+                child = self._collection(child_collection).get(res_id)
+                if child is not None:
+                    self._remove(child_collection, None, child)
+
+        if collection == LOADBALANCERS:
+            remove_all(LISTENERS, [ref['id'] for ref in resource['listeners']])
+            remove_all(POOLS, [ref['id'] for ref in resource['pools']])
+            remove_all(AMPHORAE, [
+                amp['id'] for amp in self._collection(AMPHORAE).values()
+                if amp['loadbalancer_id'] == resource['id']])
+        elif collection == LISTENERS:
+            remove_all(L7POLICIES,
+                       [ref['id'] for ref in resource['l7policies']])
+            for lb in resource['loadbalancers']:
+                drop(self._find(LOADBALANCERS, lb['id'])['listeners'])
+        elif collection == POOLS:
+            if resource['healthmonitor_id']:
+                remove_all(HEALTH_MONITORS, [resource['healthmonitor_id']])
+            self._data.pop((MEMBERS, resource['id']), None)
+            self._order.pop((MEMBERS, resource['id']), None)
+            for lb in resource['loadbalancers']:
+                drop(self._find(LOADBALANCERS, lb['id'])['pools'])
+            for ref in resource['listeners']:
+                # Already gone when the whole load balancer is removed
+                listener = self._collection(LISTENERS).get(ref['id'])
+                if listener is not None:
+                    listener['default_pool_id'] = None
+        elif collection == MEMBERS:
+            drop(self._find(POOLS, parent_id)['members'])
+        elif collection == HEALTH_MONITORS:
+            for pool in resource['pools']:
+                self._find(POOLS, pool['id'])['healthmonitor_id'] = None
+        elif collection == L7POLICIES:
+            self._data.pop((L7RULES, resource['id']), None)
+            self._order.pop((L7RULES, resource['id']), None)
+            drop(self._find(LISTENERS, resource['listener_id'])['l7policies'])
+        elif collection == L7RULES:
+            drop(self._find(L7POLICIES, parent_id)['rules'])
+
+        key = self._key(collection, parent_id)
+        del self._data[key][resource['id']]
+        self._order.pop(key, None)
+        self._pending.pop((key, resource['id']), None)
+
+    def _load_balancer_id(self, collection, parent_id, resource):
+        """Returns the load balancer of a resource or of a new one"""
+        if collection == LOADBALANCERS:
+            return resource['id']
+
+        def first(refs):
+            return refs[0]['id'] if refs else None
+
+        lb_id = (resource.get('loadbalancer_id') or
+                 first(resource.get('loadbalancers')))
+        listener_id = (resource.get('listener_id') or
+                       first(resource.get('listeners')))
+        pool_id = resource.get('pool_id') or first(resource.get('pools'))
+        if collection == MEMBERS:
+            pool_id = parent_id
+        elif collection == L7RULES:
+            listener_id = self._find(L7POLICIES, parent_id)['listener_id']
+        if lb_id:
+            return lb_id
+        if listener_id:
+            listener = self._find(LISTENERS, listener_id)
+            return listener['loadbalancers'][0]['id']
+        if pool_id:
+            return self._find(POOLS, pool_id)['loadbalancers'][0]['id']
+        raise FakeOctaviaError(400, 'Missing parent of the {}.'.format(
+            _KEYS[collection]))
+
+    def _check_mutable(self, lb_id):
+        status = self._find(LOADBALANCERS, lb_id)['provisioning_status']
+        if status.startswith('PENDING_'):
+            raise FakeOctaviaError(409, 'Load Balancer {} is immutable and '
+                                   'cannot be updated.'.format(lb_id))
+
+    # Status transitions
+
+    def _settle(self):
+        """Completes the changes whose transition time has passed"""
+        now = time.monotonic()
+        for (key, res_id), (ready_at, final) in list(self._pending.items()):
+            if ready_at > now:
+                continue
+            del self._pending[(key, res_id)]
+            resource = self._data.get(key, {}).get(res_id)
+            if resource is None:
+                continue
+            if final == 'DELETED':
+                collection, parent_id = (key if isinstance(key, tuple)
+                                         else (key, None))
+                self._remove(collection, parent_id, resource)
+            else:
+                resource['provisioning_status'] = final
+
+    def _change(self, collection, parent_id, resource, pending, final):
+        """Starts a change of a resource and of its load balancer"""
+        lb_id = self._load_balancer_id(collection, parent_id, resource)
+        self._check_mutable(lb_id)
+        lb = self._find(LOADBALANCERS, lb_id)
+        ready_at = time.monotonic() + self.transition_time
+        changes = [(LOADBALANCERS, lb, 'PENDING_UPDATE', 'ACTIVE')]
+        if collection == LOADBALANCERS:
+            changes = []
+        if 'provisioning_status' in resource:
+            changes.append((self._key(collection, parent_id), resource,
+                            pending, final))
+        for key, res, res_pending, res_final in changes:
+            res['provisioning_status'] = res_pending
+            self._pending[(key, res['id'])] = (ready_at, res_final)
+        self._settle()
+
+    # Requests
+
+    def handle(self, method, path, query, body, token=None):
+        """Handles a request
+
+        :return:
+            The status code and the response body
+        """
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+        with self._lock:
+            self.requests.append((method, path, query))
+            if self.token is not None and token != self.token:
+                return 401, {'error': {
+                    'code': 401, 'title': 'Unauthorized',
+                    'message': 'The request you have made requires '
+                               'authentication.'}}
+            self._settle()
+            try:
+                return self._route(method, path, query, body)
+            except FakeOctaviaError as e:
+                return e.code, {'faultcode': 'Client',
+                                'faultstring': e.message, 'debuginfo': None}
+
+    def _route(self, method, path, query, body):
+        parts = [part for part in path.split('/') if part]
+        if parts and parts[0] in ('v2', 'v2.0'):
+            parts = parts[1:]
+        if len(parts) < 2 or parts[1] not in _PREFIXES.get(parts[0], ()):
+            raise FakeOctaviaError(404, 'The resource could not be found.')
+        collection, parent_id = parts[1], None
+        rest = parts[2:]
+        if len(rest) >= 2 and _NESTED.get(rest[1]) == collection:
+            collection, parent_id = rest[1], rest[0]
+            rest = rest[2:]
+
+        if not rest:
+            if method == 'GET':
+                return 200, self._list(collection, parent_id, query)
+            if method == 'POST':
+                return 201, self._create(collection, parent_id, body)
+            if method == 'PUT' and collection == MEMBERS:
+                return 202, self._batch_update(parent_id, query, body)
+        elif len(rest) == 1:
+            if method == 'GET':
+                return 200, self._show(collection, parent_id, rest[0], query)
+            if method == 'PUT':
+                return 200, self._update(collection, parent_id, rest[0],
+                                         body)
+            if method == 'DELETE':
+                return 204, self._delete(collection, parent_id, rest[0],
+                                         query)
+        elif len(rest) == 2:
+            return self._action(method, collection, rest[0], rest[1])
+        raise FakeOctaviaError(405, 'The method is not allowed.')
+
+    def _list(self, collection, parent_id, query):
+        if collection in _NESTED:
+            self._find(_NESTED[collection], parent_id)
+        key = self._key(collection, parent_id)
+        resources = self._collection(collection, parent_id)
+        filters = {name: values for name, values in query.items()
+                   if name not in _RESERVED}
+        sort_keys = [part.partition(':')[::2] for part in
+                     ','.join(query.get('sort', [])).split(',') if part]
+
+        if filters or sort_keys or any(name in query for name in _TAGS):
+            ids = [res_id for res_id, resource in resources.items()
+                   if self._matches(resource, filters, query)]
+            for sort_key, direction in reversed(sort_keys):
+                ids.sort(key=lambda res_id, k=sort_key: _sort_value(
+                    resources[res_id].get(k)), reverse=direction == 'desc')
+            positions = {res_id: index for index, res_id in enumerate(ids)}
+        else:
+            if key not in self._order:
+                ids = list(resources)
+                self._order[key] = (ids, {res_id: index for index, res_id
+                                          in enumerate(ids)})
+            ids, positions = self._order[key]
+
+        limit = self.max_page_size
+        if 'limit' in query:
+            limit = min(int(query['limit'][0]), limit) or limit
+        start = 0
+        if 'marker' in query:
+            marker = query['marker'][0]
+            if marker not in positions:
+                raise FakeOctaviaError(404, '{} {} not found.'.format(
+                    _KEYS[collection].capitalize(), marker))
+            start = positions[marker] + 1
+        page_ids = ids[start:start + limit]
+
+        fields = _fields(query)
+        page = [_select(resources[res_id], fields) for res_id in page_ids]
+        links = []
+        if start + limit < len(ids):
+            links.append(self._link_to(collection, parent_id, query,
+                                       page_ids[-1], 'next'))
+        return {collection: page, collection + '_links': links}
+
+    def _link_to(self, collection, parent_id, query, marker, rel):
+        # Octavia drops the filters and the fields from the links
+        query = {name: values for name, values in query.items()
+                 if name in _PAGINATION}
+        query.update(marker=[marker],
+                     limit=query.get('limit', [str(self.max_page_size)]))
+        prefix = 'octavia' if collection == AMPHORAE else 'lbaas'
+        if parent_id:
+            path = '{}/{}/{}'.format(_NESTED[collection], parent_id,
+                                     collection)
+        else:
+            path = collection
+        return {'rel': rel, 'href': '{}/v2.0/{}/{}?{}'.format(
+            self.endpoint, prefix, path, urlparse.urlencode(query, True))}
+
+    @staticmethod
+    def _matches(resource, filters, query):
+        for name, values in filters.items():
+            if len(values) > 1:
+                # Octavia reads a repeated filter as a list and compares
+                # the attribute to it with filter_by(), not with IN
+                return False
+            value, = values
+            refs = resource.get(name[:-len('_id')] + 's')
+            if name.endswith('_id') and isinstance(refs, list):
+                # e.g. loadbalancer_id of a listener or listener_id of a pool
+                if value not in {ref['id'] for ref in refs}:
+                    return False
+                continue
+            attr = resource.get(name)
+            if isinstance(attr, bool):
+                attr = str(attr)
+                value = value.capitalize()
+            if str(attr) != value:
+                return False
+        tags = set(resource.get('tags') or [])
+
+        def tag_values(name):
+            return {tag for values in query.get(name, [])
+                    for tag in values.split(',')}
+
+        if 'tags' in query and not tag_values('tags') <= tags:
+            return False
+        if 'tags-any' in query and not tag_values('tags-any') & tags:
+            return False
+        if 'not-tags' in query and tag_values('not-tags') <= tags:
+            return False
+        if 'not-tags-any' in query and tag_values('not-tags-any') & tags:
+            return False
+        return True
+
+    def _show(self, collection, parent_id, res_id, query):
+        resource = self._find(collection, res_id, parent_id)
+        return {_KEYS[collection]: _select(resource, _fields(query))}
+
+    def _create(self, collection, parent_id, body):
+        if collection == AMPHORAE:
+            raise FakeOctaviaError(405, 'The method is not allowed.')
+        attrs = _body(collection, body)
+        if collection in _NESTED:
+            self._find(_NESTED[collection], parent_id)
+        if collection != LOADBALANCERS:
+            self._check_mutable(
+                self._load_balancer_id(collection, parent_id, attrs))
+        resource = self.add(collection, parent_id=parent_id, **attrs)
+        self._change(collection, parent_id, resource, 'PENDING_CREATE',
+                     'ACTIVE')
+        return {_KEYS[collection]: copy.deepcopy(resource)}
+
+    def _update(self, collection, parent_id, res_id, body):
+        resource = self._find(collection, res_id, parent_id)
+        attrs = _body(collection, body)
+        self._change(collection, parent_id, resource, 'PENDING_UPDATE',
+                     'ACTIVE')
+        resource.update(attrs, updated_at=_now())
+        return {_KEYS[collection]: copy.deepcopy(resource)}
+
+    def _batch_update(self, pool_id, query, body):
+        """Replaces the members of a pool, like Octavia's batch update
+
+        The members are matched on their address and protocol port, the
+        ones not given are deleted unless ``additive_only`` is set.
+        """
+        pool = self._find(POOLS, pool_id)
+        if not isinstance(body, dict) or not isinstance(body.get(MEMBERS),
+                                                        list):
+            raise FakeOctaviaError(400, 'Invalid input for field/attribute '
+                                   'members.')
+        additive_only = query.get('additive_only',
+                                  ['false'])[0].lower() == 'true'
+        self._change(POOLS, None, pool, 'PENDING_UPDATE', 'ACTIVE')
+        members = self._collection(MEMBERS, pool_id)
+        existing = {(member['address'], member['protocol_port']): member
+                    for member in members.values()}
+        kept = set()
+        for attrs in body[MEMBERS]:
+            attrs = _writable(attrs)
+            member = existing.get((attrs.get('address'),
+                                   attrs.get('protocol_port', 80)))
+            if member is None:
+                member = self.add(MEMBERS, parent_id=pool_id, **attrs)
+            else:
+                member.update(attrs, updated_at=_now())
+            kept.add(member['id'])
+        if not additive_only:
+            for member in list(members.values()):
+                if member['id'] not in kept:
+                    self._remove(MEMBERS, pool_id, member)
+        return None
+
+    def _delete(self, collection, parent_id, res_id, query):
+        resource = self._find(collection, res_id, parent_id)
+        if collection == LOADBALANCERS:
+            cascade = query.get('cascade', ['false'])[0].lower() == 'true'
+            if (resource['listeners'] or resource['pools']) and not cascade:
+                raise FakeOctaviaError(400, 'Cannot delete Load Balancer {} '
+                                       '- it has children'.format(res_id))
+        self._change(collection, parent_id, resource, 'PENDING_DELETE',
+                     'DELETED')
+        return None
+
+    def _action(self, method, collection, res_id, action):
+        resource = self._find(collection, res_id)
+        if method == 'GET' and action == 'stats' and collection in (
+                LOADBALANCERS, LISTENERS):
+            return 200, {'stats': {'active_connections': 0, 'bytes_in': 0,
+                                   'bytes_out': 0, 'request_errors': 0,
+                                   'total_connections': 0}}
+        if method == 'GET' and action == 'stats' and collection == AMPHORAE:
+            return 200, {'amphora_stats': [
+                {'listener_id': listener['id'], 'active_connections': 0,
+                 'bytes_in': 0, 'bytes_out': 0, 'request_errors': 0,
+                 'total_connections': 0}
+                for listener in self._find(
+                    LOADBALANCERS, resource['loadbalancer_id'])['listeners']]}
+        if (method == 'GET' and action == 'status' and
+                collection == LOADBALANCERS):
+            return 200, {'statuses': {'loadbalancer': {
+                'id': res_id, 'name': resource['name'],
+                'provisioning_status': resource['provisioning_status'],
+                'operating_status': resource['operating_status'],
+                'listeners': [self._find(LISTENERS, listener['id'])
+                              for listener in resource['listeners']]}}}
+        if method == 'PUT' and action == 'failover' and collection in (
+                LOADBALANCERS, AMPHORAE):
+            lb = self._find(LOADBALANCERS, resource.get('loadbalancer_id') or
+                            res_id)
+            self._change(LOADBALANCERS, None, lb, 'PENDING_UPDATE', 'ACTIVE')
+            return 202, None
+        if method == 'PUT' and action == 'config' and collection == AMPHORAE:
+            return 202, None
+        raise FakeOctaviaError(404, 'The resource could not be found.')
+
+
+def _sort_value(value):
+    # None sorts first, like NULL in Octavia's database
+    return (value is not None, str(value) if value is not None else '')
+
+
+def _fields(query):
+    return [field for values in query.get('fields', [])
+            for field in values.split(',') if field]
+
+
+def _select(resource, fields):
+    if not fields:
+        return copy.deepcopy(resource)
+    return {field: copy.deepcopy(resource[field]) for field in fields
+            if field in resource}
+
+
+def _body(collection, body):
+    key = _KEYS[collection]
+    if not isinstance(body, dict) or not isinstance(body.get(key), dict):
+        raise FakeOctaviaError(400, 'Invalid input for field/attribute '
+                               '{}.'.format(key))
+    return _writable(body[key])
+
+
+def _writable(attrs):
+    """Returns the attributes of a request body the client can set"""
+    attrs = dict(attrs)
+    for field in ('id', 'provisioning_status', 'operating_status',
+                  'created_at', 'updated_at'):
+        attrs.pop(field, None)
+    return attrs
+
+
+class _Handler(server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # The headers and the body are written separately, with Nagle's
+    # algorithm the body of a small response waits for the client's
+    # delayed ACK of the headers on a kept-alive connection
+    disable_nagle_algorithm = True
+    octavia = None
+
+    def _handle(self):
+        url = urlparse.urlsplit(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = None
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length))
+            except ValueError:
+                body = None
+        status, response = self.octavia.handle(
+            self.command, url.path,
+            urlparse.parse_qs(url.query, keep_blank_values=True), body,
+            token=self.headers.get('X-Auth-Token'))
+
+        data = b''
+        if response is not None:
+            data = json.dumps(response).encode()
+        self.send_response(status)
+        if data:
+            self.send_header('Content-Type', 'application/json')
+            if self.octavia.compress and 'gzip' in self.headers.get(
+                    'Accept-Encoding', ''):
+                data = gzip.compress(data, compresslevel=1)
+                self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    """Serves generated resources until interrupted
+
+    Usage::
+
+        python -m octaviaclient.tests.fake_octavia --load-balancers 100 \\
+            --members 1000 --port 9876
+
+    The client is then given the printed endpoint, it accepts any token.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=9876)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--transition-time', type=float, default=0.0)
+    parser.add_argument('--max-page-size', type=int,
+                        default=DEFAULT_MAX_PAGE_SIZE)
+    parser.add_argument('--compress', action='store_true')
+    for name, default in (('load-balancers', 1), ('listeners', 1),
+                          ('pools', 1), ('members', 0), ('l7policies', 0),
+                          ('l7rules', 0), ('amphorae', 0)):
+        parser.add_argument('--' + name, type=int, default=default)
+    parser.add_argument('--health-monitors', action='store_true')
+    args = parser.parse_args()
+
+    fake = FakeOctavia(latency=args.latency, jitter=args.jitter,
+                       transition_time=args.transition_time,
+                       max_page_size=args.max_page_size,
+                       compress=args.compress)
+    count = fake.populate(
+        load_balancers=args.load_balancers, listeners=args.listeners,
+        pools=args.pools, members=args.members,
+        health_monitors=args.health_monitors, l7policies=args.l7policies,
+        l7rules=args.l7rules, amphorae=args.amphorae)
+    print('Serving {} resources on {}'.format(
+        count, fake.start(port=args.port)))
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,287 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Asyncio Load Balancer v2 API Library Tests"""
+
+import asyncio
+from unittest import mock
+
+from keystoneauth1 import session
+from keystoneauth1 import token_endpoint
+from osc_lib import exceptions as osc_exc
+import osc_lib.test.base as osc_test_base
+from oslo_utils import uuidutils
+
+from octaviaclient.api import exceptions
+from octaviaclient.api.v2 import aio
+from octaviaclient.tests import fake_octavia
+
+FAKE_TOKEN = 'token'
+FAKE_LB = uuidutils.generate_uuid()
+
+
+class TestAsyncOctaviaAPI(osc_test_base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.fake = fake_octavia.FakeOctavia(max_page_size=2,
+                                             token=FAKE_TOKEN)
+        self.fake.start()
+        self.addCleanup(self.fake.stop)
+
+    def _run(self, coro_f, auth_session=None):
+        async def run():
+            if auth_session is None:
+                sess = session.Session(
+                    auth=token_endpoint.Token(self.fake.endpoint,
+                                              FAKE_TOKEN))
+            else:
+                sess = auth_session
+                sess.get_endpoint.return_value = self.fake.endpoint
+            async with aio.AsyncOctaviaAPI(sess) as api:
+                return await coro_f(api)
+        return asyncio.run(run())
+
+    def _add_lbs(self, count):
+        return [self.fake.add(fake_octavia.LOADBALANCERS,
+                              name='lb{}'.format(i))['id']
+                for i in range(count)]
+
+    def _queries(self):
+        return [query for method, path, query in self.fake.requests]
+
+    def test_load_balancer_list_paginated(self):
+        self._add_lbs(5)
+
+        async def test(api):
+            return await api.load_balancer_list()
+
+        ret = self._run(test)
+        self.assertEqual(['lb0', 'lb1', 'lb2', 'lb3', 'lb4'],
+                         [lb['name'] for lb in ret['loadbalancers']])
+        self.assertEqual(3, len(self.fake.requests))
+
+    def test_load_balancer_list_limit(self):
+        self._add_lbs(5)
+
+        async def test(api):
+            return await api.load_balancer_list(limit=3)
+
+        ret = self._run(test)
+        self.assertEqual(['lb0', 'lb1', 'lb2'],
+                         [lb['name'] for lb in ret['loadbalancers']])
+        self.assertEqual(2, len(self.fake.requests))
+        self.assertEqual(['3'], self._queries()[0]['limit'])
+
+    def test_iter_load_balancers_keeps_fields(self):
+        self._add_lbs(3)
+
+        async def test(api):
+            return [lb async for lb in api.iter_load_balancers(
+                fields=['id', 'name'])]
+
+        ret = self._run(test)
+        self.assertEqual(3, len(ret))
+        self.assertEqual({'id', 'name'}, set(ret[2]))
+        self.assertEqual(['id', 'name'], self._queries()[1]['fields'])
+
+    def test_iter_load_balancers_keeps_filters(self):
+        self._add_lbs(5)
+        for _ in range(3):
+            self.fake.add(fake_octavia.LOADBALANCERS, name='lb0')
+
+        async def test(api):
+            return [lb async for lb in api.iter_load_balancers(name='lb0')]
+
+        # The next links of Octavia do not carry the filters
+        ret = self._run(test)
+        self.assertEqual(['lb0'] * 4, [lb['name'] for lb in ret])
+        self.assertEqual(2, len(self.fake.requests))
+
+    def test_count_load_balancers(self):
+        self._add_lbs(5)
+
+        async def test(api):
+            return await api.count_load_balancers(limit=1)
+
+        self.assertEqual(5, self._run(test))
+        self.assertEqual(3, len(self.fake.requests))
+        self.assertEqual(['id'], self._queries()[0]['fields'])
+
+    def test_count_load_balancers_group_by(self):
+        self._add_lbs(3)
+        self.fake.add(fake_octavia.LOADBALANCERS, name='lb0')
+
+        async def test(api):
+            return await api.count_load_balancers(group_by='name')
+
+        self.assertEqual({'lb0': 2, 'lb1': 1, 'lb2': 1}, self._run(test))
+        self.assertEqual(['name'], self._queries()[0]['fields'])
+
+    def test_count_members(self):
+        lb_id, = self._add_lbs(1)
+        pool_id = self.fake.add(fake_octavia.POOLS,
+                                loadbalancer_id=lb_id)['id']
+        for i in range(3):
+            self.fake.add(fake_octavia.MEMBERS, pool_id,
+                          address='192.0.2.{}'.format(i))
+
+        async def test(api):
+            return await api.count_members(pool_id)
+
+        self.assertEqual(3, self._run(test))
+
+    def test_load_balancer_show(self):
+        lb_id, = self._add_lbs(1)
+
+        async def test(api):
+            return await asyncio.gather(
+                api.load_balancer_show(lb_id),
+                api.load_balancer_show(lb_id, fields=['name']))
+
+        ret, projected = self._run(test)
+        self.assertEqual('lb0', ret['name'])
+        self.assertEqual({'name': 'lb0'}, projected)
+
+    def test_load_balancer_show_not_found(self):
+        async def test(api):
+            return await api.load_balancer_show(FAKE_LB)
+
+        self.assertRaises(osc_exc.NotFound, self._run, test)
+
+    def test_load_balancer_create_delete(self):
+        async def test(api):
+            ret = await api.load_balancer_create(
+                json={'loadbalancer': {'name': 'lb'}})
+            lb_id = ret['loadbalancer']['id']
+            response = await api.load_balancer_delete(lb_id,
+                                                      cascade=True)
+            return lb_id, response
+
+        lb_id, response = self._run(test)
+        self.assertEqual(204, response.status_code)
+        self.assertIsNone(self.fake.get(fake_octavia.LOADBALANCERS, lb_id))
+        self.assertEqual(['True'], self._queries()[-1]['cascade'])
+
+    def test_load_balancer_delete_conflict(self):
+        lb_id, = self._add_lbs(1)
+        self.fake.transition_time = 10
+
+        async def test(api):
+            await api.load_balancer_failover(lb_id)
+            return await api.load_balancer_delete(lb_id)
+
+        e = self.assertRaises(exceptions.OctaviaClientException, self._run,
+                              test)
+        self.assertEqual(409, e.code)
+        self.assertIn('immutable', str(e))
+
+    def test_load_balancer_delete_not_found(self):
+        async def test(api):
+            return await api.load_balancer_delete(FAKE_LB)
+
+        e = self.assertRaises(exceptions.OctaviaClientException, self._run,
+                              test)
+        self.assertEqual(404, e.code)
+
+    def test_member_create_batch_update(self):
+        lb_id, = self._add_lbs(1)
+        pool_id = self.fake.add(fake_octavia.POOLS,
+                                loadbalancer_id=lb_id)['id']
+
+        async def test(api):
+            ret = await api.member_create(
+                pool_id, json={'member': {'address': '192.0.2.1',
+                                          'weight': 2}})
+            await api.member_batch_update(pool_id,
+                                          [{'address': '192.0.2.2'}],
+                                          additive_only=True)
+            return ret
+
+        member = self._run(test)['member']
+        self.assertEqual(2, member['weight'])
+        self.assertEqual(member, self.fake.get(fake_octavia.MEMBERS,
+                                               member['id'], pool_id))
+        self.assertEqual(2, self.fake.count(fake_octavia.MEMBERS))
+        self.assertEqual(['True'], self._queries()[-1]['additive_only'])
+
+    def test_token_refreshed_once(self):
+        self._add_lbs(1)
+        auth_session = mock.Mock()
+        auth_session.get_auth_headers.side_effect = [
+            {'X-Auth-Token': 'expired'}, {'X-Auth-Token': FAKE_TOKEN}]
+
+        async def test(api):
+            return await api.load_balancer_list()
+
+        ret = self._run(test, auth_session=auth_session)
+        self.assertEqual(1, len(ret['loadbalancers']))
+        self.assertEqual(2, len(self.fake.requests))
+        auth_session.invalidate.assert_called_once_with()
+
+    def test_token_rejected(self):
+        auth_session = mock.Mock()
+        auth_session.get_auth_headers.return_value = {
+            'X-Auth-Token': 'invalid'}
+
+        async def test(api):
+            return await api.load_balancer_list()
+
+        e = self.assertRaises(exceptions.OctaviaClientException, self._run,
+                              test, auth_session=auth_session)
+        self.assertEqual(401, e.code)
+        self.assertEqual(2, len(self.fake.requests))
+
+    def test_map_in_order(self):
+        lb_ids = self._add_lbs(5)
+
+        async def test(api):
+            return await api.map('load_balancer_show',
+                                 lb_ids + [FAKE_LB], max_workers=2)
+
+        ret = self._run(test)
+        self.assertEqual(['lb0', 'lb1', 'lb2', 'lb3', 'lb4'],
+                         [lb['name'] for lb in ret[:5]])
+        self.assertIsInstance(ret[5], osc_exc.NotFound)
+
+    def test_map_tuples(self):
+        lb_id, = self._add_lbs(1)
+        pool_id = self.fake.add(fake_octavia.POOLS,
+                                loadbalancer_id=lb_id)['id']
+        member_id = self.fake.add(fake_octavia.MEMBERS, pool_id,
+                                  address='192.0.2.1')['id']
+
+        async def test(api):
+            return await api.map(api.member_show, [(pool_id, member_id)])
+
+        ret, = self._run(test)
+        self.assertEqual('192.0.2.1', ret['address'])
+
+    def test_map_fail_fast(self):
+        lb_ids = self._add_lbs(3)
+
+        async def test(api):
+            return await api.map(api.load_balancer_show,
+                                 [FAKE_LB] + lb_ids, max_workers=1,
+                                 fail_fast=True)
+
+        self.assertRaises(osc_exc.NotFound, self._run, test)
+        # The calls waiting for a worker are not started
+        self.assertEqual(1, len(self.fake.requests))
+
+    def test_map_invalid_max_workers(self):
+        async def test(api):
+            return await api.map(api.load_balancer_show, [FAKE_LB],
+                                 max_workers=0)
+
+        self.assertRaises(ValueError, self._run, test)
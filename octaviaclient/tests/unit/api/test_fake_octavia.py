@@ -0,0 +1,218 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""OctaviaAPI tests against the in-process Octavia stand-in"""
+
+import time
+from unittest import mock
+from urllib import parse as urlparse
+
+from keystoneauth1 import session
+from osc_lib import exceptions as osc_exc
+import osc_lib.test.base as osc_test_base
+
+from octaviaclient.api import exceptions
+from octaviaclient.api.v2 import octavia
+from octaviaclient.tests import fake_octavia
+
+
+class TestFakeOctavia(osc_test_base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.server = fake_octavia.FakeOctavia(max_page_size=10, seed=42)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.server.populate(load_balancers=3, listeners=2, pools=1,
+                             members=25, health_monitors=True,
+                             l7policies=1, l7rules=2, amphorae=2)
+        self.api = octavia.OctaviaAPI(session=session.Session(),
+                                      endpoint=self.server.endpoint)
+        self.lb = self.api.load_balancer_list(name='lb-1')['loadbalancers'][0]
+        self.pool_id = self.lb['pools'][0]['id']
+
+    def _get_requests(self, collection):
+        return [path for method, path, query in self.server.requests
+                if method == 'GET' and path.endswith(collection)]
+
+    def test_populate(self):
+        for collection, count in (('loadbalancers', 3), ('listeners', 6),
+                                  ('pools', 3), ('members', 75),
+                                  ('healthmonitors', 3), ('l7policies', 6),
+                                  ('rules', 12), ('amphorae', 6)):
+            self.assertEqual(count, self.server.count(collection))
+
+    def test_list_paginated(self):
+        members = self.api.member_list(self.pool_id)['members']
+        self.assertEqual(['member-{}'.format(i) for i in range(25)],
+                         [member['name'] for member in members])
+        self.assertEqual(3, len(self._get_requests('/members')))
+
+    def test_list_fields_and_filters(self):
+        members = self.api.member_list(self.pool_id, fields=['id', 'name'],
+                                       name='member-3')
+        self.assertEqual([{'id': mock.ANY, 'name': 'member-3'}],
+                         members['members'])
+        # A repeated filter is compared to the list of its values
+        self.assertEqual([], self.api.member_list(
+            self.pool_id, name=['member-3', 'member-7'])['members'])
+        self.assertEqual([], self.api.load_balancer_list(
+            admin_state_up=False)['loadbalancers'])
+        listeners = self.api.listener_list(loadbalancer_id=self.lb['id'])
+        self.assertEqual(self.lb['listeners'], [
+            {'id': listener['id']} for listener in listeners['listeners']])
+
+    def test_list_filtered_paginated(self):
+        for i in range(12):
+            self.server.add(fake_octavia.MEMBERS, parent_id=self.pool_id,
+                            name='member-3', address='192.0.2.%d' % i)
+        # The next links only carry the pagination parameters
+        status, page = self.server.handle(
+            'GET', '/v2.0/lbaas/pools/{}/members'.format(self.pool_id),
+            {'name': ['member-3'], 'fields': ['name'], 'sort': ['name']},
+            None)
+        self.assertEqual(10, len(page['members']))
+        self.assertEqual(['limit', 'marker', 'sort'], sorted(
+            urlparse.parse_qs(urlparse.urlsplit(
+                page['members_links'][0]['href']).query)))
+
+        members = self.api.member_list(self.pool_id, name='member-3',
+                                       fields=['name'])['members']
+        self.assertEqual([{'name': 'member-3'}] * 13, members)
+        self.assertEqual(13, self.api.count_members(self.pool_id,
+                                                    name='member-3'))
+
+    def test_list_sorted(self):
+        lbs = self.api.load_balancer_list(sort='name:desc')['loadbalancers']
+        self.assertEqual(['lb-2', 'lb-1', 'lb-0'],
+                         [lb['name'] for lb in lbs])
+
+    def test_list_limit_and_marker(self):
+        lbs = self.api.load_balancer_list(limit=2, sort='name:desc')
+        self.assertEqual(['lb-2', 'lb-1'],
+                         [lb['name'] for lb in lbs['loadbalancers']])
+        lbs = self.api.load_balancer_list(
+            limit=2, sort='name:desc',
+            marker=lbs['loadbalancers'][-1]['id'])['loadbalancers']
+        self.assertEqual(['lb-0'], [lb['name'] for lb in lbs])
+
+        members = self.api.member_list(self.pool_id, limit=12)['members']
+        self.assertEqual(12, len(members))
+        # The page size is capped to 10, the third page is not requested
+        self.assertEqual(2, len(self._get_requests('/members')))
+
+    def test_count(self):
+        self.assertEqual(25, self.api.count_members(self.pool_id))
+        # The whole pool is counted from a page of 10 at most
+        self.assertEqual(3, len(self._get_requests('/members')))
+        self.assertEqual(1, self.api.count_members(self.pool_id,
+                                                   name='member-3'))
+        self.assertEqual({'MASTER': 3, 'BACKUP': 3},
+                         self.api.count_amphorae(group_by='role'))
+        self.assertEqual(2, self.api.count_listeners(
+            loadbalancer_id=self.lb['id']))
+
+    def test_list_tags(self):
+        self.api.load_balancer_set(self.lb['id'],
+                                   json={'loadbalancer': {'tags': ['a']}})
+        lbs = self.api.load_balancer_list(tags='a')['loadbalancers']
+        self.assertEqual([self.lb['id']], [lb['id'] for lb in lbs])
+        lbs = self.api.load_balancer_list(**{'not-tags': 'a'})
+        self.assertEqual(2, len(lbs['loadbalancers']))
+
+    def test_nested(self):
+        policy_id = self.api.l7policy_list()['l7policies'][0]['id']
+        rules = self.api.l7rule_list(policy_id)['rules']
+        self.assertEqual(2, len(rules))
+        self.assertEqual(rules[0], self.api.l7rule_show(rules[0]['id'],
+                                                        policy_id))
+        self.assertRaises(exceptions.OctaviaClientException,
+                          self.api.member_list, 'unknown')
+
+    def test_create_and_delete(self):
+        member = self.api.member_create(
+            self.pool_id, json={'member': {'address': '192.0.2.99',
+                                           'protocol_port': 8080}})['member']
+        self.assertEqual(member, self.api.member_show(self.pool_id,
+                                                      member['id']))
+        self.assertIn({'id': member['id']},
+                      self.api.pool_show(self.pool_id)['members'])
+
+        self.api.member_delete(self.pool_id, member['id'])
+        self.assertRaises(osc_exc.NotFound, self.api.member_show,
+                          self.pool_id, member['id'])
+        self.assertEqual(75, self.server.count('members'))
+
+    def test_member_batch_update(self):
+        member = self.api.member_list(self.pool_id, name='member-3')[
+            'members'][0]
+        self.api.member_batch_update(self.pool_id, [
+            {'address': member['address'], 'protocol_port': 80,
+             'weight': 5},
+            {'address': '192.0.2.99', 'protocol_port': 8080}])
+        members = self.api.member_list(self.pool_id)['members']
+        self.assertEqual([(member['id'], 5), (mock.ANY, 1)],
+                         [(m['id'], m['weight']) for m in members])
+        self.assertEqual(52, self.server.count('members'))
+
+    def test_cascade_delete(self):
+        self.assertRaises(exceptions.OctaviaClientException,
+                          self.api.load_balancer_delete, self.lb['id'])
+        self.api.load_balancer_delete(self.lb['id'], cascade=True)
+        for collection, count in (('loadbalancers', 2), ('listeners', 4),
+                                  ('pools', 2), ('members', 50),
+                                  ('healthmonitors', 2), ('l7policies', 4),
+                                  ('rules', 8), ('amphorae', 4)):
+            self.assertEqual(count, self.server.count(collection))
+
+    def test_transition(self):
+        self.server.transition_time = 0.2
+        listener = self.api.listener_create(json={'listener': {
+            'loadbalancer_id': self.lb['id'], 'protocol': 'TCP',
+            'protocol_port': 443}})['listener']
+        self.assertEqual('PENDING_CREATE', listener['provisioning_status'])
+        self.assertEqual('PENDING_UPDATE', self.api.load_balancer_show(
+            self.lb['id'])['provisioning_status'])
+        e = self.assertRaises(exceptions.OctaviaClientException,
+                              self.api.pool_set, self.pool_id,
+                              json={'pool': {'name': 'new'}})
+        self.assertEqual(409, e.code)
+
+        time.sleep(0.2)
+        self.assertEqual('ACTIVE', self.api.listener_show(
+            listener['id'])['provisioning_status'])
+        self.assertEqual('ACTIVE', self.api.load_balancer_show(
+            self.lb['id'])['provisioning_status'])
+
+    def test_amphorae(self):
+        amphorae = self.api.amphora_list(loadbalancer_id=self.lb['id'])
+        self.assertEqual(['MASTER', 'BACKUP'],
+                         [amp['role'] for amp in amphorae['amphorae']])
+        amp_id = amphorae['amphorae'][0]['id']
+        self.assertEqual(2, len(self.api.amphora_stats_show(amp_id)[
+            'amphora_stats']))
+        self.server.transition_time = 10
+        self.api.amphora_failover(amp_id)
+        self.assertEqual('PENDING_UPDATE', self.api.load_balancer_show(
+            self.lb['id'])['provisioning_status'])
+
+    def test_latency(self):
+        self.server.latency = 0.05
+        start = time.monotonic()
+        self.api.load_balancer_show(self.lb['id'])
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_compressed(self):
+        self.server.compress = True
+        self.assertEqual(25, len(self.api.member_list(self.pool_id)[
+            'members']))
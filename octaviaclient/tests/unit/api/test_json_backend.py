@@ -0,0 +1,116 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""JSON backend tests"""
+
+import json
+from unittest import mock
+
+from keystoneauth1 import session
+import osc_lib.test.base as osc_test_base
+import requests
+from requests_mock.contrib import fixture
+
+from octaviaclient.api import json_backend
+from octaviaclient.api.v2 import octavia
+
+FAKE_URL = 'http://example.com/v2.0/'
+FAKE_LBAAS_URL = FAKE_URL + 'lbaas/'
+
+PAYLOAD = {
+    'loadbalancers': [{
+        'id': '607226db-27ef-4d41-ae89-f2a800e9c2db',
+        'name': 'best_load_balancer/é',
+        'admin_state_up': True,
+        'vip_address': '203.0.113.50',
+        'listeners': [{'id': '023f2e34-7806-443b-bfae-16c324569a3d'}],
+        'pools': [],
+        'tags': [],
+        'flavor_id': None,
+        'weight': 1.5,
+        'bytes_in': 2 ** 64 - 1,
+    }],
+    'loadbalancers_links': [],
+}
+
+
+class TestJSONBackend(osc_test_base.TestCase):
+
+    def _response(self, content):
+        response = requests.Response()
+        response._content = content
+        response.encoding = 'utf-8'
+        return response
+
+    def test_available(self):
+        backends = json_backend.available()
+        self.assertIn('json', backends)
+        self.assertNotEqual('ujson', backends[0])
+        self.assertEqual(sorted(backends, key=json_backend.BACKENDS.index),
+                         backends)
+
+    def test_get_loads_unavailable(self):
+        self.assertIs(json.loads, json_backend.get_loads('json'))
+        self.assertRaises(ValueError, json_backend.get_loads, 'simdjson')
+
+    def test_identical_types(self):
+        body = json.dumps(PAYLOAD).encode()
+        for name in json_backend.available():
+            decode = json_backend.response_decoder(
+                self._response(body), json_backend.get_loads(name))
+            ret = decode()
+            self.assertEqual(PAYLOAD, ret, name)
+            self.assertIsInstance(
+                ret['loadbalancers'][0]['bytes_in'], int, name)
+
+    def test_invalid_body_falls_back(self):
+        loads = mock.Mock(side_effect=ValueError)
+        for body in (b'', b'not json'):
+            decode = json_backend.response_decoder(self._response(body),
+                                                   loads)
+            self.assertRaises(requests.JSONDecodeError, decode)
+
+    def test_lazy_import(self):
+        self.addCleanup(json_backend._LOADS.pop, 'ujson', None)
+        json_backend._LOADS.pop('ujson', None)
+        with mock.patch('importlib.import_module') as import_module:
+            import_module.return_value.loads.return_value = 'decoded'
+            with mock.patch.object(json_backend, 'available',
+                                   return_value=['json', 'ujson']):
+                loads = json_backend.get_loads('ujson')
+            self.assertFalse(import_module.called)
+
+            self.assertEqual('decoded', loads(b'{}'))
+            self.assertEqual('decoded', loads(b'{}'))
+        import_module.assert_called_once_with('ujson')
+
+
+class TestOctaviaJSONBackend(osc_test_base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.requests_mock = self.useFixture(fixture.Fixture())
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'loadbalancers', json=PAYLOAD)
+
+    def test_backends(self):
+        for name in json_backend.available():
+            api = octavia.OctaviaAPI(session=session.Session(),
+                                     endpoint=FAKE_URL, json_backend=name)
+            self.assertEqual(name, api.json_backend)
+            self.assertEqual({'loadbalancers': PAYLOAD['loadbalancers']},
+                             api.load_balancer_list())
+
+    def test_default_backend(self):
+        api = octavia.OctaviaAPI(session=session.Session(), endpoint=FAKE_URL)
+        self.assertEqual(json_backend.available()[0], api.json_backend)
@@ -0,0 +1,176 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Name to ID cache tests"""
+
+import os
+from unittest import mock
+
+import fixtures
+from keystoneauth1 import session
+from osc_lib import exceptions as osc_exc
+import osc_lib.test.base as osc_test_base
+from oslo_utils import uuidutils
+from requests_mock.contrib import fixture
+
+from octaviaclient.api.v2 import name_cache
+from octaviaclient.api.v2 import octavia
+from octaviaclient.osc.v2 import utils as v2_utils
+
+FAKE_URL = 'http://example.com/v2.0/'
+FAKE_LBAAS_URL = FAKE_URL + 'lbaas/'
+FAKE_PO = uuidutils.generate_uuid()
+
+
+class TestNameCache(osc_test_base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                                 'cache', 'names.json')
+        self.scope = ['http://example.com', 'project']
+        self.cache = name_cache.NameCache(60, lambda: self.scope,
+                                          path=self.path)
+
+    def test_set_get(self):
+        self.assertIsNone(self.cache.get('pools', 'web'))
+        self.cache.set('pools', 'web', FAKE_PO)
+        self.assertEqual(FAKE_PO, self.cache.get('pools', 'web'))
+        # Persisted on disk
+        other = name_cache.NameCache(60, lambda: self.scope, path=self.path)
+        self.assertEqual(FAKE_PO, other.get('pools', 'web'))
+
+    def test_scoped(self):
+        self.cache.set('pools', 'web', FAKE_PO)
+        self.assertIsNone(self.cache.get('loadbalancers', 'web'))
+        self.scope = ['http://example.com', 'other-project']
+        self.assertIsNone(self.cache.get('pools', 'web'))
+
+    def test_parent(self):
+        self.cache.set('members', {'member_id': 'm', 'pool_id': 'a'}, 'id1')
+        self.assertIsNone(
+            self.cache.get('members', {'member_id': 'm', 'pool_id': 'b'}))
+        self.assertEqual(
+            'id1',
+            self.cache.get('members', {'pool_id': 'a', 'member_id': 'm'}))
+
+    @mock.patch('time.time')
+    def test_ttl(self, mock_time):
+        mock_time.return_value = 1000
+        self.cache.set('pools', 'web', FAKE_PO)
+        mock_time.return_value = 1059
+        self.assertEqual(FAKE_PO, self.cache.get('pools', 'web'))
+        mock_time.return_value = 1061
+        self.assertIsNone(self.cache.get('pools', 'web'))
+
+    def test_invalidate(self):
+        self.cache.set('pools', 'web', FAKE_PO)
+        self.cache.set('pools', 'db', 'other')
+        self.cache.invalidate(['v2', 'lbaas', 'pools', FAKE_PO])
+        self.assertIsNone(self.cache.get('pools', 'web'))
+        self.assertEqual('other', self.cache.get('pools', 'db'))
+
+    def test_file_read_once(self):
+        self.cache.set('pools', 'web', FAKE_PO)
+        other = name_cache.NameCache(60, lambda: self.scope, path=self.path)
+        with mock.patch('builtins.open', side_effect=open) as mock_open:
+            for _ in range(3):
+                self.assertEqual(FAKE_PO, other.get('pools', 'web'))
+                self.assertIsNone(other.get('pools', 'db'))
+        self.assertEqual(1, mock_open.call_count)
+
+    def test_batch(self):
+        with mock.patch.object(self.cache, '_save',
+                               wraps=self.cache._save) as mock_save:
+            with self.cache.batch():
+                with self.cache.batch():
+                    for i in range(5):
+                        self.cache.set('pools', 'web{}'.format(i), FAKE_PO)
+                self.assertFalse(os.path.exists(self.path))
+            mock_save.assert_called_once_with()
+            with self.cache.batch():
+                self.cache.get('pools', 'web0')
+            mock_save.assert_called_once_with()
+        other = name_cache.NameCache(60, lambda: self.scope, path=self.path)
+        self.assertEqual(FAKE_PO, other.get('pools', 'web4'))
+
+    def test_corrupted_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as f:
+            f.write('not json')
+        self.assertIsNone(self.cache.get('pools', 'web'))
+        self.cache.set('pools', 'web', FAKE_PO)
+        self.assertEqual(FAKE_PO, self.cache.get('pools', 'web'))
+
+    def test_default_path(self):
+        self.useFixture(fixtures.EnvironmentVariable('XDG_CACHE_HOME',
+                                                     '/tmp/xdg'))
+        self.assertEqual('/tmp/xdg/octaviaclient/name-cache.json',
+                         name_cache.default_path())
+
+
+class TestOctaviaNameCache(osc_test_base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                            'names.json')
+        self.api = octavia.OctaviaAPI(session=session.Session(),
+                                      endpoint=FAKE_URL, name_cache_ttl=60,
+                                      name_cache_path=path)
+        self.requests_mock = self.useFixture(fixture.Fixture())
+
+    def test_disabled_by_default(self):
+        api = octavia.OctaviaAPI(session=session.Session(), endpoint=FAKE_URL)
+        self.assertIsNone(api.name_cache)
+
+    def test_resolve_cached(self):
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'pools?name=web',
+            json={'pools': [{'id': FAKE_PO, 'name': 'web'}]})
+        for _ in range(3):
+            self.assertEqual(FAKE_PO, v2_utils.get_resource_id(
+                self.api.pool_list, 'pools', 'web'))
+        self.assertEqual(1, self.requests_mock.call_count)
+
+    def test_resolve_batch_saved_once(self):
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'pools',
+            json={'pools': [{'id': FAKE_PO, 'name': 'web'}]})
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'listeners',
+            json={'listeners': [{'id': 'li', 'name': 'front'}]})
+        refs = [({'pool': 'web'}, 'pool', 'pools', self.api.pool_list),
+                ({'listener': 'front'}, 'listener', 'listeners',
+                 self.api.listener_list)]
+        with mock.patch.object(self.api.name_cache, '_save') as mock_save:
+            v2_utils._resolve_ids(refs)
+        mock_save.assert_called_once_with()
+        self.assertEqual({'pool': FAKE_PO}, refs[0][0])
+
+    def test_resolve_multiple_matches_not_cached(self):
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'pools?name=web',
+            json={'pools': [{'id': FAKE_PO, 'name': 'web'},
+                            {'id': 'other', 'name': 'web'}]})
+        for _ in range(2):
+            self.assertRaises(osc_exc.CommandError, v2_utils.get_resource_id,
+                              self.api.pool_list, 'pools', 'web')
+        self.assertEqual(2, self.requests_mock.call_count)
+
+    def test_not_found_invalidates(self):
+        self.api.name_cache.set('pools', 'web', FAKE_PO)
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'pools/' + FAKE_PO, status_code=404)
+        self.assertRaises(osc_exc.NotFound, self.api.pool_show, FAKE_PO)
+        self.assertIsNone(self.api.name_cache.get('pools', 'web'))
@@ -13,10 +13,18 @@
 
 """Load Balancer v2 API Library Tests"""
 
+import gzip
+from http import server
+import json
+import logging
+import threading
+
+import fixtures
 from keystoneauth1 import session
 from oslo_utils import uuidutils
 from requests_mock.contrib import fixture
 
+from osc_lib import exceptions as osc_exc
 import osc_lib.test.base as osc_test_base
 
 from octaviaclient.api import exceptions
@@ -227,6 +235,217 @@ class TestLoadBalancer(TestOctaviaClient):
             self.api.load_balancer_list)
         self.assertEqual(POLICY_ERROR_STRING, ret.message)
 
+    def test_iter_load_balancers_pagination(self):
+        next_href = (FAKE_LBAAS_URL + 'loadbalancers?limit=2&marker=' +
+                     FAKE_LB)
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_LBAAS_URL + 'loadbalancers',
+            [{'json': {'loadbalancers': [{'name': 'lb1'}, {'name': 'lb2'}],
+                       'loadbalancers_links': [{'rel': 'next',
+                                                'href': next_href}]},
+              'status_code': 200},
+             {'json': {'loadbalancers': [{'name': 'lb3'}]},
+              'status_code': 200}],
+        )
+        ret = self.api.iter_load_balancers()
+        self.assertEqual({'name': 'lb1'}, next(ret))
+        # Only the first page has been requested so far
+        self.assertEqual(1, self.requests_mock.call_count)
+        self.assertEqual([{'name': 'lb2'}, {'name': 'lb3'}], list(ret))
+        self.assertEqual(2, self.requests_mock.call_count)
+        self.assertEqual({'limit': ['2'], 'marker': [FAKE_LB]},
+                         self.requests_mock.last_request.qs)
+
+    def test_list_load_balancer_pagination(self):
+        next_href = FAKE_LBAAS_URL + 'loadbalancers?marker=' + FAKE_LB
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_LBAAS_URL + 'loadbalancers',
+            [{'json': {'loadbalancers': [{'name': 'lb1'}],
+                       'loadbalancers_links': [{'rel': 'next',
+                                                'href': next_href}]},
+              'status_code': 200},
+             {'json': {'loadbalancers': [{'name': 'lb2'}]},
+              'status_code': 200}],
+        )
+        ret = self.api.load_balancer_list()
+        self.assertEqual(LIST_LB_RESP, ret)
+
+    def test_list_load_balancer_limit(self):
+        pages = []
+        for i in range(3):
+            page = {'loadbalancers': [{'name': 'lb%d' % (2 * i)},
+                                      {'name': 'lb%d' % (2 * i + 1)}],
+                    'loadbalancers_links': [{
+                        'rel': 'next',
+                        'href': (FAKE_LBAAS_URL + 'loadbalancers?limit=2&'
+                                 'marker=lb%d' % (2 * i + 1))}]}
+            pages.append({'json': page, 'status_code': 200})
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'loadbalancers', pages)
+        ret = self.api.load_balancer_list(limit=3, marker=FAKE_LB,
+                                          sort='name:desc')
+        self.assertEqual(
+            {'loadbalancers': [{'name': 'lb0'}, {'name': 'lb1'},
+                               {'name': 'lb2'}]}, ret)
+        # No page is requested once the limit is met
+        self.assertEqual(2, self.requests_mock.call_count)
+        self.assertEqual(
+            {'limit': ['3'], 'marker': [FAKE_LB], 'sort': ['name:desc']},
+            self.requests_mock.request_history[0].qs)
+
+    def test_iter_load_balancers_prefetch_limit(self):
+        self.api.prefetch_depth = 2
+        page = {'loadbalancers': [{'name': 'lb0'}, {'name': 'lb1'}],
+                'loadbalancers_links': [{
+                    'rel': 'next',
+                    'href': FAKE_LBAAS_URL + 'loadbalancers?marker=lb1'}]}
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'loadbalancers',
+            json=page, status_code=200)
+        ret = list(self.api.iter_load_balancers(limit=1))
+        self.assertEqual([{'name': 'lb0'}], ret)
+
+    def test_count_load_balancers(self):
+        next_href = FAKE_LBAAS_URL + 'loadbalancers?limit=2&marker=lb2'
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_LBAAS_URL + 'loadbalancers',
+            [{'json': {'loadbalancers': [{'id': 'lb1'}, {'id': 'lb2'}],
+                       'loadbalancers_links': [{'rel': 'next',
+                                                'href': next_href}]},
+              'status_code': 200},
+             {'json': {'loadbalancers': [{'id': 'lb3'}]},
+              'status_code': 200}],
+        )
+        ret = self.api.count_load_balancers(name='lb', limit=1,
+                                            sort='name:desc')
+        self.assertEqual(3, ret)
+        self.assertEqual(
+            {'name': ['lb'], 'fields': ['id'],
+             'limit': [str(octavia.COUNT_PAGE_SIZE)]},
+            self.requests_mock.request_history[0].qs)
+
+    def test_count_load_balancers_filtered(self):
+        # Octavia's next links only carry the pagination parameters
+        next_href = (FAKE_LBAAS_URL + 'loadbalancers?limit=2&marker=lb2&'
+                     'sort=created_at:asc')
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_LBAAS_URL + 'loadbalancers',
+            [{'json': {'loadbalancers': [{'id': 'lb1'}, {'id': 'lb2'}],
+                       'loadbalancers_links': [{'rel': 'next',
+                                                'href': next_href}]},
+              'status_code': 200},
+             {'json': {'loadbalancers': [{'id': 'lb3'}]},
+              'status_code': 200}],
+        )
+        ret = self.api.count_load_balancers(provisioning_status='ERROR',
+                                            tags=['a', 'b'])
+        self.assertEqual(3, ret)
+        self.assertEqual(
+            {'limit': ['2'], 'marker': ['lb2'], 'sort': ['created_at:asc'],
+             'provisioning_status': ['error'], 'tags': ['a', 'b'],
+             'fields': ['id']},
+            self.requests_mock.last_request.qs)
+
+    def test_count_load_balancers_group_by(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_LBAAS_URL + 'loadbalancers',
+            json={'loadbalancers': [{'provisioning_status': 'ACTIVE'},
+                                    {'provisioning_status': 'ERROR'},
+                                    {'provisioning_status': 'ACTIVE'}]},
+            status_code=200,
+        )
+        ret = self.api.count_load_balancers(group_by='provisioning_status')
+        self.assertEqual({'ACTIVE': 2, 'ERROR': 1}, ret)
+        self.assertEqual(['provisioning_status'],
+                         self.requests_mock.last_request.qs['fields'])
+
+    def test_iter_load_balancers_not_allowed(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_LBAAS_URL + 'loadbalancers',
+            json=LIST_POLICY_ERR_RESP,
+            status_code=403,
+        )
+        ret = self.assertRaises(
+            octavia.OctaviaClientException,
+            list, self.api.iter_load_balancers())
+        self.assertEqual(POLICY_ERROR_STRING, ret.message)
+
+    def test_iter_load_balancers_prefetch(self):
+        self.api.prefetch_depth = 1
+        pages = []
+        for i in range(3):
+            page = {'loadbalancers': [{'name': 'lb%d' % i}]}
+            if i < 2:
+                page['loadbalancers_links'] = [{
+                    'rel': 'next',
+                    'href': (FAKE_LBAAS_URL +
+                             'loadbalancers?marker=lb%d' % i)}]
+            pages.append({'json': page, 'status_code': 200})
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'loadbalancers', pages)
+        ret = list(self.api.iter_load_balancers())
+        self.assertEqual([{'name': 'lb0'}, {'name': 'lb1'}, {'name': 'lb2'}],
+                         ret)
+        self.assertEqual(3, self.requests_mock.call_count)
+
+    def test_iter_load_balancers_prefetch_not_allowed(self):
+        self.api.prefetch_depth = 2
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_LBAAS_URL + 'loadbalancers',
+            json=LIST_POLICY_ERR_RESP,
+            status_code=403,
+        )
+        ret = self.assertRaises(
+            octavia.OctaviaClientException,
+            self.api.load_balancer_list)
+        self.assertEqual(POLICY_ERROR_STRING, ret.message)
+
+    def test_list_load_balancer_fields(self):
+        next_href = FAKE_LBAAS_URL + 'loadbalancers?marker=' + FAKE_LB
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_LBAAS_URL + 'loadbalancers',
+            [{'json': {'loadbalancers': [{'name': 'lb1'}],
+                       'loadbalancers_links': [{'rel': 'next',
+                                                'href': next_href}]},
+              'status_code': 200},
+             {'json': {'loadbalancers': [{'name': 'lb2'}]},
+              'status_code': 200}],
+        )
+        ret = self.api.load_balancer_list(fields=['id', 'name'])
+        self.assertEqual(LIST_LB_RESP, ret)
+        for request in self.requests_mock.request_history:
+            self.assertEqual(['id', 'name'], request.qs['fields'])
+
+    def test_show_load_balancer_fields(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_LBAAS_URL + 'loadbalancers/' + FAKE_LB,
+            json=SINGLE_LB_RESP,
+            status_code=200
+        )
+        ret = self.api.load_balancer_show(FAKE_LB, fields=['id', 'name'])
+        self.assertEqual(SINGLE_LB_RESP['loadbalancer'], ret)
+        self.assertEqual(['id', 'name'],
+                         self.requests_mock.last_request.qs['fields'])
+
+    def test_show_load_balancer_fields_not_found(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_LBAAS_URL + 'loadbalancers/' + FAKE_LB,
+            status_code=404
+        )
+        self.assertRaises(osc_exc.NotFound,
+                          self.api.load_balancer_show, FAKE_LB,
+                          fields=['id'])
+
     def test_show_load_balancer(self):
         self.requests_mock.register_uri(
             'GET',
@@ -581,6 +800,16 @@ class TestLoadBalancer(TestOctaviaClient):
             self.api.member_list, FAKE_PO)
         self.assertEqual(POLICY_ERROR_STRING, ret.message)
 
+    def test_iter_members(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_LBAAS_URL + 'pools/' + FAKE_PO + '/members',
+            json=LIST_ME_RESP,
+            status_code=200,
+        )
+        ret = self.api.iter_members(FAKE_PO)
+        self.assertEqual(LIST_ME_RESP['members'], list(ret))
+
     def test_show_member(self):
         self.requests_mock.register_uri(
             'GET',
@@ -613,6 +842,41 @@ class TestLoadBalancer(TestOctaviaClient):
                                self.api.member_create,
                                json=SINGLE_ME_RESP, pool_id=FAKE_PO)
 
+    def test_batch_update_member(self):
+        self.requests_mock.register_uri(
+            'PUT',
+            FAKE_LBAAS_URL + 'pools/' + FAKE_PO + '/members',
+            status_code=202
+        )
+        members = [{'address': '192.0.2.10', 'protocol_port': 80}]
+        ret = self.api.member_batch_update(FAKE_PO, members)
+        self.assertEqual(202, ret.status_code)
+        self.assertEqual({'members': members},
+                         self.requests_mock.last_request.json())
+        self.assertEqual({}, self.requests_mock.last_request.qs)
+
+    def test_batch_update_member_additive_only(self):
+        self.requests_mock.register_uri(
+            'PUT',
+            FAKE_LBAAS_URL + 'pools/' + FAKE_PO + '/members',
+            status_code=202
+        )
+        self.api.member_batch_update(FAKE_PO, [], additive_only=True)
+        self.assertEqual({'additive_only': ['true']},
+                         self.requests_mock.last_request.qs)
+
+    def test_batch_update_member_error(self):
+        self.requests_mock.register_uri(
+            'PUT',
+            FAKE_LBAAS_URL + 'pools/' + FAKE_PO + '/members',
+            text='{"faultstring": "%s"}' % self._error_message,
+            status_code=400
+        )
+        self.assertRaisesRegex(exceptions.OctaviaClientException,
+                               self._error_message,
+                               self.api.member_batch_update,
+                               FAKE_PO, [])
+
     def test_set_member(self):
         self.requests_mock.register_uri(
             'PUT',
@@ -1491,3 +1755,144 @@ class TestLoadBalancer(TestOctaviaClient):
                                self._error_message,
                                self.api.availabilityzoneprofile_delete,
                                FAKE_AZPF)
+
+
+class TestMap(TestOctaviaClient):
+
+    def _register_stats(self, lb_ids, status_code=200):
+        for lb_id in lb_ids:
+            self.requests_mock.register_uri(
+                'GET',
+                FAKE_LBAAS_URL + 'loadbalancers/' + lb_id + '/stats',
+                json={'stats': {'bytes_in': lb_id}},
+                status_code=status_code,
+            )
+
+    def test_map_in_order(self):
+        lb_ids = [uuidutils.generate_uuid() for _ in range(20)]
+        self._register_stats(lb_ids)
+        ret = self.api.map(self.api.load_balancer_stats_show, lb_ids)
+        self.assertEqual([{'stats': {'bytes_in': lb_id}} for lb_id in lb_ids],
+                         ret)
+
+    def test_map_method_name_and_tuples(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_LBAAS_URL + 'pools/' + FAKE_PO + '/members/' + FAKE_ME,
+            json=SINGLE_ME_RESP,
+            status_code=200,
+        )
+        ret = self.api.map('member_show', [(FAKE_PO, FAKE_ME)])
+        self.assertEqual([SINGLE_ME_RESP['member']], ret)
+
+    def test_map_collects_errors(self):
+        self._register_stats([FAKE_LB])
+        self._register_stats([FAKE_LI], status_code=409)
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'loadbalancers/' + FAKE_PO,
+            status_code=404)
+        ret = self.api.map('load_balancer_stats_show', [FAKE_LI, FAKE_LB])
+        self.assertIsInstance(ret[0], exceptions.OctaviaClientException)
+        self.assertEqual(409, ret[0].code)
+        self.assertEqual({'stats': {'bytes_in': FAKE_LB}}, ret[1])
+
+        ret = self.api.map('load_balancer_show', [FAKE_PO])
+        self.assertIsInstance(ret[0], osc_exc.NotFound)
+
+    def test_map_fail_fast(self):
+        lb_ids = [uuidutils.generate_uuid() for _ in range(5)]
+        self._register_stats(lb_ids[:1], status_code=409)
+        self._register_stats(lb_ids[1:])
+        self.assertRaises(exceptions.OctaviaClientException, self.api.map,
+                          'load_balancer_stats_show', lb_ids, max_workers=1,
+                          fail_fast=True)
+        # Nothing is started after the failure
+        self.assertEqual(1, self.requests_mock.call_count)
+
+    def test_map_max_workers(self):
+        self.assertEqual(10, self.api._connection_pool_size())
+        self.assertRaises(ValueError, self.api.map, 'load_balancer_show',
+                          [FAKE_LB], max_workers=-1)
+        self.assertEqual([], self.api.map('load_balancer_show', []))
+        self.assertIs(self.api._get_executor(), self.api._get_executor())
+
+
+class _Handler(server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    body = json.dumps(LIST_LB_RESP).encode()
+
+    def do_GET(self):
+        body = self.body
+        self.send_response(200)
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTransport(osc_test_base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        httpd = server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.addCleanup(httpd.server_close)
+        self.addCleanup(httpd.shutdown)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        self.endpoint = 'http://127.0.0.1:{}/'.format(httpd.server_port)
+        self.sess = session.Session()
+
+    def test_default_adapter(self):
+        api = octavia.OctaviaAPI(session=self.sess, endpoint=self.endpoint)
+        self.assertEqual({'maxsize': 10, 'connections': 0, 'requests': 0,
+                          'reused': 0}, api.connection_pool_stats())
+        self.assertIs(self.sess.session.get_adapter('https://example.com'),
+                      self.sess.session.get_adapter(api.endpoint))
+
+    def test_pool_maxsize(self):
+        api = octavia.OctaviaAPI(session=self.sess,
+                                 endpoint=self.endpoint + 'load-balancer',
+                                 pool_maxsize=32)
+        adapter = self.sess.session.get_adapter(api.endpoint + '/lbaas')
+        self.assertIsInstance(adapter, session.TCPKeepAliveAdapter)
+        self.assertEqual(32, adapter.poolmanager.connection_pool_kw[
+            'maxsize'])
+        self.assertEqual(32, api.pool_maxsize)
+        self.assertEqual(32, api._connection_pool_size())
+        # Other endpoints, on the same host too, keep the adapter of the
+        # session
+        default = self.sess.session.get_adapter('http://127.0.0.2/')
+        self.assertIsNot(adapter, default)
+        self.assertIs(default, self.sess.session.get_adapter(
+            self.endpoint + 'identity/v3'))
+
+        for _ in range(3):
+            api.load_balancer_list()
+        self.assertEqual({'maxsize': 32, 'connections': 1, 'requests': 3,
+                          'reused': 2}, api.connection_pool_stats())
+
+    def test_compressed_response(self):
+        _Handler.body = json.dumps(
+            {'loadbalancers': [{'name': 'lb'}] * 1000}).encode()
+        self.addCleanup(setattr, _Handler, 'body',
+                        json.dumps(LIST_LB_RESP).encode())
+        logger = self.useFixture(fixtures.FakeLogger(
+            name='octaviaclient.api.v2.octavia', level=logging.DEBUG))
+        api = octavia.OctaviaAPI(session=self.sess, endpoint=self.endpoint)
+
+        ret = api.load_balancer_list()
+
+        self.assertEqual(1000, len(ret['loadbalancers']))
+        decoded = len(_Handler.body)
+        received = len(gzip.compress(_Handler.body))
+        self.assertIn(
+            'GET {}v2.0/lbaas/loadbalancers: {} bytes received, {} bytes '
+            'decoded (Content-Encoding: gzip)'.format(
+                self.endpoint, received, decoded),
+            logger.output)
@@ -0,0 +1,77 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Poll strategies tests"""
+
+import itertools
+from unittest import mock
+
+import osc_lib.test.base as osc_test_base
+
+from octaviaclient.api import exceptions
+from octaviaclient.api.v2 import poll
+
+
+class TestPoll(osc_test_base.TestCase):
+
+    def test_incomplete_strategy(self):
+        class NoDelays(poll.PollStrategy):
+            pass
+
+        self.assertRaises(TypeError, NoDelays)
+
+    def test_fixed(self):
+        delays = poll.FixedPoll(2).delays()
+        self.assertEqual([2, 2, 2], list(itertools.islice(delays, 3)))
+
+    def test_backoff(self):
+        delays = poll.BackoffPoll(initial=0.5, max_interval=3, factor=2,
+                                  jitter=0).delays()
+        self.assertEqual([0.5, 1, 2, 3, 3],
+                         list(itertools.islice(delays, 5)))
+
+    def test_backoff_jitter(self):
+        delays = poll.BackoffPoll(initial=1, max_interval=10, factor=2,
+                                  jitter=0.25).delays()
+        for expected, delay in zip([1, 2, 4, 8], delays):
+            self.assertGreaterEqual(delay, expected * 0.75)
+            self.assertLessEqual(delay, expected * 1.25)
+
+    def test_backoff_jitter_capped(self):
+        delays = poll.BackoffPoll(initial=3, max_interval=3,
+                                  jitter=0.5).delays()
+        for delay in itertools.islice(delays, 20):
+            self.assertLessEqual(delay, 3)
+
+    def test_get_strategy(self):
+        strategy = poll.get_strategy(0.2)
+        self.assertEqual(0.2, strategy.initial)
+        self.assertEqual(0.2, strategy.max_interval)
+        strategy = poll.get_strategy()
+        self.assertEqual(poll.DEFAULT_MAX_INTERVAL, strategy.max_interval)
+
+    @mock.patch('time.sleep')
+    def test_poller_sleep(self, mock_sleep):
+        poller = poll.Poller(strategy=poll.FixedPoll(2))
+        poller.sleep(50)
+        mock_sleep.assert_called_once_with(2)
+
+    @mock.patch('time.sleep')
+    @mock.patch('time.monotonic')
+    def test_poller_timeout(self, mock_monotonic, mock_sleep):
+        mock_monotonic.side_effect = [100, 101, 105]
+        poller = poll.Poller(strategy=poll.FixedPoll(3), timeout=5)
+        # Sleeps no longer than the time left
+        poller.sleep()
+        mock_sleep.assert_called_once_with(3)
+        self.assertRaises(exceptions.OctaviaClientException, poller.sleep)
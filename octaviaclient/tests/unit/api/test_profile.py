@@ -0,0 +1,144 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""HTTP request profiling tests"""
+
+import io
+import json
+
+from keystoneauth1 import session
+from osc_lib import exceptions as osc_exc
+import osc_lib.test.base as osc_test_base
+from oslo_utils import uuidutils
+from requests_mock.contrib import fixture
+
+from octaviaclient.api.v2 import octavia
+from octaviaclient.api.v2 import profile
+
+FAKE_URL = 'http://example.com/v2.0/'
+FAKE_LBAAS_URL = FAKE_URL + 'lbaas/'
+FAKE_LB = uuidutils.generate_uuid()
+FAKE_PO = uuidutils.generate_uuid()
+
+
+class TestPathTemplate(osc_test_base.TestCase):
+
+    def test_path_template(self):
+        for path, template in (
+                ('//lbaas/loadbalancers/' + FAKE_LB,
+                 '/lbaas/loadbalancers/{uuid}'),
+                ('/lbaas/loadbalancers?name=lb1', '/lbaas/loadbalancers'),
+                ('/lbaas/quotas/defaults', '/lbaas/quotas/defaults'),
+                ('/lbaas/quotas/' + FAKE_LB, '/lbaas/quotas/{uuid}'),
+                ('/lbaas/pools/{}/members'.format(FAKE_PO),
+                 '/lbaas/pools/{pool_id}/members'),
+                ('/lbaas/availabilityzones/az1',
+                 '/lbaas/availabilityzones/{name}'),
+                ('/unknown/path', '/unknown/path')):
+            self.assertEqual(template, profile.path_template(path))
+
+
+class TestProfiler(osc_test_base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.profiler = profile.Profiler()
+        self.profiler.record('GET', '/lbaas/loadbalancers', 200, 0.01, 100)
+        self.profiler.record('GET', '/lbaas/loadbalancers?marker=x', 200,
+                             0.02, 50)
+        self.profiler.record('PUT', '/lbaas/loadbalancers/' + FAKE_LB, 409,
+                             0.005, 20)
+        self.profiler.record('DELETE', '/lbaas/loadbalancers/' + FAKE_LB,
+                             None, 0.001, None)
+
+    def test_summary(self):
+        self.assertEqual([
+            {'method': 'GET', 'path': '/lbaas/loadbalancers', 'calls': 2,
+             'pages': 2, 'errors': 0, 'latency': 0.03, 'bytes': 150},
+            {'method': 'PUT', 'path': '/lbaas/loadbalancers/{uuid}',
+             'calls': 1, 'pages': 0, 'errors': 1, 'latency': 0.005,
+             'bytes': 20},
+            {'method': 'DELETE', 'path': '/lbaas/loadbalancers/{uuid}',
+             'calls': 1, 'pages': 0, 'errors': 1, 'latency': 0.001,
+             'bytes': 0},
+            {'method': 'TOTAL', 'path': '', 'calls': 4, 'pages': 2,
+             'errors': 2, 'latency': 0.036, 'bytes': 170},
+        ], self.profiler.summary())
+
+    def test_report_table(self):
+        stream = io.StringIO()
+        self.profiler.report(stream)
+        self.assertEqual(
+            'Load balancer API requests:\n'
+            'METHOD  PATH                         CALLS  PAGES  ERRORS    MS'
+            '  BYTES\n'
+            'GET     /lbaas/loadbalancers             2      2       0  30.0'
+            '    150\n'
+            'PUT     /lbaas/loadbalancers/{uuid}      1      0       1   5.0'
+            '     20\n'
+            'DELETE  /lbaas/loadbalancers/{uuid}      1      0       1   1.0'
+            '      0\n'
+            'TOTAL                                    4      2       2  36.0'
+            '    170\n',
+            stream.getvalue())
+
+    def test_report_json(self):
+        stream = io.StringIO()
+        self.profiler.report(stream, 'json')
+        ret = json.loads(stream.getvalue())
+        self.assertEqual(4, len(ret['requests']))
+        self.assertEqual(self.profiler.summary(), ret['summary'])
+
+    def test_report_empty(self):
+        stream = io.StringIO()
+        profile.Profiler().report(stream)
+        self.assertEqual('Load balancer API requests: none\n',
+                         stream.getvalue())
+
+
+class TestOctaviaProfiler(osc_test_base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.profiler = profile.Profiler()
+        self.api = octavia.OctaviaAPI(session=session.Session(),
+                                      endpoint=FAKE_URL,
+                                      profiler=self.profiler)
+        self.requests_mock = self.useFixture(fixture.Fixture())
+
+    def test_requests_recorded(self):
+        next_href = FAKE_LBAAS_URL + 'loadbalancers?limit=1&marker=' + FAKE_LB
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'loadbalancers',
+            [{'json': {'loadbalancers': [{'id': FAKE_LB}],
+                       'loadbalancers_links': [{'rel': 'next',
+                                                'href': next_href}]}},
+             {'json': {'loadbalancers': []}}])
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'loadbalancers/' + FAKE_LB,
+            status_code=404)
+
+        self.api.load_balancer_list()
+        self.assertRaises(osc_exc.NotFound, self.api.load_balancer_show,
+                          FAKE_LB)
+
+        self.assertEqual(
+            [('GET', '/lbaas/loadbalancers', 200, True),
+             ('GET', '/lbaas/loadbalancers', 200, True),
+             ('GET', '/lbaas/loadbalancers/{uuid}', 404, False)],
+            [(r['method'], r['path'], r['status'], r['page'])
+             for r in self.profiler.requests])
+        for request in self.profiler.requests:
+            self.assertGreaterEqual(request['latency'], 0)
+        self.assertEqual(len(json.dumps({'loadbalancers': []})),
+                         self.profiler.requests[1]['bytes'])
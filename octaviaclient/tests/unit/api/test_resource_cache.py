@@ -0,0 +1,191 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Resource cache tests"""
+
+from unittest import mock
+
+from keystoneauth1 import session
+from osc_lib import exceptions as osc_exc
+import osc_lib.test.base as osc_test_base
+from oslo_utils import uuidutils
+from requests_mock.contrib import fixture
+
+from octaviaclient.api import exceptions
+from octaviaclient.api.v2 import octavia
+from octaviaclient.api.v2 import resource_cache
+
+FAKE_URL = 'http://example.com/v2.0/'
+FAKE_LBAAS_URL = FAKE_URL + 'lbaas/'
+FAKE_LB = uuidutils.generate_uuid()
+FAKE_LI = uuidutils.generate_uuid()
+FAKE_PO = uuidutils.generate_uuid()
+FAKE_ME = uuidutils.generate_uuid()
+FAKE_PRJ = uuidutils.generate_uuid()
+
+LB = {'id': FAKE_LB, 'provisioning_status': 'ACTIVE', 'project_id': FAKE_PRJ,
+      'listeners': [{'id': FAKE_LI}], 'pools': [{'id': FAKE_PO}]}
+POOL = {'id': FAKE_PO, 'provisioning_status': 'ACTIVE',
+        'project_id': FAKE_PRJ, 'members': [{'id': FAKE_ME}]}
+MEMBER = {'id': FAKE_ME, 'provisioning_status': 'ACTIVE',
+          'project_id': FAKE_PRJ}
+
+LB_URL = '/lbaas/loadbalancers/' + FAKE_LB
+POOL_URL = '/lbaas/pools/' + FAKE_PO
+MEMBER_URL = POOL_URL + '/members/' + FAKE_ME
+
+
+class TestResourceCache(osc_test_base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = resource_cache.ResourceCache(60, maxsize=3)
+
+    def test_get_set(self):
+        self.assertIsNone(self.cache.get(LB_URL))
+        self.cache.set(LB_URL, LB)
+        ret = self.cache.get(LB_URL)
+        self.assertEqual(LB, ret)
+        # Callers get a copy
+        ret['listeners'].append('changed')
+        self.assertEqual(LB, self.cache.get(LB_URL))
+
+    def test_fields(self):
+        self.cache.set(LB_URL, {'id': FAKE_LB}, fields=['id'])
+        self.assertIsNone(self.cache.get(LB_URL))
+        self.assertEqual({'id': FAKE_LB},
+                         self.cache.get(LB_URL, fields=['id']))
+
+    def test_pending_not_cached(self):
+        self.cache.set(LB_URL, dict(LB, provisioning_status='PENDING_UPDATE'))
+        self.assertIsNone(self.cache.get(LB_URL))
+
+    @mock.patch('time.monotonic')
+    def test_ttl(self, mock_time):
+        mock_time.return_value = 100
+        self.cache.set(LB_URL, LB)
+        mock_time.return_value = 159
+        self.assertEqual(LB, self.cache.get(LB_URL))
+        mock_time.return_value = 160
+        self.assertIsNone(self.cache.get(LB_URL))
+
+    def test_lru(self):
+        self.cache.set(LB_URL, LB)
+        self.cache.set(POOL_URL, POOL)
+        self.cache.set(MEMBER_URL, MEMBER)
+        self.cache.get(LB_URL)
+        self.cache.set('/lbaas/listeners/' + FAKE_LI, {'id': FAKE_LI})
+        self.assertIsNone(self.cache.get(POOL_URL))
+        self.assertEqual(LB, self.cache.get(LB_URL))
+
+    def test_invalidate_parents(self):
+        self.cache.set(LB_URL, LB)
+        self.cache.set(POOL_URL, POOL)
+        self.cache.set(MEMBER_URL, MEMBER)
+        self.cache.invalidate(MEMBER_URL)
+        self.assertIsNone(self.cache.get(MEMBER_URL))
+        # Parent in the URL
+        self.assertIsNone(self.cache.get(POOL_URL))
+        # Refers to the pool
+        self.assertIsNone(self.cache.get(LB_URL))
+
+    def test_invalidate_children(self):
+        self.cache.set(MEMBER_URL, MEMBER)
+        self.cache.invalidate(POOL_URL)
+        self.assertIsNone(self.cache.get(MEMBER_URL))
+
+    def test_invalidate_bodies(self):
+        self.cache.set(LB_URL, LB)
+        self.cache.set(MEMBER_URL, MEMBER)
+        self.cache.invalidate('/lbaas/listeners',
+                              {'listener': {'loadbalancer_id': FAKE_LB,
+                                            'project_id': FAKE_PRJ}})
+        self.assertIsNone(self.cache.get(LB_URL))
+        # The project does not tie resources together
+        self.assertEqual(MEMBER, self.cache.get(MEMBER_URL))
+
+
+class TestOctaviaResourceCache(osc_test_base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.api = octavia.OctaviaAPI(session=session.Session(),
+                                      endpoint=FAKE_URL,
+                                      resource_cache_ttl=60)
+        self.requests_mock = self.useFixture(fixture.Fixture())
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'loadbalancers/' + FAKE_LB,
+            json={'loadbalancer': LB})
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'pools/' + FAKE_PO + '/members/' + FAKE_ME,
+            json={'member': MEMBER})
+
+    def test_disabled_by_default(self):
+        api = octavia.OctaviaAPI(session=session.Session(), endpoint=FAKE_URL)
+        self.assertIsNone(api.resource_cache)
+        api.load_balancer_show(FAKE_LB)
+        api.load_balancer_show(FAKE_LB)
+        self.assertEqual(2, self.requests_mock.call_count)
+
+    def test_show_cached(self):
+        for _ in range(3):
+            self.assertEqual(LB, self.api.load_balancer_show(FAKE_LB))
+            self.assertEqual(MEMBER,
+                             self.api.member_show(FAKE_PO, FAKE_ME))
+        self.assertEqual(2, self.requests_mock.call_count)
+
+    def test_set_invalidates(self):
+        self.requests_mock.register_uri(
+            'PUT', FAKE_LBAAS_URL + 'pools/' + FAKE_PO + '/members/' + FAKE_ME,
+            json={'member': MEMBER})
+        self.api.load_balancer_show(FAKE_LB)
+        self.api.member_show(FAKE_PO, FAKE_ME)
+        self.api.member_set(FAKE_PO, FAKE_ME, json={'member': {'weight': 2}})
+        self.api.load_balancer_show(FAKE_LB)
+        self.api.member_show(FAKE_PO, FAKE_ME)
+        self.assertEqual(5, self.requests_mock.call_count)
+
+    def test_failed_set_invalidates(self):
+        self.requests_mock.register_uri(
+            'PUT', FAKE_LBAAS_URL + 'loadbalancers/' + FAKE_LB,
+            status_code=409, json={'faultstring': 'Conflict'})
+        self.api.load_balancer_show(FAKE_LB)
+        self.assertRaises(exceptions.OctaviaClientException,
+                          self.api.load_balancer_set, FAKE_LB, json={})
+        self.api.load_balancer_show(FAKE_LB)
+        self.assertEqual(3, self.requests_mock.call_count)
+
+    def test_delete_invalidates(self):
+        self.requests_mock.register_uri(
+            'DELETE', FAKE_LBAAS_URL + 'loadbalancers/' + FAKE_LB,
+            status_code=204)
+        self.api.load_balancer_show(FAKE_LB)
+        self.api.load_balancer_delete(FAKE_LB)
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'loadbalancers/' + FAKE_LB,
+            status_code=404)
+        self.assertRaises(osc_exc.NotFound, self.api.load_balancer_show,
+                          FAKE_LB)
+
+    def test_pending_polled(self):
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'loadbalancers/' + FAKE_LB,
+            [{'json': {'loadbalancer': dict(
+                LB, provisioning_status='PENDING_UPDATE')}},
+             {'json': {'loadbalancer': LB}}])
+        self.assertEqual('PENDING_UPDATE', self.api.load_balancer_show(
+            FAKE_LB)['provisioning_status'])
+        for _ in range(2):
+            self.assertEqual('ACTIVE', self.api.load_balancer_show(
+                FAKE_LB)['provisioning_status'])
+        self.assertEqual(2, self.requests_mock.call_count)
@@ -0,0 +1,194 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Load Balancer v2 mutation scheduler tests"""
+
+import threading
+from unittest import mock
+
+from osc_lib import exceptions as osc_exc
+import osc_lib.test.base as osc_test_base
+from oslo_utils import uuidutils
+
+from octaviaclient.api import exceptions
+from octaviaclient.api.v2 import poll
+from octaviaclient.api.v2 import scheduler
+
+LB_A = uuidutils.generate_uuid()
+LB_B = uuidutils.generate_uuid()
+POOL_A = uuidutils.generate_uuid()
+POOL_B = uuidutils.generate_uuid()
+LISTENER_A = uuidutils.generate_uuid()
+L7POLICY_A = uuidutils.generate_uuid()
+HM_A = uuidutils.generate_uuid()
+
+
+class TestMutationScheduler(osc_test_base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.api = mock.Mock()
+        self.api.pool_show.side_effect = lambda pool_id: {
+            POOL_A: {'loadbalancers': [{'id': LB_A}]},
+            POOL_B: {'loadbalancers': [{'id': LB_B}]},
+        }[pool_id]
+        self.api.listener_show.return_value = {
+            'loadbalancers': [{'id': LB_A}]}
+        self.api.l7policy_show.return_value = {'listener_id': LISTENER_A}
+        self.api.health_monitor_show.return_value = {
+            'pools': [{'id': POOL_A}]}
+        self.api.load_balancer_show.return_value = {
+            'provisioning_status': 'ACTIVE'}
+        self.scheduler = scheduler.MutationScheduler(
+            self.api, strategy=poll.FixedPoll(0))
+
+    def test_parent_chain(self):
+        ops = [
+            self.scheduler.submit('member_create', POOL_A, json={}),
+            self.scheduler.submit('member_delete', POOL_B, 'member'),
+            self.scheduler.submit('health_monitor_set', HM_A, json={}),
+            self.scheduler.submit(
+                'l7rule_delete', l7rule_id='rule', l7policy_id=L7POLICY_A),
+            self.scheduler.submit(
+                'l7policy_create',
+                json={'l7policy': {'listener_id': LISTENER_A}}),
+            self.scheduler.submit(
+                'pool_create', json={'pool': {'loadbalancer_id': LB_B}}),
+            self.scheduler.submit('load_balancer_set', LB_B, json={}),
+        ]
+        self.scheduler.run()
+        self.assertEqual([LB_A, LB_B, LB_A, LB_A, LB_A, LB_B, LB_B],
+                         [op.loadbalancer_id for op in ops])
+        self.assertEqual([None] * len(ops), [op.error for op in ops])
+        # Parents are looked up once
+        self.assertEqual(1, self.api.listener_show.call_count)
+        self.assertEqual(2, self.api.pool_show.call_count)
+
+    def test_order_per_loadbalancer(self):
+        calls = []
+        lock = threading.Lock()
+
+        def record(pool_id, member_id):
+            with lock:
+                calls.append((pool_id, member_id))
+
+        self.api.member_delete.side_effect = record
+        for i in range(5):
+            self.scheduler.submit('member_delete', POOL_A, i)
+            self.scheduler.submit('member_delete', POOL_B, i)
+        self.scheduler.run()
+
+        self.assertEqual(list(range(5)),
+                         [m for p, m in calls if p == POOL_A])
+        self.assertEqual(list(range(5)),
+                         [m for p, m in calls if p == POOL_B])
+
+    def test_waits_for_active(self):
+        self.api.load_balancer_show.side_effect = [
+            {'provisioning_status': 'PENDING_UPDATE'},
+            {'provisioning_status': 'ACTIVE'},
+            {'provisioning_status': 'ACTIVE'},
+        ]
+        self.scheduler.submit('member_delete', POOL_A, 'm1')
+        self.scheduler.submit('member_delete', POOL_A, 'm2')
+        ops = self.scheduler.run()
+
+        self.assertEqual([None, None], [op.error for op in ops])
+        self.assertEqual(3, self.api.load_balancer_show.call_count)
+        self.api.load_balancer_show.assert_called_with(LB_A)
+
+    def test_no_wait_after_last_operation(self):
+        mutations = scheduler.MutationScheduler(
+            self.api, strategy=poll.FixedPoll(0), wait=False)
+        mutations.submit('member_delete', POOL_A, 'm1')
+        mutations.submit('member_delete', POOL_A, 'm2')
+        mutations.submit('member_delete', POOL_B, 'm3')
+        ops = mutations.run()
+
+        self.assertEqual([None] * 3, [op.error for op in ops])
+        # Only the operation followed by another one on LB_A is waited on
+        self.api.load_balancer_show.assert_called_once_with(LB_A)
+
+    def test_failure_skips_loadbalancer_queue(self):
+        def member_delete(pool_id, member_id):
+            if member_id == 'm1':
+                raise exceptions.OctaviaClientException(
+                    code=409, message='Conflict')
+
+        self.api.member_delete.side_effect = member_delete
+        failed = self.scheduler.submit('member_delete', POOL_A, 'm1')
+        skipped = self.scheduler.submit('member_delete', POOL_A, 'm2')
+        other = self.scheduler.submit('member_delete', POOL_B, 'm3')
+        self.scheduler.run()
+
+        self.assertEqual(409, failed.error.code)
+        self.assertIsInstance(skipped.error,
+                              exceptions.OctaviaClientException)
+        self.assertIsNone(other.error)
+        self.assertEqual(2, self.api.member_delete.call_count)
+
+    def test_error_status(self):
+        self.api.load_balancer_show.return_value = {
+            'provisioning_status': 'ERROR'}
+        op = self.scheduler.submit('member_delete', POOL_A, 'm1')
+        self.scheduler.run()
+        self.assertIn('ERROR', str(op.error))
+
+    def test_timeout(self):
+        self.api.load_balancer_show.return_value = {
+            'provisioning_status': 'PENDING_UPDATE'}
+        self.scheduler.timeout = 0
+        op = self.scheduler.submit('member_delete', POOL_A, 'm1')
+        self.scheduler.run()
+        self.assertIn('Timed out', str(op.error))
+
+    def test_loadbalancer_create_and_delete(self):
+        self.api.load_balancer_create.return_value = {
+            'loadbalancer': {'id': LB_B}}
+
+        def load_balancer_show(lb_id):
+            if lb_id == LB_A:
+                raise osc_exc.NotFound(404)
+            return {'provisioning_status': 'ACTIVE'}
+
+        self.api.load_balancer_show.side_effect = load_balancer_show
+        create = self.scheduler.submit('load_balancer_create', json={})
+        delete = self.scheduler.submit('load_balancer_delete', LB_A)
+        self.scheduler.run()
+
+        self.assertIsNone(create.error)
+        self.assertIsNone(delete.error)
+        self.assertEqual(LB_B, create.loadbalancer_id)
+
+    def test_unknown_parent(self):
+        self.api.pool_show.side_effect = osc_exc.NotFound(404)
+        op = self.scheduler.submit('member_delete', POOL_A, 'm1')
+        self.scheduler.run()
+        self.assertIsInstance(op.error, osc_exc.NotFound)
+        self.api.member_delete.assert_not_called()
+
+    def test_submit_not_a_mutation(self):
+        self.assertRaises(ValueError, self.scheduler.submit,
+                          'load_balancer_show', LB_A)
+        # Mutations of objects without a load balancer
+        for method in ('amphora_failover', 'flavor_create', 'quota_set'):
+            self.assertRaises(ValueError, self.scheduler.submit, method,
+                              'id', json={})
+
+    def test_submit_missing_parent(self):
+        self.assertRaises(ValueError, self.scheduler.submit,
+                          'listener_create', json={'listener': {}})
+        self.assertRaises(ValueError, self.scheduler.submit,
+                          'l7rule_delete', 'rule')
+        self.assertRaises(ValueError, self.scheduler.submit, 'member_delete')
+        self.assertEqual([], self.scheduler.run())
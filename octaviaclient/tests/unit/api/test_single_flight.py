@@ -0,0 +1,146 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Request coalescing tests"""
+
+from concurrent import futures
+import threading
+import time
+
+from keystoneauth1 import session
+from osc_lib import exceptions as osc_exc
+import osc_lib.test.base as osc_test_base
+from oslo_utils import uuidutils
+from requests_mock.contrib import fixture
+
+from octaviaclient.api.v2 import octavia
+from octaviaclient.api.v2 import single_flight
+
+FAKE_URL = 'http://example.com/v2.0/'
+FAKE_LBAAS_URL = FAKE_URL + 'lbaas/'
+FAKE_LB = uuidutils.generate_uuid()
+THREADS = 5
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError('Timed out')
+        time.sleep(0.001)
+
+
+class TestSingleFlight(osc_test_base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.flight = single_flight.SingleFlight()
+        self.release = threading.Event()
+        self.calls = []
+
+    def _call(self, value):
+        self.calls.append(value)
+        self.release.wait(5)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    def _run(self, keys, values):
+        with futures.ThreadPoolExecutor(len(keys)) as executor:
+            results = [executor.submit(self.flight.do, key, self._call, value)
+                       for key, value in zip(keys, values)]
+            _wait_for(lambda: self.flight.stats()['calls'] == len(keys))
+            self.release.set()
+        return results
+
+    def test_coalesced(self):
+        results = self._run(['a'] * THREADS, range(THREADS))
+        self.assertEqual([0], self.calls)
+        self.assertEqual([0] * THREADS, [r.result() for r in results])
+        self.assertEqual({'calls': THREADS, 'coalesced': THREADS - 1},
+                         self.flight.stats())
+
+    def test_different_keys(self):
+        results = self._run(['a', 'b', 'a'], [1, 2, 3])
+        self.assertEqual([1, 2, 1], [r.result() for r in results])
+        self.assertEqual(2, len(self.calls))
+
+    def test_error_shared(self):
+        error = ValueError('boom')
+        results = self._run(['a'] * 3, [error] * 3)
+        for result in results:
+            self.assertIs(error, result.exception())
+        self.assertEqual(1, len(self.calls))
+
+    def test_sequential_not_coalesced(self):
+        self.release.set()
+        self.assertEqual(1, self.flight.do('a', self._call, 1))
+        self.assertEqual(2, self.flight.do('a', self._call, 2))
+        self.assertEqual({'calls': 2, 'coalesced': 0}, self.flight.stats())
+
+    def test_forget(self):
+        with futures.ThreadPoolExecutor(2) as executor:
+            first = executor.submit(self.flight.do, 'a', self._call, 1)
+            _wait_for(lambda: self.calls)
+            self.flight.forget()
+            second = executor.submit(self.flight.do, 'a', self._call, 2)
+            _wait_for(lambda: len(self.calls) == 2)
+            self.release.set()
+        self.assertEqual((1, 2), (first.result(), second.result()))
+
+
+class TestOctaviaSingleFlight(osc_test_base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.requests_mock = self.useFixture(fixture.Fixture())
+
+    def _show_concurrently(self, api, status_code=200):
+        def respond(request, context):
+            _wait_for(lambda: api.coalescing_stats()['calls'] == THREADS)
+            context.status_code = status_code
+            return {'loadbalancer': {'id': FAKE_LB}}
+
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'loadbalancers/' + FAKE_LB, json=respond)
+        with futures.ThreadPoolExecutor(THREADS) as executor:
+            return [executor.submit(api.load_balancer_show, FAKE_LB)
+                    for _ in range(THREADS)]
+
+    def test_show_coalesced(self):
+        api = octavia.OctaviaAPI(session=session.Session(), endpoint=FAKE_URL)
+        results = self._show_concurrently(api)
+        rets = [r.result() for r in results]
+        self.assertEqual([{'id': FAKE_LB}] * THREADS, rets)
+        # Every caller gets its own copy
+        self.assertEqual(THREADS, len({id(ret) for ret in rets}))
+        self.assertEqual(1, self.requests_mock.call_count)
+        self.assertEqual({'calls': THREADS, 'coalesced': THREADS - 1},
+                         api.coalescing_stats())
+
+    def test_show_not_found_coalesced(self):
+        api = octavia.OctaviaAPI(session=session.Session(), endpoint=FAKE_URL)
+        results = self._show_concurrently(api, status_code=404)
+        for result in results:
+            self.assertIsInstance(result.exception(), osc_exc.NotFound)
+        self.assertEqual(1, self.requests_mock.call_count)
+
+    def test_disabled(self):
+        api = octavia.OctaviaAPI(session=session.Session(), endpoint=FAKE_URL,
+                                 coalesce_requests=False)
+        self.requests_mock.register_uri(
+            'GET', FAKE_LBAAS_URL + 'loadbalancers/' + FAKE_LB,
+            json={'loadbalancer': {'id': FAKE_LB}})
+        api.load_balancer_show(FAKE_LB)
+        self.assertEqual({'calls': 0, 'coalesced': 0},
+                         api.coalescing_stats())
@@ -0,0 +1,90 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Import cost of the plugin and of the commands for the openstack shell
+
+The modules are imported with ``python -X importtime`` on top of what the
+openstack shell has already loaded, only the modules they add are counted.
+Their import time is measured by tools/benchmarks/import_time.py.
+"""
+
+import os
+import pkgutil
+import subprocess
+import sys
+
+import osc_lib.test.base as osc_test_base
+
+import octaviaclient
+from octaviaclient.osc import v2
+
+# Modules loaded by the openstack shell before the plugin
+SHELL_MODULES = ('octaviaclient', 'openstackclient.shell')
+
+# Modules only imported when a command needs them
+DEFERRED_MODULES = ('octaviaclient.api.v2.octavia',
+                    'openstackclient.identity.common', 'keystoneclient.v3')
+
+# Number of modules loaded by the plugin and all the commands, 33 at the
+# time of writing, 84 when they loaded the Octavia API client and the
+# identity helpers
+MODULE_BUDGET = 40
+
+MODULES = ['octaviaclient.osc.plugin'] + [
+    'octaviaclient.osc.v2.' + module.name
+    for module in pkgutil.iter_modules(v2.__path__)]
+
+
+def import_times(modules):
+    """Returns the self import time of each module the given ones load
+
+    :param modules:
+        Names of the modules to import after the shell modules
+    :return:
+        A dict of the module names and their self import time in
+        microseconds
+    """
+    marker = 'octaviaclient-import-marker'
+    code = '\n'.join(
+        ['import ' + module for module in SHELL_MODULES] +
+        ['import sys', 'sys.stderr.write({!r} + "\\n")'.format(marker)] +
+        ['import ' + module for module in modules])
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(octaviaclient.__file__))
+    env['PYTHONPATH'] = os.pathsep.join(
+        [root] + [p for p in [env.get('PYTHONPATH')] if p])
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True,
+        universal_newlines=True).stderr
+    times = {}
+    for line in stderr.split(marker + '\n', 1)[1].splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        if self_us.strip().isdigit():
+            times[name.strip()] = int(self_us)
+    return times
+
+
+class TestImportTime(osc_test_base.TestCase):
+
+    def test_deferred_modules(self):
+        times = import_times(MODULES)
+        self.assertIn('octaviaclient.osc.v2.load_balancer', times)
+        self.assertEqual([], [module for module in DEFERRED_MODULES
+                              if module in times])
+
+    def test_module_budget(self):
+        times = import_times(MODULES)
+        self.assertLessEqual(len(times), MODULE_BUDGET, sorted(times))
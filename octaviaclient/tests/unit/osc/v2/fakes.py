@@ -11,10 +11,14 @@
 #   under the License.
 #
 import copy
+import inspect
 from unittest import mock
 
 import osc_lib.test.base as osc_test_base
+from oslo_utils import uuidutils
 
+from octaviaclient.api import exceptions
+from octaviaclient.api.v2 import octavia
 from octaviaclient.tests import fakes
 from octaviaclient.tests.unit.osc.v2 import constants
 
@@ -54,3 +58,148 @@ def createFakeResource(name, attrs=None):
     return fakes.FakeResource(
         info=copy.deepcopy(resource_info), loaded=True,
     )
+
+
+# Prefix of the API methods of each resource type:
+# (collection key, resource key, constants attributes, primary key)
+API_RESOURCES = {
+    'load_balancer': ('loadbalancers', 'loadbalancer', 'LOADBALANCER_ATTRS',
+                      'id'),
+    'listener': ('listeners', 'listener', 'LISTENER_ATTRS', 'id'),
+    'pool': ('pools', 'pool', 'POOL_ATTRS', 'id'),
+    'member': ('members', 'member', 'MEMBER_ATTRS', 'id'),
+    'l7policy': ('l7policies', 'l7policy', 'L7POLICY_ATTRS', 'id'),
+    'l7rule': ('rules', 'rule', 'L7RULE_ATTRS', 'id'),
+    'health_monitor': ('healthmonitors', 'healthmonitor', 'HM_ATTRS', 'id'),
+    'quota': ('quotas', 'quota', 'QUOTA_ATTRS', 'project_id'),
+    'amphora': ('amphorae', 'amphora', 'AMPHORA_ATTRS', 'id'),
+    'provider': ('providers', 'provider', 'PROVIDER_ATTRS', 'name'),
+    'flavor': ('flavors', 'flavor', 'FLAVOR_ATTRS', 'id'),
+    'flavorprofile': ('flavorprofiles', 'flavorprofile',
+                      'FLAVORPROFILE_ATTRS', 'id'),
+    'availabilityzone': ('availability_zones', 'availability_zone',
+                         'AVAILABILITY_ZONE_ATTRS', 'name'),
+    'availabilityzoneprofile': ('availability_zone_profiles',
+                                'availability_zone_profile',
+                                'AVAILABILITY_ZONE_PROFILE_ATTRS', 'id'),
+}
+
+
+class FakeLoadBalancerAPI(object):
+    """In-memory stand-in for OctaviaAPI recording the calls made to it
+
+    It holds one resource of each type, all tied together and ACTIVE, the
+    named ones are named after their key, e.g. ``loadbalancer``. Resources
+    created through it are ACTIVE at once and deleted ones are gone at once,
+    so waiting on them takes a single poll. The arguments of the calls are
+    checked against the signatures of OctaviaAPI and every API method called
+    is appended to ``calls``.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.resources = {}
+        self.ids = {}
+        for prefix, (_, key, attrs, primary_key) in API_RESOURCES.items():
+            resource = copy.deepcopy(getattr(constants, attrs))
+            resource['provisioning_status'] = 'ACTIVE'
+            resource.setdefault('tags', [])
+            if 'name' in resource:
+                resource['name'] = key
+            resource.setdefault(primary_key, uuidutils.generate_uuid())
+            self.resources[prefix] = {resource[primary_key]: resource}
+            self.ids[prefix] = resource[primary_key]
+
+        lb = {'id': self.ids['load_balancer']}
+        listener = {'id': self.ids['listener']}
+        pool = {'id': self.ids['pool']}
+        self._get('load_balancer').update(listeners=[listener], pools=[pool])
+        self._get('listener').update(loadbalancers=[lb],
+                                     default_pool_id=pool['id'])
+        self._get('pool').update(loadbalancers=[lb], listeners=[listener])
+        self._get('l7policy').update(listener_id=listener['id'])
+        self._get('health_monitor').update(pools=[pool])
+        self._get('amphora').update(loadbalancer_id=lb['id'])
+
+    def _get(self, prefix, res_id=None):
+        return self.resources[prefix][res_id or self.ids[prefix]]
+
+    def __getattr__(self, name):
+        for prefix in sorted(API_RESOURCES, key=len, reverse=True):
+            if name.startswith(prefix + '_'):
+                action = name[len(prefix) + 1:]
+                break
+        else:
+            raise AttributeError(name)
+        signature = inspect.signature(getattr(octavia.OctaviaAPI, name))
+
+        def call(*args, **kwargs):
+            # Fails like the API would on arguments it does not take
+            bound = signature.bind(self, *args, **kwargs)
+            self.calls.append(name)
+            params = list(bound.arguments.values())[1:]
+            return self._call(prefix, action, params, kwargs)
+        call.__name__ = name
+        return call
+
+    def _find(self, prefix, params):
+        # Members are identified by (pool_id, member_id), L7 rules by
+        # (l7rule_id, l7policy_id), the others by their first parameter
+        res_id = params[1] if prefix == 'member' else params[0]
+        try:
+            return self.resources[prefix][res_id]
+        except KeyError:
+            raise exceptions.OctaviaClientException(
+                code=404, message='Not Found')
+
+    def _call(self, prefix, action, params, kwargs):
+        collection, key, _, primary_key = API_RESOURCES[prefix]
+        if action == 'list':
+            resources = list(self.resources[prefix].values())
+            for attr in ('id', 'name'):
+                if attr in kwargs:
+                    # Like Octavia, several values of a filter are not
+                    # matched each, the attribute is compared to their list
+                    resources = [r for r in resources
+                                 if r.get(attr) == kwargs[attr]]
+            return {collection: copy.deepcopy(resources)}
+        if action == 'show':
+            return copy.deepcopy(self._find(prefix, params))
+        if action == 'create':
+            resource = copy.deepcopy(self._get(prefix))
+            resource.update(kwargs['json'][key])
+            if primary_key == 'id':
+                resource['id'] = uuidutils.generate_uuid()
+            self.resources[prefix][resource[primary_key]] = resource
+            return {key: copy.deepcopy(resource)}
+        if action == 'set':
+            resource = self._find(prefix, params)
+            resource.update(kwargs['json'][key])
+            return {key: copy.deepcopy(resource)}
+        if action in ('delete', 'reset'):
+            resource = self._find(prefix, params)
+            del self.resources[prefix][resource[primary_key]]
+            return None
+        if action in ('failover', 'configure'):
+            self._find(prefix, params)
+            return None
+        if action == 'batch_update':
+            self._find('pool', params)
+            return None
+        if action == 'stats_show':
+            self._find(prefix, params)
+            if prefix == 'amphora':
+                return {'amphora_stats': [{
+                    'listener_id': self.ids['listener'],
+                    'active_connections': 1}]}
+            return {'stats': {'active_connections': 1}}
+        if action == 'status_show':
+            self._find(prefix, params)
+            return {'statuses': {'loadbalancer': {'id': params[0]}}}
+        if action == 'defaults_show':
+            return {'quota': copy.deepcopy(self._get(prefix))}
+        if action.endswith('_capability_list'):
+            capabilities = action[:-len('y_list')] + 'ies'
+            return {capabilities: [{'name': 'capability',
+                                    'description': 'description'}]}
+        raise AttributeError(prefix + '_' + action)
@@ -62,7 +62,8 @@ class TestAmphoraList(TestAmphora):
         parsed_args = self.check_parser(self.cmd, arglist, verify_list)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.amphora_list.assert_called_with()
+        self.api_mock.amphora_list.assert_called_with(
+            fields=list(self.columns))
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.data_list, tuple(data))
 
@@ -73,10 +74,29 @@ class TestAmphoraList(TestAmphora):
         parsed_args = self.check_parser(self.cmd, arglist, verify_list)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.amphora_list.assert_called_with()
+        self.api_mock.amphora_list.assert_called_with(
+            fields=list(self.columns_long))
         self.assertEqual(self.columns_long, columns)
         self.assertEqual(self.data_list_long, tuple(data))
 
+    def test_amphora_list_stream(self):
+        self.api_mock.iter_amphorae.return_value = iter(
+            self.api_mock.amphora_list.return_value['amphorae'])
+        arglist = ['--stream', '-f', 'value']
+        verify_list = [('stream', True)]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verify_list)
+        self.cmd.formatter = mock.sentinel.formatter
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.api_mock.iter_amphorae.assert_called_with(
+            fields=list(self.columns))
+        self.api_mock.amphora_list.assert_not_called()
+        # value writes the rows one by one already
+        self.assertEqual(mock.sentinel.formatter, self.cmd.formatter)
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(self.data_list, tuple(data))
+
     @mock.patch('octaviaclient.osc.v2.utils.get_amphora_attrs')
     def test_amphora_list_with_loadbalancer(self, mock_client):
         mock_client.return_value = {
@@ -155,6 +175,7 @@ class TestAmphoraConfigure(TestAmphora):
             status_f=mock.ANY,
             res_id=self._amp.loadbalancer_id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     @mock.patch('osc_lib.utils.wait_for_status')
@@ -203,6 +224,7 @@ class TestAmphoraFailover(TestAmphora):
             status_f=mock.ANY,
             res_id=self._amp.loadbalancer_id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
         mock_wait_delete.assert_not_called()
 
@@ -226,6 +248,7 @@ class TestAmphoraFailover(TestAmphora):
             manager=mock.ANY,
             res_id=self._amp.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
 
@@ -318,4 +341,5 @@ class TestAmphoraDelete(TestAmphora):
             manager=mock.ANY,
             res_id=self._amp.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='status')
@@ -59,7 +59,8 @@ class TestAvailabilityzoneProfileList(TestAvailabilityzoneProfile):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.availabilityzoneprofile_list.assert_called_with()
+        self.api_mock.availabilityzoneprofile_list.assert_called_with(
+            fields=list(self.columns))
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -70,7 +71,7 @@ class TestAvailabilityzoneProfileList(TestAvailabilityzoneProfile):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
         self.api_mock.availabilityzoneprofile_list.assert_called_with(
-            name='availabilityzoneprofile1')
+            name='availabilityzoneprofile1', fields=list(self.columns))
 
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
@@ -0,0 +1,287 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Maximum number of load balancer API calls made by each command
+
+Each command is run against an in-memory API in several scenarios, the
+test fails when one makes more API calls than its budget. Lower a budget
+when a change saves calls, never raise one to hide a regression.
+"""
+
+import configparser
+import copy
+import importlib
+import json
+import os
+from unittest import mock
+
+import fixtures
+from oslo_utils import uuidutils
+
+from octaviaclient.tests.unit.osc.v2 import fakes
+
+SETUP_CFG = os.path.join(os.path.dirname(__file__), '..', '..', '..', '..',
+                         '..', 'setup.cfg')
+
+# Arguments of each command, the placeholders are replaced with the ID or
+# the name of the resources, and budget of API calls of each scenario:
+# uuid and name are the resources given by ID and by name, wait adds --wait
+# to the uuid scenario.
+BUDGETS = {
+    'loadbalancer_create': ('--name lb --vip-subnet-id subnet',
+                            {'uuid': 1, 'wait': 3}),
+    'loadbalancer_list': ('', {'uuid': 1}),
+    'loadbalancer_show': ('{load_balancer}', {'uuid': 1, 'name': 2}),
+    'loadbalancer_delete': ('{load_balancer}',
+                            {'uuid': 2, 'name': 2, 'wait': 3}),
+    'loadbalancer_set': ('{load_balancer} --description d --tag t',
+                         {'uuid': 3, 'name': 3, 'wait': 4}),
+    'loadbalancer_unset': ('{load_balancer} --description --tag foo',
+                           {'uuid': 3, 'name': 3, 'wait': 4}),
+    'loadbalancer_stats_show': ('{load_balancer}', {'uuid': 2, 'name': 2}),
+    'loadbalancer_status_show': ('{load_balancer}', {'uuid': 2, 'name': 2}),
+    'loadbalancer_failover': ('{load_balancer}',
+                              {'uuid': 2, 'name': 2, 'wait': 3}),
+    'loadbalancer_listener_create': (
+        '{load_balancer} --protocol HTTP --protocol-port 80',
+        {'uuid': 2, 'name': 2, 'wait': 4}),
+    'loadbalancer_listener_list': ('--loadbalancer {load_balancer}',
+                                   {'uuid': 2, 'name': 2}),
+    'loadbalancer_listener_show': ('{listener}', {'uuid': 1, 'name': 2}),
+    'loadbalancer_listener_delete': ('{listener}',
+                                     {'uuid': 2, 'name': 2, 'wait': 3}),
+    'loadbalancer_listener_set': ('{listener} --description d --tag t',
+                                  {'uuid': 3, 'name': 3, 'wait': 4}),
+    'loadbalancer_listener_unset': ('{listener} --description --tag foo',
+                                    {'uuid': 3, 'name': 3, 'wait': 4}),
+    'loadbalancer_listener_stats_show': ('{listener}', {'uuid': 2, 'name': 2}),
+    'loadbalancer_pool_create': (
+        '--listener {listener} --protocol HTTP --lb-algorithm ROUND_ROBIN',
+        {'uuid': 2, 'name': 2, 'wait': 4}),
+    'loadbalancer_pool_list': ('--loadbalancer {load_balancer}',
+                               {'uuid': 2, 'name': 2}),
+    'loadbalancer_pool_show': ('{pool}', {'uuid': 1, 'name': 2}),
+    'loadbalancer_pool_delete': ('{pool}', {'uuid': 2, 'name': 2, 'wait': 3}),
+    'loadbalancer_pool_set': ('{pool} --description d --tag t',
+                              {'uuid': 3, 'name': 3, 'wait': 4}),
+    'loadbalancer_pool_unset': ('{pool} --description --tag foo',
+                                {'uuid': 3, 'name': 3, 'wait': 4}),
+    'loadbalancer_member_create': (
+        '{pool} --address 192.0.2.10 --protocol-port 80',
+        {'uuid': 2, 'name': 2, 'wait': 5}),
+    'loadbalancer_member_list': ('{pool}', {'uuid': 2, 'name': 2}),
+    'loadbalancer_member_show': ('{pool} {member}', {'uuid': 1, 'name': 3}),
+    'loadbalancer_member_delete': ('{pool} {member}',
+                                   {'uuid': 3, 'name': 3, 'wait': 4}),
+    'loadbalancer_member_set': ('{pool} {member} --weight 2 --tag t',
+                                {'uuid': 4, 'name': 4, 'wait': 5}),
+    'loadbalancer_member_unset': ('{pool} {member} --weight --tag foo',
+                                  {'uuid': 4, 'name': 4, 'wait': 5}),
+    'loadbalancer_member_batch-update': ('{pool} {members_file}',
+                                         {'uuid': 2, 'name': 2, 'wait': 4}),
+    'loadbalancer_l7policy_create': ('{listener} --action REJECT',
+                                     {'uuid': 2, 'name': 2, 'wait': 5}),
+    'loadbalancer_l7policy_list': ('--listener {listener}',
+                                   {'uuid': 2, 'name': 2}),
+    'loadbalancer_l7policy_show': ('{l7policy}', {'uuid': 1, 'name': 2}),
+    'loadbalancer_l7policy_delete': ('{l7policy}',
+                                     {'uuid': 2, 'name': 2, 'wait': 3}),
+    'loadbalancer_l7policy_set': ('{l7policy} --description d --tag t',
+                                  {'uuid': 3, 'name': 3, 'wait': 4}),
+    'loadbalancer_l7policy_unset': ('{l7policy} --description --tag foo',
+                                    {'uuid': 3, 'name': 3, 'wait': 4}),
+    'loadbalancer_l7rule_create': (
+        '{l7policy} --compare-type EQUAL_TO --value v --type PATH',
+        {'uuid': 2, 'name': 2, 'wait': 6}),
+    'loadbalancer_l7rule_list': ('{l7policy}', {'uuid': 2, 'name': 2}),
+    'loadbalancer_l7rule_show': ('{l7policy} {l7rule}',
+                                 {'uuid': 1, 'name': 3}),
+    'loadbalancer_l7rule_delete': ('{l7policy} {l7rule}',
+                                   {'uuid': 3, 'name': 3, 'wait': 4}),
+    'loadbalancer_l7rule_set': ('{l7policy} {l7rule} --value w --tag t',
+                                {'uuid': 4, 'name': 4, 'wait': 5}),
+    'loadbalancer_l7rule_unset': ('{l7policy} {l7rule} --tag foo',
+                                  {'uuid': 3, 'name': 3, 'wait': 4}),
+    'loadbalancer_healthmonitor_create': (
+        '{pool} --delay 5 --timeout 5 --max-retries 3 --type PING',
+        {'uuid': 2, 'name': 2, 'wait': 5}),
+    'loadbalancer_healthmonitor_list': ('', {'uuid': 1}),
+    'loadbalancer_healthmonitor_show': ('{health_monitor}',
+                                        {'uuid': 1, 'name': 2}),
+    'loadbalancer_healthmonitor_delete': ('{health_monitor}',
+                                          {'uuid': 2, 'name': 2, 'wait': 3}),
+    'loadbalancer_healthmonitor_set': ('{health_monitor} --delay 6 --tag t',
+                                       {'uuid': 3, 'name': 3, 'wait': 4}),
+    'loadbalancer_healthmonitor_unset': ('{health_monitor} --name --tag foo',
+                                         {'uuid': 3, 'name': 3, 'wait': 4}),
+    'loadbalancer_quota_list': ('', {'uuid': 1}),
+    'loadbalancer_quota_show': ('{quota}', {'uuid': 1}),
+    'loadbalancer_quota_defaults_show': ('', {'uuid': 1}),
+    'loadbalancer_quota_reset': ('{quota}', {'uuid': 1}),
+    'loadbalancer_quota_set': ('{quota} --pool 2', {'uuid': 1}),
+    'loadbalancer_quota_unset': ('{quota} --pool', {'uuid': 1}),
+    'loadbalancer_amphora_list': ('', {'uuid': 1}),
+    'loadbalancer_amphora_show': ('{amphora}', {'uuid': 1}),
+    'loadbalancer_amphora_configure': ('{amphora}', {'uuid': 2, 'wait': 4}),
+    'loadbalancer_amphora_delete': ('{amphora}', {'uuid': 1, 'wait': 2}),
+    'loadbalancer_amphora_failover': ('{amphora}', {'uuid': 3, 'wait': 4}),
+    'loadbalancer_amphora_stats_show': ('{amphora}', {'uuid': 1}),
+    'loadbalancer_provider_list': ('', {'uuid': 1}),
+    'loadbalancer_provider_capability_list': ('{provider}',
+                                              {'uuid': 2, 'name': 2}),
+    'loadbalancer_flavorprofile_create': (
+        '--name fp --provider amphora --flavor-data {{}}', {'uuid': 1}),
+    'loadbalancer_flavorprofile_list': ('', {'uuid': 1}),
+    'loadbalancer_flavorprofile_delete': ('{flavorprofile}',
+                                          {'uuid': 2, 'name': 2}),
+    'loadbalancer_flavorprofile_show': ('{flavorprofile}',
+                                        {'uuid': 1, 'name': 2}),
+    'loadbalancer_flavorprofile_set': ('{flavorprofile} --name fp',
+                                       {'uuid': 2, 'name': 2}),
+    'loadbalancer_flavor_create': ('--name f --flavorprofile {flavorprofile}',
+                                   {'uuid': 2, 'name': 2}),
+    'loadbalancer_flavor_list': ('', {'uuid': 1}),
+    'loadbalancer_flavor_delete': ('{flavor}', {'uuid': 2, 'name': 2}),
+    'loadbalancer_flavor_show': ('{flavor}', {'uuid': 1, 'name': 2}),
+    'loadbalancer_flavor_set': ('{flavor} --description d',
+                                {'uuid': 2, 'name': 2}),
+    'loadbalancer_flavor_unset': ('{flavor} --description',
+                                  {'uuid': 2, 'name': 2}),
+    'loadbalancer_availabilityzoneprofile_create': (
+        '--name azp --provider amphora --availability-zone-data {{}}',
+        {'uuid': 1}),
+    'loadbalancer_availabilityzoneprofile_list': ('', {'uuid': 1}),
+    'loadbalancer_availabilityzoneprofile_delete': (
+        '{availabilityzoneprofile}', {'uuid': 2, 'name': 2}),
+    'loadbalancer_availabilityzoneprofile_show': ('{availabilityzoneprofile}',
+                                                  {'uuid': 2, 'name': 2}),
+    'loadbalancer_availabilityzoneprofile_set': (
+        '{availabilityzoneprofile} --name azp', {'uuid': 2, 'name': 2}),
+    'loadbalancer_availabilityzone_create': (
+        '--name az --availabilityzoneprofile {availabilityzoneprofile}',
+        {'uuid': 2, 'name': 2}),
+    'loadbalancer_availabilityzone_list': ('', {'uuid': 1}),
+    'loadbalancer_availabilityzone_delete': ('{availabilityzone}',
+                                             {'uuid': 2, 'name': 2}),
+    'loadbalancer_availabilityzone_show': ('{availabilityzone}',
+                                           {'uuid': 2, 'name': 2}),
+    'loadbalancer_availabilityzone_set': ('{availabilityzone} --description d',
+                                          {'uuid': 2, 'name': 2}),
+    'loadbalancer_availabilityzone_unset': ('{availabilityzone} --description',
+                                            {'uuid': 2, 'name': 2}),
+}
+
+
+def _commands():
+    parser = configparser.ConfigParser()
+    parser.read(SETUP_CFG)
+    commands = {}
+    for line in parser['entry_points'][
+            'openstack.load_balancer.v2'].strip().splitlines():
+        name, target = (part.strip() for part in line.split('='))
+        module, cls = target.split(':')
+        commands[name] = getattr(importlib.import_module(module), cls)
+    return commands
+
+
+class TestCallBudget(fakes.TestOctaviaClient):
+
+    def setUp(self):
+        super().setUp()
+        network = self.app.client_manager.sdk_connection.network
+        for attr in ('subnets', 'networks', 'ports'):
+            getattr(network, attr).side_effect = (
+                lambda **kwargs: [{'id': uuidutils.generate_uuid()}])
+        self.useFixture(fixtures.MockPatch(
+            'openstackclient.identity.common.find_project',
+            side_effect=lambda *args: mock.Mock(id=self.api.ids['quota'])))
+
+        self.members_file = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'members.json')
+        with open(self.members_file, 'w') as f:
+            json.dump([{'address': '192.0.2.10', 'protocol_port': 80}], f)
+
+    def _run(self, command, args, scenario,
+             api_class=fakes.FakeLoadBalancerAPI):
+        self.api = api_class()
+        self.app.client_manager.load_balancer = self.api
+        values = {'members_file': self.members_file}
+        for prefix, res_id in self.api.ids.items():
+            name = self.api.resources[prefix][res_id].get('name')
+            values[prefix] = name if scenario == 'name' and name else res_id
+        arglist = args.format(**values).split()
+        if scenario == 'wait':
+            arglist.append('--wait')
+
+        cmd = command(self.app, None)
+        parsed_args = cmd.get_parser('test').parse_args(arglist)
+        with mock.patch('time.sleep'):
+            ret = cmd.take_action(parsed_args)
+        if isinstance(ret, tuple):
+            list(ret[1])
+        return self.api.calls
+
+    def test_every_command_has_budget(self):
+        self.assertEqual(sorted(_commands()), sorted(BUDGETS))
+
+    def test_budgets(self):
+        commands = _commands()
+        over_budget = []
+        for name, (args, budgets) in sorted(BUDGETS.items()):
+            for scenario, budget in budgets.items():
+                calls = self._run(commands[name], args, scenario)
+                if len(calls) > budget:
+                    over_budget.append(
+                        f'{name} ({scenario}): {len(calls)} calls for a '
+                        f'budget of {budget}: {", ".join(calls)}')
+        self.assertEqual([], over_budget)
+
+    def test_over_budget(self):
+        class LookupTwiceAPI(fakes.FakeLoadBalancerAPI):
+            def pool_list(self, **kwargs):
+                self.__getattr__('pool_list')(**kwargs)
+                return self.__getattr__('pool_list')(**kwargs)
+
+        args, budgets = BUDGETS['loadbalancer_pool_show']
+        calls = self._run(_commands()['loadbalancer_pool_show'], args,
+                          'name', api_class=LookupTwiceAPI)
+        self.assertGreater(len(calls), budgets['name'])
+
+    def test_delete_many_wait(self):
+        # The deletes are waited on with a listing by ID each, a list of
+        # IDs is not a filter Octavia supports
+        class TwoLoadBalancersAPI(fakes.FakeLoadBalancerAPI):
+            def __init__(self):
+                super().__init__()
+                lb = copy.deepcopy(self._get('load_balancer'))
+                lb.update(id=uuidutils.generate_uuid(), name='lb2')
+                self.resources['load_balancer'][lb['id']] = lb
+
+        api = TwoLoadBalancersAPI()
+        self.app.client_manager.load_balancer = api
+        cmd = _commands()['loadbalancer_delete'](self.app, None)
+        parsed_args = cmd.get_parser('test').parse_args(
+            list(api.resources['load_balancer']) + ['--wait'])
+        with mock.patch('time.sleep'):
+            cmd.take_action(parsed_args)
+        self.assertEqual({}, api.resources['load_balancer'])
+        # One lookup each, the deletes, then a poll of each
+        self.assertEqual(['load_balancer_list'] * 2 +
+                         ['load_balancer_delete'] * 2 +
+                         ['load_balancer_list'] * 2, api.calls)
+
+    def test_api_signature_checked(self):
+        api = fakes.FakeLoadBalancerAPI()
+        self.assertRaises(TypeError, api.load_balancer_show,
+                          api.ids['load_balancer'], 'unknown', 'extra')
+        self.assertEqual([], api.calls)
@@ -54,7 +54,8 @@ class TestFlavorList(TestFlavor):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.flavor_list.assert_called_with()
+        self.api_mock.flavor_list.assert_called_with(
+            fields=list(self.columns))
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -64,7 +65,8 @@ class TestFlavorList(TestFlavor):
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
-        self.api_mock.flavor_list.assert_called_with(name='flavor1')
+        self.api_mock.flavor_list.assert_called_with(
+            name='flavor1', fields=list(self.columns))
 
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
@@ -55,7 +55,8 @@ class TestFlavorProfileList(TestFlavorProfile):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.flavorprofile_list.assert_called_with()
+        self.api_mock.flavorprofile_list.assert_called_with(
+            fields=list(self.columns))
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -66,7 +67,7 @@ class TestFlavorProfileList(TestFlavorProfile):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
         self.api_mock.flavorprofile_list.assert_called_with(
-            name='flavorprofile1')
+            name='flavorprofile1', fields=list(self.columns))
 
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
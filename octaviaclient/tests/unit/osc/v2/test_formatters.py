@@ -0,0 +1,40 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+import io
+import json
+
+import osc_lib.test.base as osc_test_base
+
+from octaviaclient.osc.v2 import formatters
+from octaviaclient.osc.v2 import utils as v2_utils
+
+
+class TestNDJSONFormatter(osc_test_base.TestCase):
+
+    def test_emit_list(self):
+        stdout = io.StringIO()
+        written = []
+
+        def rows():
+            yield ('lb1', v2_utils.FlatListColumn(['a', 'b']))
+            # The first row is written before the next one is produced
+            written.append(stdout.getvalue())
+            yield ('lb2', v2_utils.FlatListColumn([]))
+
+        formatters.NDJSONFormatter().emit_list(('name', 'tags'), rows(),
+                                               stdout, None)
+
+        self.assertEqual(['{"name": "lb1", "tags": ["a", "b"]}\n'], written)
+        self.assertEqual(
+            [{'name': 'lb1', 'tags': ['a', 'b']}, {'name': 'lb2', 'tags': []}],
+            [json.loads(line) for line in stdout.getvalue().splitlines()])
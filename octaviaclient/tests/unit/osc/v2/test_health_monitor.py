@@ -56,7 +56,8 @@ class TestHealthMonitorList(TestHealthMonitor):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.health_monitor_list.assert_called_with()
+        self.api_mock.health_monitor_list.assert_called_with(
+            fields=list(self.columns))
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -70,7 +71,8 @@ class TestHealthMonitorList(TestHealthMonitor):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.health_monitor_list.assert_called_with(**expected_attrs)
+        self.api_mock.health_monitor_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -84,7 +86,8 @@ class TestHealthMonitorList(TestHealthMonitor):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.health_monitor_list.assert_called_with(**expected_attrs)
+        self.api_mock.health_monitor_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -98,7 +101,8 @@ class TestHealthMonitorList(TestHealthMonitor):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.health_monitor_list.assert_called_with(**expected_attrs)
+        self.api_mock.health_monitor_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -112,7 +116,8 @@ class TestHealthMonitorList(TestHealthMonitor):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.health_monitor_list.assert_called_with(**expected_attrs)
+        self.api_mock.health_monitor_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -150,6 +155,7 @@ class TestHealthMonitorDelete(TestHealthMonitor):
             manager=mock.ANY,
             res_id=self._hm.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_health_monitor_delete_failure(self):
@@ -245,6 +251,7 @@ class TestHealthMonitorCreate(TestHealthMonitor):
             status_f=mock.ANY,
             res_id='mock_lb_id',
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     @mock.patch('octaviaclient.osc.v2.utils.get_health_monitor_attrs')
@@ -339,6 +346,7 @@ class TestHealthMonitorSet(TestHealthMonitor):
             status_f=mock.ANY,
             res_id=self._hm.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_health_monitor_set_tag(self):
@@ -446,6 +454,7 @@ class TestHealthMonitorUnset(TestHealthMonitor):
             status_f=mock.ANY,
             res_id=self._hm.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_hm_unset_all(self):
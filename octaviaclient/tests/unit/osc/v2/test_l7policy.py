@@ -55,7 +55,8 @@ class TestL7PolicyList(TestL7Policy):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.l7policy_list.assert_called_with()
+        self.api_mock.l7policy_list.assert_called_with(
+            fields=list(self.columns))
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -71,7 +72,8 @@ class TestL7PolicyList(TestL7Policy):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.api_mock.l7policy_list.assert_called_with(
-            listener_id=self._l7po.listener_id
+            listener_id=self._l7po.listener_id,
+            fields=list(self.columns)
         )
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
@@ -86,7 +88,8 @@ class TestL7PolicyList(TestL7Policy):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.l7policy_list.assert_called_with(**expected_attrs)
+        self.api_mock.l7policy_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -100,7 +103,8 @@ class TestL7PolicyList(TestL7Policy):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.l7policy_list.assert_called_with(**expected_attrs)
+        self.api_mock.l7policy_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -114,7 +118,8 @@ class TestL7PolicyList(TestL7Policy):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.l7policy_list.assert_called_with(**expected_attrs)
+        self.api_mock.l7policy_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -128,7 +133,8 @@ class TestL7PolicyList(TestL7Policy):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.l7policy_list.assert_called_with(**expected_attrs)
+        self.api_mock.l7policy_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -166,6 +172,7 @@ class TestL7PolicyDelete(TestL7Policy):
             manager=mock.ANY,
             res_id=self._l7po.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_l7policy_delete_failure(self):
@@ -260,6 +267,7 @@ class TestL7PolicyCreate(TestL7Policy):
             status_f=mock.ANY,
             res_id='mock_lb_id',
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     @mock.patch('octaviaclient.osc.v2.utils.get_l7policy_attrs')
@@ -357,6 +365,7 @@ class TestL7PolicySet(TestL7Policy):
             status_f=mock.ANY,
             res_id=self._l7po.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_l7policy_set_tag(self):
@@ -452,6 +461,7 @@ class TestL7PolicyUnset(TestL7Policy):
             status_f=mock.ANY,
             res_id=self._l7po.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_l7policy_unset_all(self):
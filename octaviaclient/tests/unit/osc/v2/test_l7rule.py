@@ -58,7 +58,8 @@ class TestL7RuleList(TestL7Rule):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.l7rule_list.assert_called_with(l7policy_id=self._l7po.id)
+        self.api_mock.l7rule_list.assert_called_with(
+            l7policy_id=self._l7po.id, fields=list(self.columns))
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -75,7 +76,8 @@ class TestL7RuleList(TestL7Rule):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.l7rule_list.assert_called_with(**expected_attrs)
+        self.api_mock.l7rule_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -92,7 +94,8 @@ class TestL7RuleList(TestL7Rule):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.l7rule_list.assert_called_with(**expected_attrs)
+        self.api_mock.l7rule_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -109,7 +112,8 @@ class TestL7RuleList(TestL7Rule):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.l7rule_list.assert_called_with(**expected_attrs)
+        self.api_mock.l7rule_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -126,7 +130,8 @@ class TestL7RuleList(TestL7Rule):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.l7rule_list.assert_called_with(**expected_attrs)
+        self.api_mock.l7rule_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -180,6 +185,7 @@ class TestL7RuleDelete(TestL7Rule):
             manager=mock.ANY,
             res_id=self._l7po.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
 
@@ -265,6 +271,7 @@ class TestL7RuleCreate(TestL7Rule):
             status_f=mock.ANY,
             res_id='mock_lb_id',
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
         self.api_mock.l7rule_show.assert_called_with(mock.ANY, self._l7po.id)
@@ -391,6 +398,7 @@ class TestL7RuleSet(TestL7Rule):
             status_f=mock.ANY,
             res_id=self._l7po.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     @mock.patch('octaviaclient.osc.v2.utils.get_l7rule_attrs')
@@ -508,6 +516,7 @@ class TestL7RuleUnset(TestL7Rule):
             status_f=mock.ANY,
             res_id=self._l7po.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_l7rule_unset_all(self):
@@ -52,7 +52,8 @@ class TestListenerList(TestListener):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.listener_list.assert_called_with()
+        self.api_mock.listener_list.assert_called_with(
+            fields=list(self.columns))
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -62,7 +63,8 @@ class TestListenerList(TestListener):
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
-        self.api_mock.listener_list.assert_called_with(name='rainbarrel')
+        self.api_mock.listener_list.assert_called_with(
+            name='rainbarrel', fields=list(self.columns))
 
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
@@ -74,7 +76,7 @@ class TestListenerList(TestListener):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
         self.api_mock.listener_list.assert_called_with(
-            tags=['foo', 'bar'])
+            tags=['foo', 'bar'], fields=list(self.columns))
 
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
@@ -88,7 +90,8 @@ class TestListenerList(TestListener):
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
-        self.api_mock.listener_list.assert_called_with(**expected_attrs)
+        self.api_mock.listener_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
 
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
@@ -102,7 +105,8 @@ class TestListenerList(TestListener):
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
-        self.api_mock.listener_list.assert_called_with(**expected_attrs)
+        self.api_mock.listener_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
 
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
@@ -116,7 +120,8 @@ class TestListenerList(TestListener):
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
-        self.api_mock.listener_list.assert_called_with(**expected_attrs)
+        self.api_mock.listener_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
 
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
@@ -155,6 +160,7 @@ class TestListenerDelete(TestListener):
             manager=mock.ANY,
             res_id=self._listener.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_listener_delete_failure(self):
@@ -229,6 +235,7 @@ class TestListenerCreate(TestListener):
             status_f=mock.ANY,
             res_id=self.listener_info['loadbalancers'][0]['id'],
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     @mock.patch('octaviaclient.osc.v2.utils.get_listener_attrs')
@@ -488,6 +495,7 @@ class TestListenerSet(TestListener):
             status_f=mock.ANY,
             res_id=self._listener.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_listener_set_tag(self):
@@ -669,6 +677,7 @@ class TestListenerUnset(TestListener):
             status_f=mock.ANY,
             res_id=self._listener.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_listener_unset_all(self):
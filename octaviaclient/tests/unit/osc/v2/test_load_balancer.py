@@ -13,12 +13,18 @@
 import argparse
 import copy
 import itertools
+import os
 from unittest import mock
 
+import fixtures
 from osc_lib import exceptions
+import osc_lib.test.base as osc_test_base
 from oslo_utils import uuidutils
+import yaml
 
+from octaviaclient.api import exceptions as octavia_exc
 from octaviaclient.osc.v2 import constants
+from octaviaclient.osc.v2 import formatters
 from octaviaclient.osc.v2 import load_balancer
 from octaviaclient.tests.unit.osc.v2 import constants as attr_consts
 from octaviaclient.tests.unit.osc.v2 import fakes
@@ -56,18 +62,111 @@ class TestLoadBalancerList(TestLoadBalancer):
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
-        self.api_mock.load_balancer_list.assert_called_with()
+        self.api_mock.load_balancer_list.assert_called_with(
+            fields=list(self.columns))
 
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
+    def test_load_balancer_list_stream(self):
+        self.api_mock.iter_load_balancers.return_value = iter(
+            self.api_mock.load_balancer_list.return_value['loadbalancers'])
+        arglist = ['--stream']
+        verifylist = [('stream', True)]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+        self.api_mock.iter_load_balancers.assert_called_with(
+            fields=list(self.columns))
+        self.api_mock.load_balancer_list.assert_not_called()
+        self.assertIsInstance(self.cmd.formatter,
+                              formatters.NDJSONFormatter)
+
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(self.datalist, tuple(data))
+
+    def test_load_balancer_list_paginated(self):
+        arglist = ['--limit', '50', '--marker', self._lb.id,
+                   '--sort', 'updated_at:desc,name']
+        verifylist = [('limit', 50), ('marker', self._lb.id),
+                      ('sort', 'updated_at:desc,name')]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+        self.api_mock.load_balancer_list.assert_called_with(
+            limit=50, marker=self._lb.id, sort='updated_at:desc,name',
+            fields=list(self.columns))
+
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(self.datalist, tuple(data))
+
+    def test_load_balancer_list_invalid_pagination(self):
+        for arglist in (['--limit', '0'], ['--sort', 'name:up'],
+                        ['--sort', 'name,']):
+            parsed_args = self.check_parser(self.cmd, arglist, [])
+            self.assertRaises(exceptions.CommandError,
+                              self.cmd.take_action, parsed_args)
+        self.api_mock.load_balancer_list.assert_not_called()
+
+    def test_load_balancer_list_count(self):
+        self.api_mock.count_load_balancers.return_value = 42
+        arglist = ['--count', '--provisioning-status', 'error']
+        verifylist = [('count', True), ('provisioning_status', 'ERROR')]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+        self.api_mock.count_load_balancers.assert_called_once_with(
+            provisioning_status='ERROR')
+        self.api_mock.load_balancer_list.assert_not_called()
+
+        self.assertEqual(('count',), columns)
+        self.assertEqual([(42,)], list(data))
+
+    def test_load_balancer_list_group_by(self):
+        self.api_mock.count_load_balancers.return_value = {
+            'PENDING_UPDATE': 1, 'ACTIVE': 40, 'ERROR': 2}
+        arglist = ['--group-by', 'provisioning_status']
+        verifylist = [('group_by', 'provisioning_status')]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+        self.api_mock.count_load_balancers.assert_called_once_with(
+            group_by='provisioning_status')
+
+        self.assertEqual(('provisioning_status', 'count'), columns)
+        self.assertEqual(
+            [('ACTIVE', 40), ('ERROR', 2), ('PENDING_UPDATE', 1)], data)
+
+    def test_load_balancer_list_count_limit(self):
+        arglist = ['--count', '--limit', '10']
+        verifylist = [('count', True), ('limit', 10)]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.assertRaises(exceptions.CommandError, self.cmd.take_action,
+                          parsed_args)
+        self.assertRaises(osc_test_base.ParserException, self.check_parser,
+                          self.cmd, ['--group-by', 'unknown'], [])
+
     def test_load_balancer_list_with_name(self):
         arglist = ['--name', 'rainbarrel']
         verifylist = [('name', 'rainbarrel')]
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
-        self.api_mock.load_balancer_list.assert_called_with(name='rainbarrel')
+        self.api_mock.load_balancer_list.assert_called_with(
+            name='rainbarrel', fields=list(self.columns))
+
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(self.datalist, tuple(data))
+
+    def test_load_balancer_list_with_columns(self):
+        arglist = ['-c', 'name', '-c', 'id']
+        verifylist = [('columns', ['name', 'id'])]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+        self.api_mock.load_balancer_list.assert_called_with(
+            fields=['id', 'name'])
 
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
@@ -274,7 +373,7 @@ class TestLoadBalancerDelete(TestLoadBalancer):
     def test_load_balancer_delete(self):
         arglist = [self._lb.id]
         verifylist = [
-            ('loadbalancer', self._lb.id)
+            ('loadbalancer', [self._lb.id])
         ]
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
@@ -282,11 +381,23 @@ class TestLoadBalancerDelete(TestLoadBalancer):
         self.api_mock.load_balancer_delete.assert_called_with(
             lb_id=self._lb.id)
 
-    @mock.patch('osc_lib.utils.wait_for_delete')
+    def test_load_balancer_delete_cascade(self):
+        arglist = [self._lb.id, '--cascade']
+        verifylist = [
+            ('loadbalancer', [self._lb.id]),
+            ('cascade', True),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+        self.api_mock.load_balancer_delete.assert_called_with(
+            lb_id=self._lb.id, cascade=True)
+
+    @mock.patch('octaviaclient.osc.v2.utils.wait_for_many')
     def test_load_balancer_delete_wait(self, mock_wait):
         arglist = [self._lb.id, '--wait']
         verifylist = [
-            ('loadbalancer', self._lb.id),
+            ('loadbalancer', [self._lb.id]),
             ('wait', True),
         ]
 
@@ -295,15 +406,105 @@ class TestLoadBalancerDelete(TestLoadBalancer):
         self.api_mock.load_balancer_delete.assert_called_with(
             lb_id=self._lb.id)
         mock_wait.assert_called_once_with(
-            manager=mock.ANY,
-            res_id=self.lb_info['id'],
-            sleep_time=mock.ANY,
-            status_field='provisioning_status')
+            list_f=self.api_mock.load_balancer_list,
+            resource_key='loadbalancers',
+            res_ids=[self.lb_info['id']],
+            delete=True,
+            timeout=None,
+            poll_interval=None,
+            callback=mock.ANY)
+
+    @mock.patch('time.sleep')
+    def test_load_balancer_delete_multiple_wait(self, mock_sleep):
+        lb_ids = [uuidutils.generate_uuid() for _ in range(3)]
+        # The number of polls each load balancer is still listed for
+        remaining = dict(zip(lb_ids, (1, 2, 0)))
+
+        def list_lbs(id=None, fields=None):
+            # Like Octavia, a repeated filter is not a list of values
+            if isinstance(id, list):
+                raise octavia_exc.OctaviaClientException(
+                    code=400, message='Invalid filter')
+            if fields and not remaining[id]:
+                return {'loadbalancers': []}
+            if fields:
+                remaining[id] -= 1
+            return {'loadbalancers': [
+                {'id': id, 'provisioning_status': 'PENDING_DELETE'}]}
+
+        self.api_mock.load_balancer_list.side_effect = list_lbs
+        arglist = lb_ids + ['--wait']
+        verifylist = [
+            ('loadbalancer', lb_ids),
+            ('wait', True),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+        self.assertEqual(3, self.api_mock.load_balancer_delete.call_count)
+        # Each poll lists the pending load balancers by their ID
+        fields = ['id', 'provisioning_status']
+        self.assertEqual(
+            [mock.call(id=lb_id, fields=fields)
+             for lb_id in lb_ids + lb_ids[:2] + lb_ids[1:2]],
+            [c for c in self.api_mock.load_balancer_list.call_args_list
+             if 'fields' in c[1]])
+        self.assertEqual(2, mock_sleep.call_count)
+
+    def test_load_balancer_delete_multiple_unknown(self):
+        lb_id = uuidutils.generate_uuid()
+        self.api_mock.load_balancer_list.side_effect = [
+            {'loadbalancers': []}, {'loadbalancers': [{'id': lb_id}]}]
+        arglist = ['unknown_lb', lb_id]
+        verifylist = [
+            ('loadbalancer', ['unknown_lb', lb_id]),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.assertRaises(exceptions.CommandError, self.cmd.take_action,
+                          parsed_args)
+        self.api_mock.load_balancer_delete.assert_called_once_with(
+            lb_id=lb_id)
+
+    def test_load_balancer_delete_multiple_failure(self):
+        lb_ids = [uuidutils.generate_uuid() for _ in range(2)]
+        self.api_mock.load_balancer_list.side_effect = [
+            {'loadbalancers': [{'id': lb_id}]} for lb_id in lb_ids]
+        self.api_mock.load_balancer_delete.side_effect = [
+            octavia_exc.OctaviaClientException(code=409, message='Conflict'),
+            None]
+        arglist = lb_ids
+        verifylist = [
+            ('loadbalancer', lb_ids),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.assertRaises(exceptions.CommandError, self.cmd.take_action,
+                          parsed_args)
+        self.assertEqual(2, self.api_mock.load_balancer_delete.call_count)
+
+    def test_load_balancer_delete_multiple_wait_error(self):
+        lb_ids = [uuidutils.generate_uuid() for _ in range(2)]
+        self.api_mock.load_balancer_list.side_effect = [
+            {'loadbalancers': [{'id': lb_id}]} for lb_id in lb_ids] + [
+            {'loadbalancers': [
+                {'id': lb_ids[0], 'provisioning_status': 'ERROR'}]},
+            {'loadbalancers': []},
+        ]
+        arglist = lb_ids + ['--wait']
+        verifylist = [
+            ('loadbalancer', lb_ids),
+            ('wait', True),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.assertRaises(octavia_exc.OctaviaClientException,
+                          self.cmd.take_action, parsed_args)
 
     def test_load_balancer_delete_failure(self):
         arglist = ['unknown_lb']
         verifylist = [
-            ('loadbalancer', 'unknown_lb')
+            ('loadbalancer', ['unknown_lb'])
         ]
         self.api_mock.load_balancer_list.return_value = {
             'loadbalancers': []}
@@ -371,8 +572,109 @@ class TestLoadBalancerCreate(TestLoadBalancer):
             status_f=mock.ANY,
             res_id=self.lb_info['id'],
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
+    def _write_spec(self, spec):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                            'spec.yaml')
+        with open(path, 'w') as spec_file:
+            yaml.safe_dump(spec, spec_file)
+        return path
+
+    def test_load_balancer_create_from_file(self):
+        subnets = self.app.client_manager.sdk_connection.network.subnets
+        subnets.side_effect = lambda name: [
+            {'id': n + '-id', 'name': n} for n in name]
+        member = {'address': '192.0.2.10', 'protocol_port': 80,
+                  'subnet_id': 'private'}
+        spec = {'loadbalancer': {
+            'name': 'lb1',
+            'vip_subnet_id': 'public',
+            'listeners': [{'name': 'li1', 'protocol': 'HTTP',
+                           'protocol_port': 80,
+                           'default_pool': {'name': 'po1'}}],
+            'pools': [{'name': 'po1', 'protocol': 'HTTP',
+                       'lb_algorithm': 'ROUND_ROBIN',
+                       'healthmonitor': {'type': 'HTTP', 'delay': 5,
+                                         'timeout': 3, 'max_retries': 3},
+                       'members': [member,
+                                   dict(member, address='192.0.2.11')]}],
+        }}
+        arglist = ['--from-file', self._write_spec(spec),
+                   '--description', 'from cli']
+        verifylist = [('description', 'from cli')]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        expected = copy.deepcopy(spec['loadbalancer'])
+        expected['vip_subnet_id'] = 'public-id'
+        for m in expected['pools'][0]['members']:
+            m['subnet_id'] = 'private-id'
+        expected['description'] = 'from cli'
+        expected['admin_state_up'] = True
+        self.api_mock.load_balancer_create.assert_called_once_with(
+            json={'loadbalancer': expected})
+        # All the subnet names are resolved with a single list call
+        subnets.assert_called_once_with(name=['public', 'private'])
+
+    def test_load_balancer_create_from_file_ids(self):
+        vip_subnet_id = uuidutils.generate_uuid()
+        vip_network_id = uuidutils.generate_uuid()
+        network = self.app.client_manager.sdk_connection.network
+        network.subnets.side_effect = lambda **kwargs: [
+            {'id': 'private-id', 'name': 'private'}]
+        network.networks.side_effect = lambda **kwargs: [
+            {'id': vip_network_id}]
+        spec = {'name': 'lb1', 'vip_subnet_id': vip_subnet_id,
+                'pools': [{'protocol': 'HTTP', 'lb_algorithm': 'ROUND_ROBIN',
+                           'members': [{'address': '192.0.2.10',
+                                        'protocol_port': 80,
+                                        'subnet_id': 'private'}]}]}
+        arglist = ['--from-file', self._write_spec(spec),
+                   '--vip-network-id', vip_network_id]
+
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        self.cmd.take_action(parsed_args)
+
+        lb = self.api_mock.load_balancer_create.call_args[1]['json'][
+            'loadbalancer']
+        self.assertEqual(vip_subnet_id, lb['vip_subnet_id'])
+        self.assertEqual(vip_network_id, lb['vip_network_id'])
+        self.assertEqual('private-id', lb['pools'][0]['members'][0][
+            'subnet_id'])
+        # The network given on the command line is looked up once, the
+        # UUIDs of the file are not looked up
+        self.assertEqual(1, network.networks.call_count)
+        self.assertEqual(1, network.subnets.call_count)
+
+    def test_load_balancer_create_from_file_undefined_pool(self):
+        spec = {'name': 'lb1',
+                'vip_subnet_id': uuidutils.generate_uuid(),
+                'listeners': [{'protocol': 'HTTP', 'protocol_port': 80,
+                               'default_pool': {'name': 'missing'}}]}
+        arglist = ['--from-file', self._write_spec(spec)]
+
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        self.assertRaises(exceptions.CommandError, self.cmd.take_action,
+                          parsed_args)
+        self.api_mock.load_balancer_create.assert_not_called()
+
+    def test_load_balancer_create_from_file_invalid_member(self):
+        spec = {'name': 'lb1',
+                'vip_subnet_id': uuidutils.generate_uuid(),
+                'pools': [{'protocol': 'HTTP', 'lb_algorithm': 'ROUND_ROBIN',
+                           'members': [{'address': '192.0.2.10',
+                                        'protocol_port': 80,
+                                        'weight': 1000}]}]}
+        arglist = ['--from-file', self._write_spec(spec)]
+
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        self.assertRaises(exceptions.InvalidValue, self.cmd.take_action,
+                          parsed_args)
+        self.api_mock.load_balancer_create.assert_not_called()
+
     @mock.patch('octaviaclient.osc.v2.utils.get_loadbalancer_attrs')
     def test_load_balancer_create_with_qos_policy(self, mock_client):
         qos_policy_id = 'qos_id'
@@ -485,6 +787,59 @@ class TestLoadBalancerCreate(TestLoadBalancer):
         self.api_mock.load_balancer_create.assert_called_with(
             json={'loadbalancer': lb_info})
 
+    def test_load_balancer_create_bulk_resolution(self):
+        network = self.app.client_manager.sdk_connection.network
+
+        def list_by_name(name):
+            names = name if isinstance(name, list) else [name]
+            return [{'id': n + '-id', 'name': n} for n in names]
+
+        network.subnets.side_effect = list_by_name
+        sg_id = uuidutils.generate_uuid()
+        network.security_groups.side_effect = lambda **kw: (
+            [{'id': sg_id, 'name': 'sg0'}] if 'id' in kw
+            else list_by_name(kw['name']))
+        sgs = [sg_id, 'sg1', 'sg2', 'sg3', 'sg4']
+
+        arglist = ['--name', 'lb1', '--vip-subnet-id', 'public']
+        for sg in sgs:
+            arglist += ['--vip-sg-id', sg]
+        for i in range(3):
+            arglist += ['--additional-vip',
+                        'subnet-id=sub{},ip-address=192.0.2.{}'.format(i, i)]
+
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        self.cmd.take_action(parsed_args)
+
+        lb = self.api_mock.load_balancer_create.call_args[1]['json'][
+            'loadbalancer']
+        self.assertEqual([sg_id, 'sg1-id', 'sg2-id', 'sg3-id', 'sg4-id'],
+                         lb['vip_sg_ids'])
+        self.assertEqual(['sub0-id', 'sub1-id', 'sub2-id'],
+                         [v['subnet_id'] for v in lb['additional_vips']])
+        self.assertEqual('public-id', lb['vip_subnet_id'])
+        # One lookup by ID and one by name for the security groups, one for
+        # the VIP subnet and the additional VIP subnets
+        self.assertEqual(2, network.security_groups.call_count)
+        network.security_groups.assert_called_with(
+            name=['sg1', 'sg2', 'sg3', 'sg4'])
+        network.subnets.assert_called_once_with(
+            name=['public', 'sub0', 'sub1', 'sub2'])
+
+    def test_load_balancer_create_bulk_resolution_ambiguous(self):
+        network = self.app.client_manager.sdk_connection.network
+        network.security_groups.return_value = [
+            {'id': 'a', 'name': 'sg1'}, {'id': 'b', 'name': 'sg1'},
+            {'id': 'c', 'name': 'sg2'}]
+        network.subnets.return_value = [{'id': 'public-id'}]
+        arglist = ['--name', 'lb1', '--vip-subnet-id', 'public',
+                   '--vip-sg-id', 'sg1', '--vip-sg-id', 'sg2']
+
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        self.assertRaises(exceptions.CommandError, self.cmd.take_action,
+                          parsed_args)
+        self.api_mock.load_balancer_create.assert_not_called()
+
     @mock.patch('octaviaclient.osc.v2.utils.get_loadbalancer_attrs')
     def test_load_balancer_create_with_tags(self, mock_client):
         lb_info = copy.deepcopy(self.lb_info)
@@ -526,8 +881,10 @@ class TestLoadBalancerCreate(TestLoadBalancer):
                 filtered_attrs = {k: v for k, v in attrs_list.items() if (
                     k not in comb)}
 
-                # Add the 'wait' attribute, which isn't part of an LB directly
+                # Add the 'wait' and 'from_file' attributes, which aren't
+                # part of an LB directly
                 filtered_attrs['wait'] = False
+                filtered_attrs['from_file'] = None
                 mock_client.return_value = filtered_attrs
                 parsed_args = argparse.Namespace(**filtered_attrs)
 
@@ -633,6 +990,7 @@ class TestLoadBalancerSet(TestLoadBalancer):
             status_f=mock.ANY,
             res_id=self.lb_info['id'],
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     @mock.patch('octaviaclient.osc.v2.utils.get_loadbalancer_attrs')
@@ -808,6 +1166,7 @@ class TestLoadBalancerFailover(TestLoadBalancer):
             status_f=mock.ANY,
             res_id=self._lb.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
 
@@ -867,6 +1226,7 @@ class TestLoadBalancerUnset(TestLoadBalancer):
             status_f=mock.ANY,
             res_id=self.lb_info['id'],
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_load_balancer_unset_all(self):
@@ -11,8 +11,12 @@
 #   under the License.
 #
 import copy
+import json
+import os
 from unittest import mock
 
+import fixtures
+from osc_lib import exceptions
 import osc_lib.test.base as osc_test_base
 
 from octaviaclient.osc.v2 import constants
@@ -73,11 +77,63 @@ class TestListMember(TestMember):
 
         self.api_mock.member_list.assert_called_once_with(
             pool_id='pool_id',
-            project_id=self._mem.project_id)
+            project_id=self._mem.project_id,
+            fields=list(self.columns))
 
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
+    def test_member_list_ndjson(self):
+        self.api_mock.iter_members.return_value = iter(
+            self.api_mock.member_list.return_value['members'])
+        arglist = [self._mem.pool_id]
+        verifylist = [('pool', self._mem.pool_id)]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        parsed_args.formatter = 'ndjson'
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.api_mock.iter_members.assert_called_once_with(
+            pool_id=self._mem.pool_id, fields=list(self.columns))
+        self.api_mock.member_list.assert_not_called()
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(self.datalist, tuple(data))
+
+    def test_member_list_stream_limit(self):
+        self.api_mock.iter_members.return_value = iter(
+            self.api_mock.member_list.return_value['members'])
+        arglist = [self._mem.pool_id, '--stream', '--limit', '10']
+        verifylist = [('stream', True), ('limit', 10)]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.api_mock.iter_members.assert_called_once_with(
+            pool_id=self._mem.pool_id, fields=list(self.columns), limit=10)
+        self.assertEqual(self.datalist, tuple(data))
+
+    def test_member_list_count(self):
+        self.api_mock.count_members.return_value = 100000
+        arglist = [self._mem.pool_id, '--count']
+        verifylist = [('count', True)]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.api_mock.count_members.assert_called_once_with(
+            pool_id=self._mem.pool_id)
+        self.assertEqual(('count',), columns)
+        self.assertEqual([(100000,)], data)
+
+    def test_member_list_stream_sorted(self):
+        arglist = [self._mem.pool_id, '--stream', '--sort-column', 'name']
+        verifylist = [('stream', True), ('sort_columns', ['name'])]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.assertRaises(exceptions.CommandError, self.cmd.take_action,
+                          parsed_args)
+        self.api_mock.iter_members.assert_not_called()
+
     def test_member_list_with_tags(self):
         arglist = [self._mem.pool_id,
                    '--tags', 'foo,bar']
@@ -91,7 +147,8 @@ class TestListMember(TestMember):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.member_list.assert_called_with(**expected_attrs)
+        self.api_mock.member_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -108,7 +165,8 @@ class TestListMember(TestMember):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.member_list.assert_called_with(**expected_attrs)
+        self.api_mock.member_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -125,7 +183,8 @@ class TestListMember(TestMember):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.member_list.assert_called_with(**expected_attrs)
+        self.api_mock.member_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -142,7 +201,8 @@ class TestListMember(TestMember):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.member_list.assert_called_with(**expected_attrs)
+        self.api_mock.member_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -220,6 +280,7 @@ class TestCreateMember(TestMember):
             status_f=mock.ANY,
             res_id='mock_lb_id',
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     @mock.patch('octaviaclient.osc.v2.utils.get_member_attrs')
@@ -290,6 +351,7 @@ class TestMemberDelete(TestMember):
             manager=mock.ANY,
             res_id=self._mem.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
 
@@ -345,6 +407,7 @@ class TestMemberSet(TestMember):
             status_f=mock.ANY,
             res_id=self._mem.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     @mock.patch('octaviaclient.osc.v2.utils.get_member_attrs')
@@ -490,6 +553,7 @@ class TestMemberUnset(TestMember):
             status_f=mock.ANY,
             res_id=self._mem.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_member_unset_all(self):
@@ -563,3 +627,92 @@ class TestMemberUnset(TestMember):
             pool_id=self._mem.pool_id,
             member_id=self._mem.id,
             json={'member': {'tags': []}})
+
+
+class TestMemberBatchUpdate(TestMember):
+
+    def setUp(self):
+        super().setUp()
+        self.cmd = member.BatchUpdateMember(self.app, None)
+        self.tmpdir = self.useFixture(fixtures.TempDir()).path
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_member_batch_update_json(self):
+        subnets = self.app.client_manager.sdk_connection.network.subnets
+        subnets.side_effect = lambda name: [{'id': name + '-id'}]
+        members = [
+            {'address': '192.0.2.10', 'protocol_port': 80,
+             'subnet_id': 'private'},
+            {'address': '192.0.2.11', 'protocol_port': 80,
+             'subnet_id': 'private'},
+        ]
+        path = self._write('members.json', json.dumps({'members': members}))
+        arglist = [self._mem.pool_id, path]
+        verifylist = [('pool', self._mem.pool_id),
+                      ('members_file', path),
+                      ('additive_only', False)]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        for m in members:
+            m['subnet_id'] = 'private-id'
+        self.api_mock.member_batch_update.assert_called_once_with(
+            self._mem.pool_id, members, additive_only=False)
+        self.assertEqual(1, subnets.call_count)
+
+    def test_member_batch_update_csv(self):
+        path = self._write(
+            'members.csv',
+            'address,protocol_port,weight,backup,tags\n'
+            '192.0.2.10,80,5,false,a;b\n'
+            '192.0.2.11,8080,,true,\n')
+        arglist = [self._mem.pool_id, path, '--additive-only']
+        verifylist = [('additive_only', True)]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        self.api_mock.member_batch_update.assert_called_once_with(
+            self._mem.pool_id,
+            [{'address': '192.0.2.10', 'protocol_port': 80, 'weight': 5,
+              'backup': False, 'tags': ['a', 'b']},
+             {'address': '192.0.2.11', 'protocol_port': 8080,
+              'backup': True}],
+            additive_only=True)
+
+    def test_member_batch_update_invalid_member(self):
+        path = self._write(
+            'members.yaml',
+            '- address: 192.0.2.10\n  protocol_port: 70000\n')
+        arglist = [self._mem.pool_id, path]
+
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        self.assertRaises(exceptions.InvalidValue, self.cmd.take_action,
+                          parsed_args)
+        self.api_mock.member_batch_update.assert_not_called()
+
+    @mock.patch('osc_lib.utils.wait_for_status')
+    def test_member_batch_update_wait(self, mock_wait):
+        self.api_mock.pool_show.return_value = {
+            'loadbalancers': [{'id': 'mock_lb_id'}]}
+        path = self._write('members.yaml', '[]\n')
+        arglist = [self._mem.pool_id, path, '--wait']
+        verifylist = [('wait', True)]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        self.api_mock.member_batch_update.assert_called_once_with(
+            self._mem.pool_id, [], additive_only=False)
+        mock_wait.assert_called_once_with(
+            status_f=mock.ANY,
+            res_id='mock_lb_id',
+            sleep_time=mock.ANY,
+            callback=mock.ANY,
+            status_field='provisioning_status')
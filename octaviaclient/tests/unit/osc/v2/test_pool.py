@@ -16,6 +16,7 @@ from unittest import mock
 
 from osc_lib import exceptions
 
+from octaviaclient.api import exceptions as octavia_exc
 from octaviaclient.osc.v2 import constants
 from octaviaclient.osc.v2 import pool as pool
 from octaviaclient.tests.unit.osc.v2 import constants as attr_consts
@@ -54,7 +55,8 @@ class TestPoolList(TestPool):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.pool_list.assert_called_with()
+        self.api_mock.pool_list.assert_called_with(
+            fields=list(self.columns))
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -68,7 +70,8 @@ class TestPoolList(TestPool):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.pool_list.assert_called_with(**expected_attrs)
+        self.api_mock.pool_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -82,7 +85,8 @@ class TestPoolList(TestPool):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.pool_list.assert_called_with(**expected_attrs)
+        self.api_mock.pool_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -96,7 +100,8 @@ class TestPoolList(TestPool):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.pool_list.assert_called_with(**expected_attrs)
+        self.api_mock.pool_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -110,7 +115,8 @@ class TestPoolList(TestPool):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.api_mock.pool_list.assert_called_with(**expected_attrs)
+        self.api_mock.pool_list.assert_called_with(
+            fields=list(self.columns), **expected_attrs)
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
@@ -148,6 +154,7 @@ class TestPoolDelete(TestPool):
             manager=mock.ANY,
             res_id=self._po.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_listener_delete_failure(self):
@@ -259,6 +266,7 @@ class TestPoolCreate(TestPool):
             status_f=mock.ANY,
             res_id='mock_lb_id',
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
 
@@ -338,8 +346,41 @@ class TestPoolSet(TestPool):
             status_f=mock.ANY,
             res_id=self._po.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
+    @mock.patch('octaviaclient.osc.v2.utils.wait_for_active')
+    def test_pool_set_wait_options(self, mock_wait):
+        arglist = [self._po.id, '--name', 'new_name', '--wait',
+                   '--wait-timeout', '60', '--poll-interval', '1.5']
+        verifylist = [
+            ('pool', self._po.id),
+            ('wait', True),
+            ('wait_timeout', 60),
+            ('poll_interval', 1.5),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+        mock_wait.assert_called_once_with(
+            status_f=mock.ANY,
+            res_id=self._po.id,
+            timeout=60,
+            poll_interval=1.5)
+
+    def test_pool_set_wait_timeout(self):
+        self.api_mock.pool_show.return_value = {
+            'provisioning_status': 'PENDING_UPDATE'}
+        arglist = [self._po.id, '--name', 'new_name', '--wait',
+                   '--wait-timeout', '0']
+        verifylist = [
+            ('pool', self._po.id),
+            ('wait_timeout', 0),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.assertRaises(octavia_exc.OctaviaClientException,
+                          self.cmd.take_action, parsed_args)
+        self.api_mock.pool_show.assert_called_once_with(self._po.id)
+
     def test_pool_set_tag(self):
         self.api_mock.pool_show.return_value = {
             'tags': ['foo']
@@ -449,6 +490,7 @@ class TestPoolUnset(TestPool):
             status_f=mock.ANY,
             res_id=self._po.id,
             sleep_time=mock.ANY,
+            callback=mock.ANY,
             status_field='provisioning_status')
 
     def test_pool_unset_all(self):
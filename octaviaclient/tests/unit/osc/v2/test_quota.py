@@ -57,6 +57,16 @@ class TestQuotaList(TestQuota):
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist, tuple(data))
 
+    def test_quota_list_limit(self):
+        arglist = ['--limit', '1', '--sort', 'project_id:asc']
+        verifylist = [('limit', 1), ('sort', 'project_id:asc')]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        self.api_mock.quota_list.assert_called_with(limit=1,
+                                                    sort='project_id:asc')
+
 
 class TestQuotaShow(TestQuota):
 
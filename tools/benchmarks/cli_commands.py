@@ -0,0 +1,364 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""Measure the list and show commands against large deployments
+
+Runs every Lister and ShowOne command of the load balancer tree and of the
+amphorae against the fake Octavia API server of the unit tests, populated
+with 1k, 10k and 100k objects of the type the command works on. Each run
+happens in a fresh interpreter and reports:
+
+* ``wall``: seconds from the API calls to the output written
+* ``fetch``: seconds spent in take_action, i.e. the API calls
+* ``format``: seconds spent formatting and writing the output
+* ``calls``, ``pages`` and ``bytes``: the HTTP requests sent, the listing
+  pages among them and the bytes received
+* ``peak_rss_kb`` and ``rss_delta_kb``: the peak resident memory of the
+  interpreter and its growth during the command
+
+The results are written as JSON with ``--output`` and compared with a
+previous run, e.g. of the last release, with ``--compare``.
+
+Usage::
+
+    tox -e venv -- python tools/benchmarks/cli_commands.py
+        [--scales 1000,10000,100000] [--repeat 3] [--format table]
+        [--latency 0] [--command member] [--output FILE] [--compare FILE]
+"""
+import argparse
+import configparser
+import datetime
+import importlib
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import textwrap
+import time
+import types
+
+from cliff import lister
+from cliff import show
+from keystoneauth1 import session
+
+import octaviaclient
+from octaviaclient.api.v2 import octavia
+from octaviaclient.api.v2 import profile
+from octaviaclient.tests import fake_octavia
+
+SETUP_CFG = os.path.join(os.path.dirname(__file__), '..', '..', 'setup.cfg')
+
+# Dataset of each resource type, holding ``scale`` objects of that type
+DATASETS = {
+    'loadbalancer': lambda scale: dict(load_balancers=scale, listeners=0,
+                                       pools=0),
+    'listener': lambda scale: dict(listeners=scale, pools=0),
+    'pool': lambda scale: dict(listeners=0, pools=scale),
+    'member': lambda scale: dict(members=scale),
+    'healthmonitor': lambda scale: dict(listeners=0, pools=scale,
+                                        health_monitors=True),
+    'l7policy': lambda scale: dict(pools=0, l7policies=scale),
+    'l7rule': lambda scale: dict(pools=0, l7policies=1, l7rules=scale),
+    'amphora': lambda scale: dict(load_balancers=scale // 2, listeners=0,
+                                  pools=0, amphorae=2),
+}
+
+# Dataset and arguments of each command, the placeholders are replaced with
+# the ID of the first resource of each type
+BENCHMARKS = [
+    ('loadbalancer_list', 'loadbalancer', ''),
+    ('loadbalancer_list', 'loadbalancer', '--stream'),
+    ('loadbalancer_list', 'loadbalancer', '--count'),
+    ('loadbalancer_list', 'loadbalancer',
+     '--group-by provisioning_status'),
+    ('loadbalancer_show', 'loadbalancer', '{loadbalancer}'),
+    ('loadbalancer_stats_show', 'loadbalancer', '{loadbalancer}'),
+    ('loadbalancer_create', 'loadbalancer', '--vip-subnet-id subnet'),
+    ('loadbalancer_create', 'loadbalancer', '--vip-subnet-id subnet --wait'),
+    ('loadbalancer_listener_list', 'listener', ''),
+    ('loadbalancer_listener_list', 'listener',
+     '--loadbalancer {loadbalancer}'),
+    ('loadbalancer_listener_show', 'listener', '{listener}'),
+    ('loadbalancer_listener_stats_show', 'listener', '{listener}'),
+    ('loadbalancer_listener_create', 'listener',
+     '{loadbalancer} --protocol TCP --protocol-port 8080 --wait'),
+    ('loadbalancer_pool_list', 'pool', ''),
+    ('loadbalancer_pool_list', 'pool', '--loadbalancer {loadbalancer}'),
+    ('loadbalancer_pool_show', 'pool', '{pool}'),
+    ('loadbalancer_pool_create', 'pool',
+     '--loadbalancer {loadbalancer} --protocol TCP '
+     '--lb-algorithm ROUND_ROBIN --wait'),
+    ('loadbalancer_member_list', 'member', '{pool}'),
+    ('loadbalancer_member_list', 'member', '{pool} --stream'),
+    ('loadbalancer_member_list', 'member', '{pool} --count'),
+    ('loadbalancer_member_show', 'member', '{pool} {member}'),
+    ('loadbalancer_member_create', 'member',
+     '{pool} --address 192.0.2.10 --protocol-port 8080'),
+    ('loadbalancer_member_create', 'member',
+     '{pool} --address 192.0.2.11 --protocol-port 8080 --wait'),
+    ('loadbalancer_healthmonitor_create', 'pool',
+     '{pool} --delay 5 --timeout 5 --max-retries 3 --type PING --wait'),
+    ('loadbalancer_healthmonitor_list', 'healthmonitor', ''),
+    ('loadbalancer_healthmonitor_show', 'healthmonitor', '{healthmonitor}'),
+    ('loadbalancer_l7policy_list', 'l7policy', ''),
+    ('loadbalancer_l7policy_list', 'l7policy', '--listener {listener}'),
+    ('loadbalancer_l7policy_show', 'l7policy', '{l7policy}'),
+    ('loadbalancer_l7policy_create', 'l7policy',
+     '{listener} --action REJECT --wait'),
+    ('loadbalancer_l7rule_list', 'l7rule', '{l7policy}'),
+    ('loadbalancer_l7rule_show', 'l7rule', '{l7policy} {l7rule}'),
+    ('loadbalancer_l7rule_create', 'l7rule',
+     '{l7policy} --compare-type EQUAL_TO --value /x --type PATH --wait'),
+    ('loadbalancer_amphora_list', 'amphora', ''),
+    ('loadbalancer_amphora_list', 'amphora', '--long'),
+    ('loadbalancer_amphora_list', 'amphora', '--long --stream'),
+    ('loadbalancer_amphora_list', 'amphora', '--group-by status'),
+    ('loadbalancer_amphora_list', 'amphora',
+     '--loadbalancer {loadbalancer}'),
+    ('loadbalancer_amphora_show', 'amphora', '{amphora}'),
+    ('loadbalancer_amphora_stats_show', 'amphora', '{amphora}'),
+]
+
+
+def commands():
+    """Returns the Lister and ShowOne commands by entry point name"""
+    parser = configparser.ConfigParser()
+    parser.read(SETUP_CFG)
+    found = {}
+    for line in parser['entry_points'][
+            'openstack.load_balancer.v2'].strip().splitlines():
+        name, target = (part.strip() for part in line.split('='))
+        module, cls = target.split(':')
+        command = getattr(importlib.import_module(module), cls)
+        if issubclass(command, (lister.Lister, show.ShowOne)):
+            found[name] = target
+    return found
+
+
+def first_ids(api):
+    """Returns the ID of the first resource of each type"""
+    ids = {}
+    for prefix, key in (('load_balancer', 'loadbalancer'),
+                        ('listener', 'listener'), ('pool', 'pool'),
+                        ('health_monitor', 'healthmonitor'),
+                        ('l7policy', 'l7policy'), ('amphora', 'amphora')):
+        listing = getattr(api, prefix + '_list')()
+        resources = next(value for name, value in listing.items()
+                         if not name.endswith('_links'))
+        if resources:
+            ids[key] = resources[0]['id']
+    if 'pool' in ids:
+        members = api.member_list(ids['pool'])['members']
+        ids['member'] = members[0]['id'] if members else None
+    if 'l7policy' in ids:
+        rules = api.l7rule_list(ids['l7policy'])['rules']
+        ids['l7rule'] = rules[0]['id'] if rules else None
+    return ids
+
+
+class _Network(object):
+    """Resolves any network, subnet or port name or ID to itself"""
+
+    def __getattr__(self, name):
+        def list_funct(**kwargs):
+            values = kwargs.get('id') or kwargs.get('name') or []
+            if not isinstance(values, list):
+                values = [values]
+            return [{'id': value, 'name': value} for value in values]
+        return list_funct
+
+
+def _maxrss_kb():
+    # ru_maxrss survives exec on Linux and would include the memory of the
+    # server process, the high-water mark of /proc is the interpreter's own
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return maxrss // 1024 if sys.platform == 'darwin' else maxrss
+
+
+def _label(name, template):
+    """Returns the command with its flags and the options taking an ID"""
+    args = template.split() + ['--']
+    return ' '.join([name.replace('_', ' ')] + [
+        arg for arg, value in zip(args, args[1:])
+        if arg.startswith('--') and value[0] in '-{'])
+
+
+def run_command(endpoint, name, target, arglist, fmt, repeat):
+    """Runs a command, in the interpreter of a child process
+
+    :return:
+        A dict of the measurements, the times are the best of ``repeat``
+        runs
+    """
+    module, cls = target.split(':')
+    command = getattr(importlib.import_module(module), cls)
+    profiler = profile.Profiler()
+    api = octavia.OctaviaAPI(session=session.Session(), endpoint=endpoint,
+                             profiler=profiler)
+    client_manager = types.SimpleNamespace(
+        load_balancer=api, identity=None,
+        sdk_connection=types.SimpleNamespace(network=_Network()))
+    with open(os.devnull, 'w') as devnull:
+        app = types.SimpleNamespace(client_manager=client_manager,
+                                    stdout=devnull, stderr=devnull)
+        cmd = command(app, None)
+        parsed_args = cmd.get_parser(name).parse_args(arglist +
+                                                      ['-f', fmt])
+        cmd.formatter = cmd._formatter_plugins[parsed_args.formatter].obj
+        rss_before = _maxrss_kb()
+        timings = []
+        for _ in range(repeat):
+            del profiler.requests[:]
+            start = time.perf_counter()
+            columns, data = cmd.take_action(parsed_args)
+            fetched = time.perf_counter()
+            cmd.produce_output(parsed_args, columns, data)
+            timings.append((time.perf_counter() - start, fetched - start))
+    wall, fetch = min(timings)
+    summary = profiler.summary()[-1]
+    return {'wall': wall, 'fetch': fetch, 'format': wall - fetch,
+            'calls': summary['calls'], 'pages': summary['pages'],
+            'bytes': summary['bytes'], 'peak_rss_kb': _maxrss_kb(),
+            'rss_delta_kb': _maxrss_kb() - rss_before}
+
+
+def _child(queue, *args):
+    try:
+        queue.put(run_command(*args))
+    except Exception as e:
+        queue.put({'error': '{}: {}'.format(type(e).__name__, e)})
+
+
+def measure(context, *args):
+    """Runs run_command in a fresh interpreter"""
+    queue = context.Queue()
+    process = context.Process(target=_child, args=(queue,) + args)
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def compare(results, baseline):
+    """Prints the change of each measurement from a previous run"""
+    previous = {(r['command'], r['args'], r['scale']): r
+                for r in baseline['results']}
+    print('Compared with octaviaclient {}:'.format(baseline['octaviaclient']))
+    print('{:<45} {:>7} {:>8} {:>8} {:>6}'.format(
+        'command', 'scale', 'wall', 'rss', 'calls'))
+    for result in results:
+        old = previous.get((result['command'], result['args'],
+                            result['scale']))
+        if old is None or 'error' in result or 'error' in old:
+            continue
+        print('{:<45} {:>7} {:>+8.1%} {:>+8.1%} {:>+6}'.format(
+            result['label'], result['scale'],
+            result['wall'] / old['wall'] - 1,
+            result['peak_rss_kb'] / old['peak_rss_kb'] - 1,
+            result['calls'] - old['calls']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', default='1000,10000,100000',
+                        help='Comma separated numbers of objects')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs of each command, the best is kept')
+    parser.add_argument('--format', default='table',
+                        help='Output format of the commands')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Seconds the server takes to answer a request')
+    parser.add_argument('--max-page-size', type=int,
+                        default=fake_octavia.DEFAULT_MAX_PAGE_SIZE,
+                        help='Largest page the server returns')
+    parser.add_argument('--command', action='append', default=[],
+                        help='Only run the commands containing this string')
+    parser.add_argument('--output', help='Write the results to this file')
+    parser.add_argument('--compare',
+                        help='Compare with the results in this file')
+    args = parser.parse_args()
+
+    available = commands()
+    benchmarks = [b for b in BENCHMARKS if not args.command or
+                  any(c in b[0] for c in args.command)]
+    context = multiprocessing.get_context('spawn')
+    results = []
+    print('{:<45} {:>7} {:>8} {:>8} {:>8} {:>6} {:>6} {:>9}'.format(
+        'command', 'scale', 'wall s', 'fetch s', 'format s', 'calls',
+        'pages', 'rss MiB'))
+    for scale in (int(scale) for scale in args.scales.split(',')):
+        for dataset in DATASETS:
+            selected = [b for b in benchmarks if b[1] == dataset]
+            if not selected:
+                continue
+            with fake_octavia.FakeOctavia(
+                    latency=args.latency,
+                    max_page_size=args.max_page_size, seed=0) as server:
+                server.populate(**DATASETS[dataset](scale))
+                ids = first_ids(octavia.OctaviaAPI(
+                    session=session.Session(), endpoint=server.endpoint))
+                for name, _, template in selected:
+                    label = _label(name, template)
+                    result = measure(context, server.endpoint, name,
+                                     available[name],
+                                     template.format(**ids).split(),
+                                     args.format, args.repeat)
+                    result.update(command=name, args=template, scale=scale,
+                                  label=label)
+                    results.append(result)
+                    if 'error' in result:
+                        print('{:<45} {:>7} {}'.format(label, scale,
+                                                       result['error']))
+                        continue
+                    print('{:<45} {:>7} {:>8.3f} {:>8.3f} {:>8.3f} {:>6} '
+                          '{:>6} {:>9.1f}'.format(
+                              label, scale, result['wall'], result['fetch'],
+                              result['format'], result['calls'],
+                              result['pages'], result['peak_rss_kb'] / 1024))
+
+    benchmarked = {b[0] for b in BENCHMARKS}
+    skipped = sorted(set(available) - benchmarked)
+    if skipped:
+        print(textwrap.fill('Not served by the fake API: {}'.format(
+            ', '.join(skipped)), subsequent_indent='    '))
+
+    report = {
+        'octaviaclient': octaviaclient.__version__,
+        'python': platform.python_version(),
+        'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'format': args.format,
+        'repeat': args.repeat,
+        'latency': args.latency,
+        'max_page_size': args.max_page_size,
+        'results': results,
+        'skipped': skipped,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
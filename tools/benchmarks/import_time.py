@@ -0,0 +1,58 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""Measure the import time of the plugin and of the commands
+
+Imports the plugin and every command module on top of the modules the
+openstack shell has already loaded, with ``python -X importtime``, and
+reports the best total of ``--repeat`` runs and the slowest modules. The
+unit tests only check the number of modules loaded, the timings of shared
+test machines vary too widely to be asserted on. They took 10 to 40ms at
+the time of writing, ``--budget`` exits with an error above a budget.
+
+Usage::
+
+    tox -e venv -- python tools/benchmarks/import_time.py
+        [--repeat 3] [--top 10] [--budget 150]
+"""
+import argparse
+import sys
+
+from octaviaclient.tests.unit.osc import test_import_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Number of imports, the best time is reported')
+    parser.add_argument('--top', type=int, default=10,
+                        help='Number of the slowest modules listed')
+    parser.add_argument('--budget', type=float,
+                        help='Maximum import time in milliseconds')
+    args = parser.parse_args()
+
+    runs = [test_import_time.import_times(test_import_time.MODULES)
+            for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: sum(times.values()))
+    total_ms = sum(best.values()) / 1000
+
+    print('{} modules, {:.1f} ms'.format(len(best), total_ms))
+    for name, self_us in sorted(best.items(), key=lambda item: -item[1])[
+            :args.top]:
+        print('{:>8.1f} ms  {}'.format(self_us / 1000, name))
+    if args.budget is not None and total_ms > args.budget:
+        print('over the budget of {} ms'.format(args.budget))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
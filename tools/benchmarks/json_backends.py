@@ -0,0 +1,107 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""Compare the JSON backends on Octavia payloads
+
+Decodes a load balancer listing with every installed backend. The listing
+is either a response body recorded from an Octavia API (``--payload``,
+e.g. saved with ``curl -H "X-Auth-Token: $TOKEN" $OCTAVIA/v2/lbaas/
+loadbalancers``) or built from a sample load balancer repeated
+``--count`` times.
+
+Usage::
+
+    tox -e venv -- python tools/benchmarks/json_backends.py
+        [--count 20000] [--payload FILE] [--repeat 5]
+"""
+import argparse
+import json
+import timeit
+import uuid
+
+from octaviaclient.api import json_backend
+
+# Example GET /v2/lbaas/loadbalancers/<id> response of the API reference
+LOADBALANCER = {
+    "description": "",
+    "admin_state_up": True,
+    "project_id": "e3cd678b11784734bc366148aa37580e",
+    "provisioning_status": "ACTIVE",
+    "flavor_id": None,
+    "vip_subnet_id": "d4af86e1-0051-488c-b7a0-527f97490c9a",
+    "listeners": [{"id": "023f2e34-7806-443b-bfae-16c324569a3d"}],
+    "vip_address": "203.0.113.50",
+    "vip_network_id": "d0d217df-3958-4fbf-a3c2-8dad2908c709",
+    "vip_port_id": "b4ca07d1-a31e-43e2-891a-7d14f419f342",
+    "additional_vips": [],
+    "provider": "amphora",
+    "pools": [{"id": "9aa16cc7-fa0c-4f4b-b38b-2a1b2a94a10a"}],
+    "created_at": "2017-02-28T00:41:44",
+    "updated_at": "2017-02-28T00:43:30",
+    "id": "607226db-27ef-4d41-ae89-f2a800e9c2db",
+    "operating_status": "ONLINE",
+    "name": "best_load_balancer",
+    "vip_qos_policy_id": "ec4f78ca-8da8-4e99-8a1a-e3b94595a7a3",
+    "availability_zone": "my_az",
+    "tags": ["test_tag"],
+    "vip_vnic_type": "normal",
+}
+
+
+def make_payload(count):
+    lbs = []
+    for i in range(count):
+        lb = dict(LOADBALANCER, id=str(uuid.uuid4()),
+                  name='lb-{}'.format(i))
+        lbs.append(lb)
+    return json.dumps({'loadbalancers': lbs,
+                       'loadbalancers_links': []}).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000,
+                        help='Number of load balancers in the listing')
+    parser.add_argument('--payload',
+                        help='File holding a recorded response body')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of decodes per backend, the best '
+                             'time is reported')
+    args = parser.parse_args()
+
+    if args.payload:
+        with open(args.payload, 'rb') as f:
+            body = f.read()
+    else:
+        body = make_payload(args.count)
+    expected = json.loads(body)
+
+    print('payload: {} bytes'.format(len(body)))
+    times = {}
+    for name in json_backend.BACKENDS:
+        if name not in json_backend.available():
+            print('{:<8} not installed'.format(name))
+            continue
+        loads = json_backend.get_loads(name)
+        if loads(body) != expected:
+            print('{:<8} decodes to a different document'.format(name))
+            continue
+        times[name] = min(timeit.repeat(lambda: loads(body), number=1,
+                                        repeat=args.repeat))
+    print('{:<8} {:>10} {:>9}'.format('backend', 'decode ms', 'speedup'))
+    for name, best in times.items():
+        print('{:<8} {:>10.1f} {:>8.1f}x'.format(
+            name, best * 1000, times['json'] / best))
+
+
+if __name__ == '__main__':
+    main()
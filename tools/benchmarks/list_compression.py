@@ -0,0 +1,130 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+"""Measure the transfer saved by compressed list responses
+
+Serves a synthetic pool of members from a local HTTP server, lists it with
+OctaviaAPI.member_list with ``Accept-Encoding: identity`` and with the
+``Accept-Encoding`` requests sends by default (``gzip, deflate``), and
+reports the bytes sent on the wire, along with the time the transfer would
+take on a slow link.
+
+Usage::
+
+    tox -e venv -- python tools/benchmarks/list_compression.py
+        [--members 50000] [--link-mbps 10]
+"""
+import argparse
+import gzip
+from http import server
+import json
+import threading
+import time
+import uuid
+
+from keystoneauth1 import session
+
+from octaviaclient.api.v2 import octavia
+
+POOL_ID = str(uuid.uuid4())
+
+
+def make_members(count):
+    project_id = uuid.uuid4().hex
+    return [{
+        'id': str(uuid.uuid4()),
+        'name': 'member-{}'.format(i),
+        'project_id': project_id,
+        'provisioning_status': 'ACTIVE',
+        'operating_status': 'ONLINE',
+        'admin_state_up': True,
+        'address': '10.{}.{}.{}'.format(i >> 16, (i >> 8) & 255, i & 255),
+        'protocol_port': 80,
+        'weight': 1,
+        'backup': False,
+        'subnet_id': None,
+        'monitor_address': None,
+        'monitor_port': None,
+        'tags': [],
+        'created_at': '2024-01-01T00:00:00',
+        'updated_at': '2024-01-01T00:00:00',
+    } for i in range(count)]
+
+
+class Handler(server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    body = b''
+    gzip_body = b''
+    sent = 0
+
+    def do_GET(self):
+        body = self.body
+        self.send_response(200)
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = self.gzip_body
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        Handler.sent += len(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def run(api, accept_encoding):
+    api.JSON_HEADER = dict(octavia.OctaviaAPI.JSON_HEADER)
+    if accept_encoding:
+        api.JSON_HEADER['Accept-Encoding'] = accept_encoding
+    Handler.sent = 0
+    start = time.perf_counter()
+    members = api.member_list(POOL_ID)['members']
+    return len(members), Handler.sent, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--members', type=int, default=50000,
+                        help='Number of members in the pool')
+    parser.add_argument('--link-mbps', type=float, default=10,
+                        help='Bandwidth of the simulated slow link')
+    args = parser.parse_args()
+
+    Handler.body = json.dumps({'members': make_members(args.members),
+                               'members_links': []}).encode()
+    Handler.gzip_body = gzip.compress(Handler.body)
+    httpd = server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    api = octavia.OctaviaAPI(
+        session=session.Session(),
+        endpoint='http://127.0.0.1:{}'.format(httpd.server_port))
+
+    print('{:<10} {:>8} {:>14} {:>10} {:>16}'.format(
+        'encoding', 'members', 'bytes on wire', 'local s',
+        '{:g} Mbit/s s'.format(args.link_mbps)))
+    results = {}
+    for encoding in ('identity', None):
+        count, sent, elapsed = run(api, encoding)
+        results[encoding] = sent
+        print('{:<10} {:>8} {:>14} {:>10.3f} {:>16.2f}'.format(
+            encoding or 'default', count, sent, elapsed,
+            sent * 8 / (args.link_mbps * 1e6)))
+    httpd.shutdown()
+
+    saved = results['identity'] - results[None]
+    print('gzip saves {} bytes ({:.1%} of the uncompressed response)'.format(
+        saved, saved / results['identity']))
+
+
+if __name__ == '__main__':
+    main()